@@ -0,0 +1,11 @@
+from accounts.counters import get_user_counters
+
+
+def user_counters(request):
+    counters = get_user_counters(request.user)
+
+    return {
+        "cart_count": counters["cart"],
+        "favorite_count": counters["favorites"],
+        "user_orders_count": counters["orders"],
+    }
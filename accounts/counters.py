@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+from carts.models import CartItem
+from favorites.models import Favorite
+from orders.models import Order
+
+COUNTER_NAMES = ("cart", "favorites", "orders")
+COUNTERS_TIMEOUT = 60 * 60 * 24
+EMPTY_COUNTERS = {name: 0 for name in COUNTER_NAMES}
+
+
+def counter_key(user_id, name):
+    return f"user_counters_{user_id}_{name}"
+
+
+def count_from_db(user_id, name):
+    if name == "cart":
+        total = CartItem.objects.filter(user_id=user_id).aggregate(
+            total=Sum("quantity")
+        )["total"]
+        return total or 0
+    if name == "favorites":
+        return Favorite.objects.filter(user_id=user_id).count()
+    return Order.objects.filter(user_id=user_id).count()
+
+
+def get_user_counters(user):
+    if not user.is_authenticated:
+        return dict(EMPTY_COUNTERS)
+
+    counters = getattr(user, "_counters", None)
+    if counters is None:
+        keys = {counter_key(user.id, name): name for name in COUNTER_NAMES}
+        counters = {keys[key]: value for key, value in cache.get_many(keys).items()}
+        for key, name in keys.items():
+            if name not in counters:
+                counters[name] = count_from_db(user.id, name)
+                cache.add(key, counters[name], COUNTERS_TIMEOUT)
+        user._counters = counters
+
+    return counters
+
+
+def change_user_counter(user_id, name, delta):
+    if not user_id or not delta:
+        return
+
+    def apply():
+        try:
+            cache.incr(counter_key(user_id, name), delta)
+        except ValueError:
+            pass
+
+    transaction.on_commit(apply)
+
+
+def reset_user_counter(user_id, name):
+    if user_id:
+        transaction.on_commit(lambda: cache.delete(counter_key(user_id, name)))
@@ -10,8 +10,11 @@ class CustomUser(AbstractUser):
     def __str__(self):
         return self.username
 
+    def get_cart_summary(self):
+        return self.cart_items.summary()
+
     def get_cart_total_price(self):
-        return sum(item.get_total_price() for item in self.cart_items.all())
+        return self.get_cart_summary()["total_price"]
 
     def get_cart_total_quantity(self):
-        return sum(item.quantity for item in self.cart_items.all())
+        return self.get_cart_summary()["total_quantity"]
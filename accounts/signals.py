@@ -0,0 +1,51 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from accounts.counters import change_user_counter, reset_user_counter
+from carts.models import CartItem
+from favorites.models import Favorite
+from orders.models import Order
+
+
+@receiver(post_init, sender=CartItem)
+def remember_loaded_quantity(sender, instance, **kwargs):
+    instance._counted_quantity = instance.__dict__.get("quantity")
+
+
+@receiver(post_save, sender=CartItem)
+def count_cart_item(sender, instance, created, **kwargs):
+    if created:
+        change_user_counter(instance.user_id, "cart", instance.quantity)
+    elif instance._counted_quantity is None:
+        reset_user_counter(instance.user_id, "cart")
+    else:
+        change_user_counter(
+            instance.user_id, "cart", instance.quantity - instance._counted_quantity
+        )
+    instance._counted_quantity = instance.quantity
+
+
+@receiver(post_delete, sender=CartItem)
+def uncount_cart_item(sender, instance, **kwargs):
+    change_user_counter(instance.user_id, "cart", -instance.quantity)
+
+
+@receiver(post_save, sender=Favorite)
+def count_favorite(sender, instance, created, **kwargs):
+    if created:
+        change_user_counter(instance.user_id, "favorites", 1)
+
+
+@receiver(post_delete, sender=Favorite)
+def uncount_favorite(sender, instance, **kwargs):
+    change_user_counter(instance.user_id, "favorites", -1)
+
+
+@receiver(post_save, sender=Order)
+def count_order(sender, instance, created, **kwargs):
+    if created:
+        change_user_counter(instance.user_id, "orders", 1)
+
+
+@receiver(post_delete, sender=Order)
+def uncount_order(sender, instance, **kwargs):
+    change_user_counter(instance.user_id, "orders", -1)
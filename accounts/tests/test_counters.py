@@ -0,0 +1,118 @@
+import json
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.counters import counter_key, get_user_counters
+from carts.models import CartItem
+from favorites.models import Favorite
+from orders.models import Order
+from orders.services import create_order_from_cart
+from orders.tests.test_services import make_form
+from techshop.tests.create_objects_for_tests import (
+    create_user,
+    create_brand,
+    create_category,
+    create_product,
+)
+
+
+def cached_counters(user):
+    user = type(user).objects.get(pk=user.pk)
+    return get_user_counters(user)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_counters_follow_cart_favorites_and_orders():
+    user = create_user()
+    brand = create_brand()
+    category = create_category()
+    product = create_product(brand=brand, category=category)
+    other = create_product(brand=brand, category=category, name="Other", slug="other")
+
+    assert cached_counters(user) == {"cart": 0, "favorites": 0, "orders": 0}
+
+    item = CartItem.objects.create(user=user, product=product, quantity=2)
+    CartItem.objects.create(user=user, product=other)
+    assert cached_counters(user)["cart"] == 3
+
+    item.quantity = 5
+    item.save()
+    assert cached_counters(user)["cart"] == 6
+
+    item.delete()
+    assert cached_counters(user)["cart"] == 1
+
+    favorite = Favorite.objects.create(user=user, product=product)
+    assert cached_counters(user)["favorites"] == 1
+    favorite.delete()
+    assert cached_counters(user)["favorites"] == 0
+
+    create_order_from_cart(user, make_form())
+    assert cached_counters(user) == {"cart": 0, "favorites": 0, "orders": 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deferred_quantity_save_resets_cart_counter():
+    user = create_user()
+    product = create_product(brand=create_brand(), category=create_category())
+    CartItem.objects.create(user=user, product=product)
+    assert cached_counters(user)["cart"] == 1
+
+    item = CartItem.objects.only("id", "user_id").get(user=user)
+    item.quantity = 4
+    item.save()
+
+    assert cache.get(counter_key(user.id, "cart")) is None
+    assert cached_counters(user)["cart"] == 4
+
+
+@pytest.mark.django_db
+def test_cached_page_view_runs_no_counting_queries(client):
+    user = create_user()
+    product = create_product(brand=create_brand(), category=create_category())
+    CartItem.objects.create(user=user, product=product, quantity=2)
+    Favorite.objects.create(user=user, product=product)
+    client.force_login(user)
+    client.get(reverse("favorites:list"))
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("favorites:list"))
+
+    assert response.context["cart_count"] == 2
+    assert response.context["favorite_count"] == 1
+    assert response.context["user_orders_count"] == 0
+    assert not [
+        query["sql"]
+        for query in queries
+        if "COUNT(" in query["sql"] or "SUM(" in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_counters_view(client):
+    user = create_user()
+    product = create_product(brand=create_brand(), category=create_category())
+    CartItem.objects.create(user=user, product=product, quantity=3)
+    Favorite.objects.create(user=user, product=product)
+    Order.objects.create(
+        user=user,
+        full_name="Иван Иванов",
+        email="ivan@example.com",
+        phone="+375291234567",
+        address="ул. Тестовая, 1, Минск",
+    )
+    client.force_login(user)
+
+    response = client.get(reverse("accounts:counters"))
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"cart": 3, "favorites": 1, "orders": 1}
+
+
+@pytest.mark.django_db
+def test_counters_view_unauthenticated_user(client):
+    response = client.get(reverse("accounts:counters"))
+
+    assert response.status_code == 302
@@ -8,6 +8,7 @@ urlpatterns = [
     path("login/", login_view, name="login"),
     path("register/", register_view, name="register"),
     path("logout/", logout_view, name="logout"),
+    path("counters/", views.user_counters_view, name="counters"),
     path(
         "password-reset/",
         views.CustomPasswordResetView.as_view(
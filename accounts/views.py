@@ -1,8 +1,10 @@
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.views import PasswordResetView, PasswordResetConfirmView, PasswordResetDoneView, PasswordResetCompleteView
 from django.contrib.auth import login, logout
+from django.http import JsonResponse
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
+from .counters import get_user_counters
 from .forms import CustomAuthenticationForm, CustomUserCreationForm, CustomPasswordResetForm, CustomPasswordConfirmFrom
 
 
@@ -58,4 +60,9 @@ class CustomPasswordResetConfirmView(PasswordResetConfirmView):
     success_url = reverse_lazy("accounts:password_reset_complete")
 
 class CustomPasswordResetCompleteView(PasswordResetCompleteView):
-    template_name = "accounts/reset_pwd/password_reset_complete.html"
\ No newline at end of file
+    template_name = "accounts/reset_pwd/password_reset_complete.html"
+
+
+@login_required
+def user_counters_view(request):
+    return JsonResponse(get_user_counters(request.user))
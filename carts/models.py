@@ -1,13 +1,37 @@
+from decimal import Decimal
 from django.db import models
+from django.db.models import F, Sum
 from django.conf import settings
 from store.models import Product
 
+
+class CartItemQuerySet(models.QuerySet):
+    def summary(self):
+        totals = self.aggregate(
+            total_quantity=Sum("quantity"),
+            total_price=Sum(
+                F("product__discounted_price") * F("quantity"),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            ),
+        )
+        total_price = totals["total_price"]
+        if total_price is not None:
+            total_price = total_price.quantize(Decimal("0.01"))
+
+        return {
+            "total_price": total_price or 0,
+            "total_quantity": totals["total_quantity"] or 0,
+        }
+
+
 class CartItem(models.Model):
     user = models.ForeignKey(to=settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="cart_items", verbose_name="Пользователь")
     product = models.ForeignKey(to=Product, on_delete=models.CASCADE, verbose_name="Продукт")
     quantity = models.PositiveIntegerField(default=1)
     added_at = models.DateTimeField(auto_now_add=True)
 
+    objects = CartItemQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Товар в корзине"
         verbose_name_plural = "Товары в корзине"
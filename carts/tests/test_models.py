@@ -145,3 +145,38 @@ def test_cart_item_default_quantity():
     cart_item = CartItem.objects.create(user=user, product=product)
 
     assert cart_item.quantity == 1
+
+
+@pytest.mark.django_db
+def test_cart_summary_single_query(django_assert_num_queries):
+    user = CustomUser.objects.create_user(
+        username="testuser", email="test@example.com", password="testpass123"
+    )
+    brand = Brand.objects.create(name="TestBrand", slug="testbrand")
+    category = Category.objects.create(name="TestCategory", slug="testcategory")
+    for i in range(5):
+        product = Product.objects.create(
+            name=f"TestProduct{i}",
+            slug=f"testproduct{i}",
+            brand=brand,
+            price=Decimal("50.00"),
+            discount=10,
+            color="black",
+            category=category,
+        )
+        CartItem.objects.create(user=user, product=product, quantity=2)
+
+    with django_assert_num_queries(1):
+        summary = user.get_cart_summary()
+
+    assert summary["total_quantity"] == 10
+    assert summary["total_price"] == Decimal("450.00")
+
+
+@pytest.mark.django_db
+def test_cart_summary_empty_cart():
+    user = CustomUser.objects.create_user(
+        username="testuser", email="test@example.com", password="testpass123"
+    )
+
+    assert user.get_cart_summary() == {"total_price": 0, "total_quantity": 0}
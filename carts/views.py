@@ -4,18 +4,18 @@ from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
 import json
 from .models import CartItem
+from accounts.counters import get_user_counters
 from store.models import Product
 
 
 @login_required
 def cart_view(request):
     cart_items = request.user.cart_items.select_related("product")
-    total_price = request.user.get_cart_total_price()
-    total_quantity = request.user.get_cart_total_quantity()
+    summary = request.user.get_cart_summary()
     context = {
         "cart_items": cart_items,
-        "total_price": total_price,
-        "total_quantity": total_quantity,
+        "total_price": summary["total_price"],
+        "total_quantity": summary["total_quantity"],
     }
 
     return render(request, "carts/cart.html", context)
@@ -56,15 +56,13 @@ def remove_from_cart(request):
         cart_item = CartItem.objects.get(id=cart_item_id, user=request.user)
         cart_item.delete()
 
-        cart_items = CartItem.objects.filter(user=request.user)
-        total_price = sum(item.get_total_price() for item in cart_items)
-        total_quantity = sum(item.quantity for item in cart_items)
+        summary = request.user.get_cart_summary()
 
         return JsonResponse(
             {
                 "success": True,
-                "total_price": total_price,
-                "total_quantity": total_quantity,
+                "total_price": summary["total_price"],
+                "total_quantity": summary["total_quantity"],
             }
         )
     except CartItem.DoesNotExist:
@@ -76,5 +74,5 @@ def remove_from_cart(request):
 
 @login_required
 def cart_count(request):
-    count = request.user.get_cart_total_quantity()
+    count = get_user_counters(request.user)["cart"]
     return JsonResponse({"count": count})
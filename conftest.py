@@ -0,0 +1,12 @@
+import pytest
+from django.core.cache import cache
+from store.cache import local_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    local_cache.clear()
+    yield
+    cache.clear()
+    local_cache.clear()
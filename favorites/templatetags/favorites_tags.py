@@ -1,11 +1,9 @@
 from django import template
-from favorites.models import Favorite
+from favorites.utils import get_favorite_product_ids
 
 register = template.Library()
 
 
 @register.simple_tag
 def is_favorited(product, user):
-    if not user.is_authenticated:
-        return False
-    return Favorite.objects.filter(user=user, product=product).exists()
+    return product.id in get_favorite_product_ids(user)
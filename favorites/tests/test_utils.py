@@ -0,0 +1,36 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from favorites.models import Favorite
+from favorites.templatetags.favorites_tags import is_favorited
+from favorites.utils import get_favorite_product_ids
+from techshop.tests.create_objects_for_tests import (
+    create_user,
+    create_brand,
+    create_category,
+    create_product,
+)
+
+
+@pytest.mark.django_db
+def test_get_favorite_product_ids_anonymous_user(django_assert_num_queries):
+    with django_assert_num_queries(0):
+        assert get_favorite_product_ids(AnonymousUser()) == set()
+
+
+@pytest.mark.django_db
+def test_get_favorite_product_ids_loads_once(django_assert_num_queries):
+    user = create_user()
+    brand = create_brand()
+    category = create_category()
+    product1 = create_product(
+        brand=brand, category=category, name="TestProduct1", slug="testproduct1"
+    )
+    product2 = create_product(
+        brand=brand, category=category, name="TestProduct2", slug="testproduct2"
+    )
+    Favorite.objects.create(user=user, product=product1)
+
+    with django_assert_num_queries(1):
+        assert get_favorite_product_ids(user) == {product1.id}
+        assert is_favorited(product1, user)
+        assert not is_favorited(product2, user)
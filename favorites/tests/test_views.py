@@ -2,6 +2,8 @@ import pytest
 import json
 from decimal import Decimal
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from favorites.models import Favorite
 from techshop.tests.create_objects_for_tests import (
     create_user,
@@ -305,3 +307,32 @@ def test_favorite_with_deleted_product(client):
     product.delete()
 
     assert not Favorite.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_favorite_list_view_query_count_does_not_grow_with_items(client):
+    user = create_user()
+    brand = create_brand()
+    category = create_category()
+    client.force_login(user)
+    url = reverse("favorites:list")
+
+    def add_favorites(start, stop):
+        for i in range(start, stop):
+            product = create_product(
+                brand=brand, category=category, name=f"Product{i}", slug=f"product{i}"
+            )
+            Favorite.objects.create(user=user, product=product)
+
+    add_favorites(0, 1)
+    client.get(url)
+    with CaptureQueriesContext(connection) as single_item:
+        client.get(url)
+
+    add_favorites(1, 10)
+    with CaptureQueriesContext(connection) as many_items:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert len(response.context["favorites"]) == 10
+    assert len(many_items) == len(single_item)
@@ -0,0 +1,15 @@
+from favorites.models import Favorite
+
+
+def get_favorite_product_ids(user):
+    if not user.is_authenticated:
+        return set()
+
+    product_ids = getattr(user, "_favorite_product_ids", None)
+    if product_ids is None:
+        product_ids = set(
+            Favorite.objects.filter(user=user).values_list("product_id", flat=True)
+        )
+        user._favorite_product_ids = product_ids
+
+    return product_ids
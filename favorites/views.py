@@ -4,12 +4,17 @@ from django.views.decorators.http import require_POST
 from django.shortcuts import render
 import json
 from .models import Favorite
+from accounts.counters import get_user_counters
 from store.models import Product
 
 
 @login_required
 def favorite_list_view(request):
-    favorites = Favorite.objects.select_related("product").filter(user=request.user)
+    favorites = (
+        Favorite.objects.filter(user=request.user)
+        .select_related("product__category", "product__brand")
+        .defer("product__description", "product__search_vector")
+    )
     context = {
         "favorites": favorites,
     }
@@ -44,5 +49,5 @@ def toggle_wishlist(request):
 
 @login_required
 def favorite_count(request):
-    count = Favorite.objects.filter(user=request.user).count()
+    count = get_user_counters(request.user)["favorites"]
     return JsonResponse({"count": count})
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Subscriber
+from .models import NewsletterDelivery, Subscriber
 
 
 @admin.register(Subscriber)
@@ -8,3 +8,33 @@ class SubscriberAdmin(admin.ModelAdmin):
     search_fields = ("email",)
     ordering = ("email",)
     readonly_fields = ("email", "subscribed_at")
+
+
+@admin.register(NewsletterDelivery)
+class NewsletterDeliveryAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "status",
+        "total_recipients",
+        "sent_count",
+        "failed_count",
+        "processed_chunks",
+        "total_chunks",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status", "created_at")
+    search_fields = ("subject",)
+    readonly_fields = (
+        "product",
+        "subject",
+        "status",
+        "total_recipients",
+        "sent_count",
+        "failed_count",
+        "total_chunks",
+        "processed_chunks",
+        "created_at",
+        "finished_at",
+    )
+    exclude = ("html_content",)
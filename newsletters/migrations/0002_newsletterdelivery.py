@@ -0,0 +1,97 @@
+# Generated by Django 5.2.4 on 2026-10-18 20:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("newsletters", "0001_initial"),
+        ("store", "0007_product_rating_sum"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NewsletterDelivery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255, verbose_name="Тема")),
+                ("html_content", models.TextField(verbose_name="Содержимое письма")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("sending", "Отправляется"),
+                            ("completed", "Завершена"),
+                        ],
+                        default="sending",
+                        max_length=10,
+                        verbose_name="Статус",
+                    ),
+                ),
+                (
+                    "total_recipients",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Всего получателей"
+                    ),
+                ),
+                (
+                    "sent_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Отправлено"),
+                ),
+                (
+                    "failed_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Ошибок"),
+                ),
+                (
+                    "total_chunks",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Всего пакетов"
+                    ),
+                ),
+                (
+                    "processed_chunks",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Обработано пакетов"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Дата создания"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Дата завершения"
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="newsletter_deliveries",
+                        to="store.product",
+                        verbose_name="Продукт",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Рассылка",
+                "verbose_name_plural": "Рассылки",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -17,3 +17,48 @@ class Subscriber(models.Model):
     def save(self, *args, **kwargs):
         self.email = self.email.lower()
         super().save(*args, **kwargs)
+
+
+class NewsletterDelivery(models.Model):
+    STATUS_CHOICES = (
+        ("sending", "Отправляется"),
+        ("completed", "Завершена"),
+    )
+
+    product = models.ForeignKey(
+        to="store.Product",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="newsletter_deliveries",
+        verbose_name="Продукт",
+    )
+    subject = models.CharField(max_length=255, verbose_name="Тема")
+    html_content = models.TextField(verbose_name="Содержимое письма")
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default="sending",
+        verbose_name="Статус",
+    )
+    total_recipients = models.PositiveIntegerField(
+        default=0, verbose_name="Всего получателей"
+    )
+    sent_count = models.PositiveIntegerField(default=0, verbose_name="Отправлено")
+    failed_count = models.PositiveIntegerField(default=0, verbose_name="Ошибок")
+    total_chunks = models.PositiveIntegerField(default=0, verbose_name="Всего пакетов")
+    processed_chunks = models.PositiveIntegerField(
+        default=0, verbose_name="Обработано пакетов"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Дата завершения"
+    )
+
+    class Meta:
+        verbose_name = "Рассылка"
+        verbose_name_plural = "Рассылки"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return self.subject
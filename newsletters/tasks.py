@@ -1,11 +1,66 @@
+from smtplib import SMTPException
 from celery import shared_task
-from django.core.mail import EmailMessage, send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db.models import F
 from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils import timezone
 from django.conf import settings
-from newsletters.models import Subscriber
+from newsletters.models import NewsletterDelivery, Subscriber
 from store.models import Product
 
+NEWSLETTER_CHUNK_SIZE = 500
+
+
+def iter_subscriber_chunks(chunk_size):
+    subscriber_ids = (
+        Subscriber.objects.order_by("id")
+        .values_list("id", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+
+    chunk = []
+    for subscriber_id in subscriber_ids:
+        chunk.append(subscriber_id)
+        if len(chunk) == chunk_size:
+            yield chunk[0], chunk[-1], len(chunk)
+            chunk = []
+
+    if chunk:
+        yield chunk[0], chunk[-1], len(chunk)
+
+
+def record_chunk_result(delivery_id, sent, failed, finished=True):
+    NewsletterDelivery.objects.filter(pk=delivery_id).update(
+        sent_count=F("sent_count") + sent,
+        failed_count=F("failed_count") + failed,
+        processed_chunks=F("processed_chunks") + int(finished),
+    )
+    if not finished:
+        return
+    NewsletterDelivery.objects.filter(
+        pk=delivery_id, status="sending", processed_chunks__gte=F("total_chunks")
+    ).update(status="completed", finished_at=timezone.now())
+
+
+def start_newsletter_delivery(subject, html_content, product=None):
+    chunks = list(iter_subscriber_chunks(NEWSLETTER_CHUNK_SIZE))
+    if not chunks:
+        return None
+
+    delivery = NewsletterDelivery.objects.create(
+        product=product,
+        subject=subject,
+        html_content=html_content,
+        total_recipients=sum(size for _, _, size in chunks),
+        total_chunks=len(chunks),
+    )
+
+    for first_id, last_id, _ in chunks:
+        send_newsletter_chunk.delay(delivery.id, first_id, last_id)
+
+    return delivery
+
 
 @shared_task
 def send_new_product_email_task(product_slug):
@@ -14,8 +69,7 @@ def send_new_product_email_task(product_slug):
     except Product.DoesNotExist:
         return
 
-    subscribers = Subscriber.objects.values_list("email", flat=True)
-    if not subscribers:
+    if not Subscriber.objects.exists():
         return
 
     site_url = settings.DOMAIN
@@ -29,15 +83,74 @@ def send_new_product_email_task(product_slug):
         },
     )
 
-    email = EmailMessage(
-        subject=f"🆕 Новый товар: {product.name}",
-        body=html_content,
+    delivery = start_newsletter_delivery(
+        f"🆕 Новый товар: {product.name}", html_content, product=product
+    )
+    return delivery.id if delivery else None
+
+
+@shared_task
+def send_catalog_digest_task(product_ids, total):
+    products = Product.objects.for_cards().filter(id__in=product_ids)
+    if not products or not Subscriber.objects.exists():
+        return
+
+    html_content = render_to_string(
+        "store/emails/new_products_digest.html",
+        {
+            "products": products,
+            "total": total,
+            "site_url": settings.DOMAIN,
+        },
+    )
+
+    delivery = start_newsletter_delivery(
+        f"🆕 Новые товары в каталоге: {total}", html_content
+    )
+    return delivery.id if delivery else None
+
+
+def build_newsletter_message(delivery, email):
+    message = EmailMessage(
+        subject=delivery.subject,
+        body=delivery.html_content,
         from_email=settings.DEFAULT_FROM_EMAIL,
-        to=list(subscribers),
+        to=[email],
     )
+    message.content_subtype = "html"
+    return message
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_newsletter_chunk(self, delivery_id, first_id, last_id, subscriber_ids=None):
+    try:
+        delivery = NewsletterDelivery.objects.get(pk=delivery_id)
+    except NewsletterDelivery.DoesNotExist:
+        return
+
+    subscribers = Subscriber.objects.filter(id__gte=first_id, id__lte=last_id)
+    if subscriber_ids is not None:
+        subscribers = subscribers.filter(id__in=subscriber_ids)
+    recipients = list(subscribers.order_by("id").values_list("id", "email"))
+
+    sent = 0
+    position = 0
+    try:
+        with get_connection() as connection:
+            for _, email in recipients:
+                message = build_newsletter_message(delivery, email)
+                sent += connection.send_messages([message]) or 0
+                position += 1
+    except (SMTPException, OSError) as exc:
+        unsent = [subscriber_id for subscriber_id, _ in recipients[position:]]
+        if unsent and self.request.retries < self.max_retries:
+            record_chunk_result(delivery_id, sent, 0, finished=False)
+            raise self.retry(exc=exc, kwargs={"subscriber_ids": unsent})
+        record_chunk_result(delivery_id, sent, len(recipients) - sent)
+        return
 
-    email.content_subtype = "html"
-    email.send()
+    record_chunk_result(delivery_id, sent, len(recipients) - sent)
+    return sent
 
 
 @shared_task
@@ -2,8 +2,15 @@ import pytest
 from unittest.mock import patch, MagicMock
 from decimal import Decimal
 from django.conf import settings
-from newsletters.models import Subscriber
-from newsletters.tasks import send_subscription_email, send_new_product_email_task
+from smtplib import SMTPException
+from newsletters.models import NewsletterDelivery, Subscriber
+from newsletters.tasks import (
+    iter_subscriber_chunks,
+    send_newsletter_chunk,
+    send_subscription_email,
+    send_new_product_email_task,
+    send_catalog_digest_task,
+)
 from techshop.tests.create_objects_for_tests import (
     create_brand,
     create_category,
@@ -12,6 +19,14 @@ from techshop.tests.create_objects_for_tests import (
 )
 
 
+@pytest.fixture(autouse=True)
+def run_chunks_inline(mocker):
+    return mocker.patch(
+        "newsletters.tasks.send_newsletter_chunk.delay",
+        side_effect=lambda *args: send_newsletter_chunk.apply(args=args),
+    )
+
+
 @pytest.mark.django_db
 def test_send_subscription_email_task():
     email = "test@example.com"
@@ -29,29 +44,33 @@ def test_send_subscription_email_task():
 
 
 @pytest.mark.django_db
-def test_send_new_product_email_task_success():
-    subscriber1 = Subscriber.objects.create(email="user1@example.com")
-    subscriber2 = Subscriber.objects.create(email="user2@example.com")
+def test_send_new_product_email_task_success(mailoutbox):
+    Subscriber.objects.create(email="user1@example.com")
+    Subscriber.objects.create(email="user2@example.com")
 
     brand = create_brand()
     category = create_category()
     product = create_product(brand=brand, category=category)
+    mailoutbox.clear()
 
-    with patch("newsletters.tasks.EmailMessage") as mock_email_message:
-        mock_email_instance = MagicMock()
-        mock_email_message.return_value = mock_email_instance
+    with patch("newsletters.tasks.settings.DOMAIN", "http://localhost:8000"):
+        delivery_id = send_new_product_email_task(product.slug)
 
-        with patch("newsletters.tasks.settings.DOMAIN", "http://localhost:8000"):
-            result = send_new_product_email_task(product.slug)
+    assert len(mailoutbox) == 2
+    assert {tuple(message.to) for message in mailoutbox} == {
+        ("user1@example.com",),
+        ("user2@example.com",),
+    }
+    for message in mailoutbox:
+        assert message.subject == f"🆕 Новый товар: {product.name}"
+        assert message.from_email == settings.DEFAULT_FROM_EMAIL
+        assert message.content_subtype == "html"
 
-            mock_email_message.assert_called_once()
-            call_args = mock_email_message.call_args
-
-            assert call_args[1]["subject"] == f"🆕 Новый товар: {product.name}"
-            assert call_args[1]["from_email"] is settings.DEFAULT_FROM_EMAIL
-            assert set(call_args[1]["to"]) == {"user1@example.com", "user2@example.com"}
-
-            mock_email_instance.send.assert_called_once()
+    delivery = NewsletterDelivery.objects.get(pk=delivery_id)
+    assert delivery.status == "completed"
+    assert delivery.total_recipients == 2
+    assert delivery.sent_count == 2
+    assert delivery.failed_count == 0
 
 
 @pytest.mark.django_db
@@ -75,22 +94,19 @@ def test_send_new_product_email_task_no_subscribers():
 
 
 @pytest.mark.django_db
-def test_send_new_product_email_task_single_subscriber():
+def test_send_new_product_email_task_single_subscriber(mailoutbox):
     subscriber = Subscriber.objects.create(email="user@example.com")
 
     brand = create_brand()
     category = create_category()
     product = create_product(brand=brand, category=category)
+    mailoutbox.clear()
 
-    with patch("newsletters.tasks.EmailMessage") as mock_email_message:
-        mock_email_instance = MagicMock()
-        mock_email_message.return_value = mock_email_instance
-
-        with patch("newsletters.tasks.settings.DOMAIN", "http://localhost:8000"):
-            result = send_new_product_email_task(product.slug)
+    with patch("newsletters.tasks.settings.DOMAIN", "http://localhost:8000"):
+        send_new_product_email_task(product.slug)
 
-            call_args = mock_email_message.call_args
-            assert call_args[1]["to"] == ["user@example.com"]
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == ["user@example.com"]
 
 
 @pytest.mark.django_db
@@ -120,3 +136,144 @@ def test_send_new_product_email_task_email_content():
                     call_args[0][1]["product_url"]
                     == f"http://localhost:8000/detail-product/{product.slug}"
                 )
+
+
+@pytest.mark.django_db
+def test_iter_subscriber_chunks():
+    subscribers = [
+        Subscriber.objects.create(email=f"user{i}@example.com") for i in range(5)
+    ]
+
+    chunks = list(iter_subscriber_chunks(chunk_size=2))
+
+    assert chunks == [
+        (subscribers[0].id, subscribers[1].id, 2),
+        (subscribers[2].id, subscribers[3].id, 2),
+        (subscribers[4].id, subscribers[4].id, 1),
+    ]
+
+
+@pytest.mark.django_db
+def test_send_new_product_email_task_sends_chunks(mailoutbox, run_chunks_inline):
+    for i in range(5):
+        Subscriber.objects.create(email=f"user{i}@example.com")
+
+    brand = create_brand()
+    category = create_category()
+    product = create_product(brand=brand, category=category)
+    mailoutbox.clear()
+    run_chunks_inline.reset_mock()
+
+    with patch("newsletters.tasks.NEWSLETTER_CHUNK_SIZE", 2):
+        delivery_id = send_new_product_email_task(product.slug)
+
+    delivery = NewsletterDelivery.objects.get(pk=delivery_id)
+    assert run_chunks_inline.call_count == 3
+    assert len(mailoutbox) == 5
+    assert delivery.total_chunks == 3
+    assert delivery.processed_chunks == 3
+    assert delivery.sent_count == 5
+    assert delivery.status == "completed"
+
+
+@pytest.mark.django_db
+def test_send_newsletter_chunk_records_failure_after_retries(mailoutbox):
+    subscriber = Subscriber.objects.create(email="user@example.com")
+    delivery = NewsletterDelivery.objects.create(
+        subject="Тема", html_content="<p>Текст</p>", total_recipients=1, total_chunks=1
+    )
+
+    with patch("newsletters.tasks.get_connection") as mock_get_connection:
+        connection = mock_get_connection.return_value.__enter__.return_value
+        connection.send_messages.side_effect = SMTPException("boom")
+        result = send_newsletter_chunk.apply(
+            args=(delivery.id, subscriber.id, subscriber.id), retries=3
+        )
+
+    delivery.refresh_from_db()
+    assert result.result is None
+    assert connection.send_messages.call_count == 1
+    assert delivery.failed_count == 1
+    assert delivery.sent_count == 0
+    assert delivery.status == "completed"
+
+
+@pytest.mark.django_db
+def test_send_newsletter_chunk_retries_only_unsent_recipients(mailoutbox):
+    subscribers = [
+        Subscriber.objects.create(email=f"user{i}@example.com") for i in range(3)
+    ]
+    delivery = NewsletterDelivery.objects.create(
+        subject="Тема", html_content="<p>Текст</p>", total_recipients=3, total_chunks=1
+    )
+
+    with patch("newsletters.tasks.get_connection") as mock_get_connection:
+        connection = mock_get_connection.return_value.__enter__.return_value
+        connection.send_messages.side_effect = [1, SMTPException("boom"), 1, 1]
+        send_newsletter_chunk.apply(
+            args=(delivery.id, subscribers[0].id, subscribers[-1].id)
+        )
+
+    recipients = [
+        call.args[0][0].to for call in connection.send_messages.call_args_list
+    ]
+    delivery.refresh_from_db()
+    assert recipients == [
+        ["user0@example.com"],
+        ["user1@example.com"],
+        ["user1@example.com"],
+        ["user2@example.com"],
+    ]
+    assert delivery.sent_count == 3
+    assert delivery.failed_count == 0
+    assert delivery.processed_chunks == 1
+    assert delivery.status == "completed"
+
+
+@pytest.mark.django_db
+def test_send_newsletter_chunk_counts_sent_messages_after_final_failure(mailoutbox):
+    subscribers = [
+        Subscriber.objects.create(email=f"user{i}@example.com") for i in range(3)
+    ]
+    delivery = NewsletterDelivery.objects.create(
+        subject="Тема", html_content="<p>Текст</p>", total_recipients=3, total_chunks=1
+    )
+
+    with patch("newsletters.tasks.get_connection") as mock_get_connection:
+        connection = mock_get_connection.return_value.__enter__.return_value
+        connection.send_messages.side_effect = [1, SMTPException("boom")]
+        send_newsletter_chunk.apply(
+            args=(delivery.id, subscribers[0].id, subscribers[-1].id), retries=3
+        )
+
+    delivery.refresh_from_db()
+    assert delivery.sent_count == 1
+    assert delivery.failed_count == 2
+    assert delivery.status == "completed"
+
+
+@pytest.mark.django_db
+def test_send_catalog_digest_task_sends_single_delivery(mailoutbox):
+    for i in range(3):
+        Subscriber.objects.create(email=f"user{i}@example.com")
+
+    brand = create_brand()
+    category = create_category()
+    products = [
+        create_product(
+            brand=brand, category=category, name=f"Product{i}", slug=f"product{i}"
+        )
+        for i in range(2)
+    ]
+    mailoutbox.clear()
+    NewsletterDelivery.objects.all().delete()
+
+    delivery_id = send_catalog_digest_task([product.id for product in products], 40)
+
+    delivery = NewsletterDelivery.objects.get()
+    assert delivery.id == delivery_id
+    assert delivery.product is None
+    assert delivery.subject == "🆕 Новые товары в каталоге: 40"
+    assert len(mailoutbox) == 3
+    assert "Product0" in mailoutbox[0].body
+    assert "/detail-product/product1" in mailoutbox[0].body
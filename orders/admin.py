@@ -1,5 +1,24 @@
 from django.contrib import admin
+from django.db.models import (
+    DecimalField,
+    F,
+    OuterRef,
+    PositiveIntegerField,
+    Subquery,
+    Sum,
+)
 from orders.models import Order, OrderItem
+from store.utils import EstimatedCountPaginator
+
+
+def order_items_total(expression, output_field):
+    return Subquery(
+        OrderItem.objects.filter(order=OuterRef("pk"))
+        .values("order")
+        .annotate(total=Sum(expression, output_field=output_field))
+        .values("total"),
+        output_field=output_field,
+    )
 
 
 class OrderItemInline(admin.TabularInline):
@@ -8,6 +27,9 @@ class OrderItemInline(admin.TabularInline):
     readonly_fields = ("product", "price", "quantity", "get_cost")
     can_delete = False
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("product")
+
     def get_cost(self, obj):
         return obj.get_cost()
 
@@ -29,6 +51,8 @@ class OrderAdmin(admin.ModelAdmin):
     )
     list_filter = ("status", "paid", "created_at")
     search_fields = ("full_name", "email", "phone", "id")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = (
         "created_at",
         "updated_at",
@@ -44,12 +68,27 @@ class OrderAdmin(admin.ModelAdmin):
         ("Итоги заказа", {"fields": ("get_total_quantity", "get_total_cost")}),
     )
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                total_quantity=order_items_total(F("quantity"), PositiveIntegerField()),
+                total_cost=order_items_total(
+                    F("price") * F("quantity"),
+                    DecimalField(max_digits=12, decimal_places=2),
+                ),
+            )
+        )
+
     def get_total_cost(self, obj):
-        return obj.get_total_cost()
+        return obj.total_cost or 0
 
     get_total_cost.short_description = "Общая стоимость"
+    get_total_cost.admin_order_field = "total_cost"
 
     def get_total_quantity(self, obj):
-        return obj.get_total_quantity()
+        return obj.total_quantity or 0
 
     get_total_quantity.short_description = "Общее количество"
+    get_total_quantity.admin_order_field = "total_quantity"
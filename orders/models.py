@@ -40,6 +40,9 @@ class Order(models.Model):
         verbose_name = "Заказ"
         verbose_name_plural = "Заказы"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="orders_order_created_idx"),
+        ]
 
     def __str__(self):
         return f"Заказ #{self.id} от {self.full_name}"
@@ -0,0 +1,35 @@
+from django.db import transaction
+from carts.models import CartItem
+from orders.models import OrderItem
+
+
+def create_order_from_cart(user, form):
+    with transaction.atomic():
+        cart_items = list(
+            CartItem.objects.select_for_update(of=("self",))
+            .filter(user=user)
+            .select_related("product")
+            .order_by("id")
+        )
+        if not cart_items:
+            return None
+
+        order = form.save(commit=False)
+        order.user = user
+        order.save()
+
+        OrderItem.objects.bulk_create(
+            [
+                OrderItem(
+                    order=order,
+                    product=item.product,
+                    price=item.product.final_price(),
+                    quantity=item.quantity,
+                )
+                for item in cart_items
+            ]
+        )
+
+        CartItem.objects.filter(id__in=[item.id for item in cart_items]).delete()
+
+    return order
@@ -0,0 +1,59 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from orders.models import Order, OrderItem
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+)
+
+
+def create_orders(count, product):
+    for i in range(count):
+        order = Order.objects.create(
+            full_name=f"Покупатель {i}",
+            email=f"buyer{i}@example.com",
+            phone="+375291234567",
+            address="ул. Тестовая, 1, Минск",
+        )
+        OrderItem.objects.create(
+            order=order, product=product, price=Decimal("10.00"), quantity=2
+        )
+        OrderItem.objects.create(
+            order=order, product=product, price=Decimal("5.50"), quantity=1
+        )
+
+
+@pytest.mark.django_db
+def test_order_changelist_annotates_totals_in_sql(admin_client):
+    product = create_product(brand=create_brand(), category=create_category())
+    url = reverse("admin:orders_order_changelist")
+    create_orders(1, product)
+    admin_client.get(url)
+
+    with CaptureQueriesContext(connection) as single_order:
+        admin_client.get(url)
+    create_orders(9, product)
+    with CaptureQueriesContext(connection) as many_orders:
+        response = admin_client.get(url)
+
+    assert response.status_code == 200
+    assert len(many_orders) == len(single_order)
+    order = response.context["cl"].result_list[0]
+    assert order.total_quantity == 3
+    assert order.total_cost == Decimal("25.50")
+
+
+@pytest.mark.django_db
+def test_order_change_view_shows_totals(admin_client):
+    product = create_product(brand=create_brand(), category=create_category())
+    create_orders(1, product)
+    order = Order.objects.get()
+
+    response = admin_client.get(reverse("admin:orders_order_change", args=[order.id]))
+
+    assert response.status_code == 200
+    assert "25" in response.content.decode()
@@ -0,0 +1,70 @@
+import pytest
+from decimal import Decimal
+from carts.models import CartItem
+from orders.forms import OrderCreateForm
+from orders.models import Order, OrderItem
+from orders.services import create_order_from_cart
+from store.models import Product
+from techshop.tests.create_objects_for_tests import (
+    create_user,
+    create_brand,
+    create_category,
+    create_product,
+)
+
+FORM_DATA = {
+    "full_name": "Иван Иванов",
+    "email": "ivan@example.com",
+    "phone": "+375291234567",
+    "address": "ул. Тестовая, 1, Минск",
+}
+
+
+def make_form():
+    form = OrderCreateForm(FORM_DATA)
+    assert form.is_valid()
+    return form
+
+
+@pytest.mark.django_db
+def test_create_order_from_cart_snapshots_prices():
+    user = create_user()
+    brand = create_brand()
+    category = create_category()
+    product = create_product(brand=brand, category=category, discount=20)
+    CartItem.objects.create(user=user, product=product, quantity=3)
+
+    order = create_order_from_cart(user, make_form())
+
+    Product.objects.filter(pk=product.pk).update(price=Decimal("500.00"))
+    item = OrderItem.objects.get(order=order)
+    assert order.user == user
+    assert item.price == Decimal("80.00")
+    assert item.quantity == 3
+    assert not CartItem.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_create_order_from_cart_query_count_is_constant(django_assert_num_queries):
+    user = create_user()
+    brand = create_brand()
+    category = create_category()
+    for i in range(10):
+        product = create_product(
+            brand=brand, category=category, name=f"Product{i}", slug=f"product{i}"
+        )
+        CartItem.objects.create(user=user, product=product, quantity=1)
+
+    form = make_form()
+    with django_assert_num_queries(7):
+        order = create_order_from_cart(user, form)
+
+    assert order.items.count() == 10
+
+
+@pytest.mark.django_db
+def test_create_order_from_empty_cart():
+    user = create_user()
+
+    assert create_order_from_cart(user, make_form()) is None
+    assert not Order.objects.exists()
@@ -1,42 +1,32 @@
 from django.shortcuts import get_object_or_404, render, redirect
+from django.db.models import Prefetch
 from orders.models import Order, OrderItem
 from orders.forms import OrderCreateForm
+from orders.services import create_order_from_cart
 from carts.models import CartItem
 from django.contrib.auth.decorators import login_required
 
 
 @login_required
 def order_create(request):
-    cart_items = CartItem.objects.filter(user=request.user)
-    total_price = request.user.get_cart_total_price()
-    total_quantity = request.user.get_cart_total_quantity()
-
     if request.method == "POST":
         form = OrderCreateForm(request.POST)
         if form.is_valid():
-            order = form.save(commit=False)
-            order.user = request.user
-            order.save()
-
-            for item in cart_items:
-                OrderItem.objects.create(
-                    order=order,
-                    product=item.product,
-                    price=item.product.final_price(),
-                    quantity=item.quantity,
-                )
-
-            cart_items.delete()
+            order = create_order_from_cart(request.user, form)
+            if order is None:
+                return redirect("cart:cart")
 
             return redirect("payments:start_payment", order_id=order.id)
     else:
         form = OrderCreateForm()
 
+    cart_items = CartItem.objects.filter(user=request.user).select_related("product")
+    summary = request.user.get_cart_summary()
     context = {
         "form": form,
         "cart_items": cart_items,
-        "total_price": total_price,
-        "total_quantity": total_quantity,
+        "total_price": summary["total_price"],
+        "total_quantity": summary["total_quantity"],
     }
 
     return render(request, "orders/order_create.html", context)
@@ -50,7 +40,11 @@ def order_success(request, order_id):
 
 @login_required
 def user_orders(request):
-    orders = Order.objects.filter(user=request.user).order_by("-created_at")
+    orders = (
+        Order.objects.filter(user=request.user)
+        .prefetch_related("items")
+        .order_by("-created_at")
+    )
     context = {
         "orders": orders,
     }
@@ -60,7 +54,13 @@ def user_orders(request):
 
 @login_required
 def user_order_detail(request, order_id):
-    order = get_object_or_404(Order, id=order_id, user=request.user)
+    order = get_object_or_404(
+        Order.objects.prefetch_related(
+            Prefetch("items", queryset=OrderItem.objects.select_related("product"))
+        ),
+        id=order_id,
+        user=request.user,
+    )
     context = {
         "order": order,
     }
@@ -1,10 +1,27 @@
 from django.contrib import admin
+from django.forms.models import BaseInlineFormSet
 from django.utils.html import format_html
 from reviews.models import Review
+from store.utils import EstimatedCountPaginator
+
+REVIEW_INLINE_LIMIT = 20
+
+
+class LatestReviewsFormSet(BaseInlineFormSet):
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not queryset.query.is_sliced:
+            queryset = queryset.select_related("user").order_by("-created_at")[
+                :REVIEW_INLINE_LIMIT
+            ]
+            self._queryset = queryset
+        return queryset
 
 
 class ReviewInline(admin.TabularInline):
     model = Review
+    formset = LatestReviewsFormSet
+    verbose_name_plural = f"Последние отзывы (до {REVIEW_INLINE_LIMIT})"
     extra = 0
     readonly_fields = ("user", "created_at", "rating")
     fields = ("user", "rating", "comment", "created_at")
@@ -24,7 +41,10 @@ class ReviewAdmin(admin.ModelAdmin):
         "short_comment",
         "created_at",
     )
-    list_filter = ("rating", "created_at", "product")
+    list_filter = ("rating", "created_at")
+    list_select_related = ("product", "user")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = ("user__username", "product__name", "comment")
     readonly_fields = ("created_at", "rating")
     autocomplete_fields = ("product", "user")
@@ -33,7 +53,7 @@ class ReviewAdmin(admin.ModelAdmin):
     def product_link(self, obj):
         return format_html(
             "<a href='/admin/store/product/{}/change/'>{}</a>",
-            str(obj.product.id),
+            str(obj.product_id),
             obj.product.name,
         )
 
@@ -43,7 +63,7 @@ class ReviewAdmin(admin.ModelAdmin):
     def user_link(self, obj):
         return format_html(
             "<a href='/admin/accounts/customuser/{}/change/'>{}</a>",
-            str(obj.user.id),
+            str(obj.user_id),
             obj.user.username,
         )
 
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-18 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0001_initial"),
+        ("store", "0009_product_created_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["created_at", "id"], name="reviews_review_created_idx"
+            ),
+        ),
+    ]
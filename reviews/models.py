@@ -24,6 +24,15 @@ class Review(models.Model):
         verbose_name = "Отзыв"
         verbose_name_plural = "Отзывы"
         unique_together = ("product", "user")
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="reviews_review_created_idx"
+            ),
+            models.Index(
+                fields=["product", "-created_at", "-id"],
+                name="reviews_review_product_idx",
+            ),
+        ]
 
     def __str__(self):
         return (
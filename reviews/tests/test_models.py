@@ -1,6 +1,8 @@
 import pytest
 from decimal import Decimal
+from django.core.cache import cache
 from reviews.models import Review
+from store.cache import get_catalog_version, get_or_recompute
 from techshop.tests.create_objects_for_tests import (
     create_brand,
     create_category,
@@ -93,3 +95,55 @@ def test_review_meta_verbose_names():
 
     assert review._meta.verbose_name == "Отзыв"
     assert review._meta.verbose_name_plural == "Отзывы"
+
+
+@pytest.mark.django_db
+def test_review_updates_product_rating_incrementally():
+    brand = create_brand()
+    category = create_category()
+    product = create_product(brand=brand, category=category)
+    user1 = create_user(username="user1", email="user1@example.com")
+    user2 = create_user(username="user2", email="user2@example.com")
+
+    review1 = Review.objects.create(product=product, user=user1, rating=5)
+    review2 = Review.objects.create(product=product, user=user2, rating=4)
+    product.refresh_from_db()
+
+    assert product.rating_sum == 9
+    assert product.review_count == 2
+    assert product.rating == 4.5
+
+    review2.rating = 2
+    review2.save()
+    product.refresh_from_db()
+
+    assert product.rating_sum == 7
+    assert product.rating == 3.5
+
+    review1.delete()
+    product.refresh_from_db()
+
+    assert product.rating_sum == 2
+    assert product.review_count == 1
+    assert product.rating == 2.0
+
+    review2.delete()
+    product.refresh_from_db()
+
+    assert product.review_count == 0
+    assert product.rating == 0.0
+
+
+@pytest.mark.django_db
+def test_new_review_expires_only_product_detail_cache(django_assert_num_queries):
+    product = create_product(brand=create_brand(), category=create_category())
+    user = create_user()
+    version = get_catalog_version()
+    get_or_recompute(f"product_detail_{product.slug}", lambda: "cached")
+    review = Review(product_id=product.id, user=user, rating=5)
+
+    with django_assert_num_queries(3):
+        review.save()
+
+    assert get_catalog_version() == version
+    assert cache.get(f"product_detail_{product.slug}").expires_at == 0
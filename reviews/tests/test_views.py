@@ -0,0 +1,59 @@
+import pytest
+from django.urls import reverse
+from accounts.models import CustomUser
+from reviews.models import Review
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+)
+from techshop.tests.view_budgets import assert_within_budget
+
+
+@pytest.fixture
+def reviewed_product():
+    product = create_product(brand=create_brand(), category=create_category())
+    users = CustomUser.objects.bulk_create(
+        [CustomUser(username=f"reviewer-{i}") for i in range(25)]
+    )
+    for i, user in enumerate(users):
+        Review.objects.create(
+            product=product, user=user, rating=i % 5 + 1, comment=f"Отзыв {i}"
+        )
+    return product
+
+
+@pytest.mark.django_db
+def test_review_list_pages_through_reviews_with_cursor(client, reviewed_product):
+    url = reverse("reviews:review_list", args=[reviewed_product.slug])
+
+    seen = []
+    cursor = ""
+    while True:
+        response = client.get(url, {"cursor": cursor} if cursor else {})
+        assert response.status_code == 200
+        page_obj = response.context["page_obj"]
+        seen.extend(review.comment for review in page_obj)
+        if not page_obj.has_next():
+            assert "reviews-more-btn" not in response.content.decode()
+            break
+        assert page_obj.next_cursor in response.content.decode()
+        cursor = page_obj.next_cursor
+
+    assert seen == [f"Отзыв {i}" for i in range(24, -1, -1)]
+
+
+@pytest.mark.django_db
+def test_review_list_stays_within_query_budget(client, reviewed_product):
+    response = client.get(reverse("reviews:review_list", args=[reviewed_product.slug]))
+
+    assert "reviewer-24" in response.content.decode()
+    assert_within_budget(response)
+
+
+@pytest.mark.django_db
+def test_review_list_for_unknown_product_is_empty(client):
+    response = client.get(reverse("reviews:review_list", args=["missing"]))
+
+    assert response.status_code == 200
+    assert len(response.context["page_obj"]) == 0
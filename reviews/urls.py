@@ -1,9 +1,10 @@
 from django.urls import path
-from .views import add_review
+from .views import add_review, review_list
 
 
 app_name = "reviews"
 
 urlpatterns = [
     path("add/<slug:product_slug>/", add_review, name="add_review"),
+    path("<slug:product_slug>/", review_list, name="review_list"),
 ]
@@ -1,7 +1,29 @@
-from django.shortcuts import redirect, get_object_or_404
+from django.shortcuts import redirect, get_object_or_404, render
 from django.contrib.auth.decorators import login_required
 from store.models import Product
+from store.utils import paginate_keyset
 from reviews.forms import ReviewForm
+from reviews.models import Review
+
+REVIEWS_PER_PAGE = 10
+
+
+def paginate_reviews(request, reviews):
+    return paginate_keyset(
+        request, reviews.select_related("user"), per_page=REVIEWS_PER_PAGE
+    )
+
+
+def review_list(request, product_slug):
+    page_obj = paginate_reviews(
+        request, Review.objects.filter(product__slug=product_slug)
+    )
+    context = {
+        "page_obj": page_obj,
+        "product_slug": product_slug,
+    }
+
+    return render(request, "reviews/components/_review_list.html", context)
 
 
 @login_required
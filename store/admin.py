@@ -1,6 +1,8 @@
 from django.contrib import admin
+from django.urls import reverse
 from django.utils.html import format_html
 from store.models import Category, Product, Brand
+from store.utils import EstimatedCountPaginator
 from reviews.admin import ReviewInline
 
 
@@ -57,7 +59,11 @@ class ProductAdmin(admin.ModelAdmin):
         "review_count",
         "final_price_display",
         "image_preview",
+        "reviews_link",
     )
+    list_select_related = ("brand", "category")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     ordering = ("-created_at",)
     date_hierarchy = "created_at"
     save_on_top = True
@@ -78,15 +84,27 @@ class ProductAdmin(admin.ModelAdmin):
             },
         ),
         ("Ценообразование", {"fields": ("price", "discount", "final_price_display")}),
-        ("Характеристики", {"fields": ("color", "rating")}),
+        ("Характеристики", {"fields": ("color", "rating", "reviews_link")}),
         ("Служебное", {"fields": ("created_at", "updated_at")}),
     )
     inlines = [ReviewInline]
 
     def final_price_display(self, obj):
-        return f"{obj.final_price():.2f} $"
+        return f"{obj.discounted_price:.2f} $"
 
     final_price_display.short_description = "Цена со скидкой"
+    final_price_display.admin_order_field = "discounted_price"
+
+    def reviews_link(self, obj):
+        url = reverse("admin:reviews_review_changelist")
+        return format_html(
+            "<a href='{}?product__id__exact={}'>Все отзывы ({})</a>",
+            url,
+            obj.id,
+            obj.review_count,
+        )
+
+    reviews_link.short_description = "Отзывы"
 
     def image_preview(self, obj):
         if obj.image:
@@ -6,4 +6,5 @@ class StoreConfig(AppConfig):
     name = 'store'
 
     def ready(self):
-        import store.signals
\ No newline at end of file
+        import store.signals
+        import techshop.checks
\ No newline at end of file
@@ -0,0 +1,240 @@
+import json
+import statistics
+import time
+from types import SimpleNamespace
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import CommandError
+from django.db.models import Max, Min
+from django.urls import reverse
+from carts.models import CartItem
+from orders.models import Order
+from store.cache import local_cache
+from store.models import Brand, Category, Product
+
+PRODUCT_SAMPLE_SIZE = 500
+BENCHMARK_USERNAME = "benchmark-user"
+
+
+class StubPayPalPayment:
+    def __init__(self, data):
+        self.data = data
+        self.id = "PAY-BENCHMARK"
+        self.links = []
+
+    def create(self):
+        self.links = [SimpleNamespace(method="REDIRECT", href="https://paypal.local")]
+        return True
+
+
+class BenchmarkContext:
+    def __init__(self, client, rng):
+        self.client = client
+        self.rng = rng
+        self.products = self.sample_products()
+        self.category_ids = list(Category.objects.values_list("id", flat=True))
+        self.brand_ids = list(Brand.objects.values_list("id", flat=True))
+        if not (self.products and self.category_ids and self.brand_ids):
+            raise CommandError(
+                "Нет товаров для замеров, сначала запустите generate_data"
+            )
+        self.colors = [color for color, _ in Product.COLOR_CHOICES]
+        delete_benchmark_data()
+        self.user = get_user_model().objects.create_user(
+            username=BENCHMARK_USERNAME, password="benchmark-password"
+        )
+        client.force_login(self.user)
+
+    def reset(self):
+        Order.objects.filter(user=self.user).delete()
+        self.user.cart_items.all().delete()
+        self.user.favorites.all().delete()
+
+    def close(self):
+        self.client.logout()
+        delete_benchmark_data()
+
+    def sample_products(self):
+        bounds = Product.objects.aggregate(first=Min("id"), last=Max("id"))
+        if bounds["first"] is None:
+            return []
+        candidates = range(bounds["first"], bounds["last"] + 1)
+        ids = self.rng.sample(candidates, min(len(candidates), PRODUCT_SAMPLE_SIZE))
+        products = list(Product.objects.filter(id__in=ids).values_list("id", "slug"))
+        if not products:
+            products = list(
+                Product.objects.order_by("id").values_list("id", "slug")[
+                    :PRODUCT_SAMPLE_SIZE
+                ]
+            )
+        return products
+
+    def random_product_id(self):
+        return self.rng.choice(self.products)[0]
+
+    def fill_cart(self, size):
+        for product_id, _ in self.rng.sample(
+            self.products, min(size, len(self.products))
+        ):
+            CartItem.objects.get_or_create(user=self.user, product_id=product_id)
+
+    def post_json(self, url, data):
+        return self.client.post(url, json.dumps(data), content_type="application/json")
+
+
+def delete_benchmark_data():
+    Order.objects.filter(user__username=BENCHMARK_USERNAME).delete()
+    get_user_model().objects.filter(username=BENCHMARK_USERNAME).delete()
+
+
+def clear_caches():
+    cache.clear()
+    local_cache.clear()
+
+
+def bench_products_all(context):
+    params = context.rng.choice(
+        [
+            {},
+            {"sort": "price_asc"},
+            {"category": context.rng.choice(context.category_ids)},
+            {"q": context.rng.choice(("ноутбук", "смартфон", "часы"))},
+        ]
+    )
+    return context.client.get(reverse("store:products"), params)
+
+
+def bench_product_filter_ajax(context):
+    rng = context.rng
+    params = {}
+    if rng.random() < 0.5:
+        params["category"] = rng.choice(context.category_ids)
+    if rng.random() < 0.3:
+        params["brand"] = rng.sample(context.brand_ids, min(2, len(context.brand_ids)))
+    if rng.random() < 0.3:
+        params["color"] = rng.choice(context.colors)
+    if rng.random() < 0.4:
+        params["min_price"] = rng.choice((100, 500, 1000))
+        params["max_price"] = params["min_price"] + rng.choice((500, 1500, 3000))
+    if rng.random() < 0.3:
+        params["sort"] = rng.choice(("price_asc", "price_desc"))
+    if rng.random() < 0.2:
+        params["q"] = rng.choice(("ноутбук", "смартфон", "часы"))
+    return context.client.get(reverse("store:product_filter_ajax"), params)
+
+
+def bench_detail_product(context):
+    _, slug = context.rng.choice(context.products)
+    return context.client.get(reverse("store:detail_product", args=[slug]))
+
+
+def bench_add_to_cart(context):
+    return context.post_json(
+        reverse("cart:add_to_cart"),
+        {"product_id": context.random_product_id(), "quantity": 1},
+    )
+
+
+def prepare_remove_from_cart(context):
+    product_id = context.random_product_id()
+    cart_item, _ = CartItem.objects.get_or_create(
+        user=context.user, product_id=product_id
+    )
+    context.cart_item_id = cart_item.id
+
+
+def bench_remove_from_cart(context):
+    return context.post_json(
+        reverse("cart:remove_from_cart"), {"cart_item_id": context.cart_item_id}
+    )
+
+
+def prepare_cart_view(context):
+    if not context.user.cart_items.exists():
+        context.fill_cart(5)
+
+
+def bench_cart_view(context):
+    return context.client.get(reverse("cart:cart"))
+
+
+def prepare_order_create(context):
+    context.fill_cart(3)
+
+
+def bench_order_create(context):
+    response = context.client.post(
+        reverse("orders:order_create"),
+        {
+            "full_name": "Нагрузочный Тест",
+            "email": "benchmark@example.com",
+            "phone": "+375290000000",
+            "address": "ул. Тестовая, 1, Минск",
+        },
+    )
+    if response.status_code != 302:
+        return response
+    return context.client.get(response["Location"])
+
+
+def bench_toggle_wishlist(context):
+    return context.post_json(
+        reverse("favorites:toggle_wishlist"),
+        {"product_id": context.random_product_id()},
+    )
+
+
+SCENARIOS = {
+    "products_all": (None, bench_products_all),
+    "product_filter_ajax": (None, bench_product_filter_ajax),
+    "detail_product": (None, bench_detail_product),
+    "add_to_cart": (None, bench_add_to_cart),
+    "remove_from_cart": (prepare_remove_from_cart, bench_remove_from_cart),
+    "cart_view": (prepare_cart_view, bench_cart_view),
+    "order_create": (prepare_order_create, bench_order_create),
+    "toggle_wishlist": (None, bench_toggle_wishlist),
+}
+
+
+def percentile(samples, percent):
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    return statistics.quantiles(ordered, n=100, method="inclusive")[percent - 1]
+
+
+def run_scenario(context, name, iterations, warmup):
+    prepare, bench = SCENARIOS[name]
+    durations = []
+    queries = []
+    errors = 0
+
+    for iteration in range(warmup + iterations):
+        if prepare:
+            prepare(context)
+        started = time.perf_counter()
+        response = bench(context)
+        elapsed = time.perf_counter() - started
+        if iteration < warmup:
+            continue
+        durations.append(elapsed)
+        if response.status_code >= 400:
+            errors += 1
+        metrics = getattr(response, "request_metrics", None)
+        if metrics is not None:
+            queries.append(metrics.queries)
+
+    total = sum(durations)
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "throughput_rps": round(iterations / total, 2) if total else None,
+        "mean_ms": round(statistics.fmean(durations) * 1000, 3),
+        "p50_ms": round(percentile(durations, 50) * 1000, 3),
+        "p95_ms": round(percentile(durations, 95) * 1000, 3),
+        "p99_ms": round(percentile(durations, 99) * 1000, 3),
+        "max_ms": round(max(durations) * 1000, 3),
+        "queries_per_request": (
+            round(statistics.fmean(queries), 2) if queries else None
+        ),
+    }
@@ -0,0 +1,156 @@
+import hashlib
+import math
+import random
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from django.core.cache import cache
+from django.utils.http import urlencode
+
+CATALOG_VERSION_KEY = "catalog_version"
+CATALOG_CACHE_TIMEOUT = 60 * 10
+REFERENCE_CACHE_TIMEOUT = 60 * 60
+LOCAL_CACHE_MAX_SIZE = 512
+LOCAL_CACHE_CHECK_INTERVAL = 2.0
+LOCAL_CACHE_MAX_TTL = 30.0
+STALE_TIMEOUT = 60 * 5
+RECOMPUTE_LOCK_TIMEOUT = 10
+RECOMPUTE_WAIT = 2.0
+RECOMPUTE_POLL_INTERVAL = 0.05
+EARLY_RECOMPUTE_BETA = 1.0
+
+CacheEntry = namedtuple("CacheEntry", ["value", "expires_at", "duration"])
+
+
+def get_catalog_version():
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, time.time_ns(), None)
+    local_cache.clear()
+
+
+def catalog_cache_key(prefix, params):
+    items = sorted((key, value) for key in params for value in params.getlist(key))
+    digest = hashlib.md5(urlencode(items).encode()).hexdigest()
+    return f"{prefix}:{get_catalog_version()}:{digest}"
+
+
+def recompute(key, default, timeout):
+    started = time.perf_counter()
+    value = default()
+    duration = time.perf_counter() - started
+    cache.set(
+        key, CacheEntry(value, time.time() + timeout, duration), timeout + STALE_TIMEOUT
+    )
+    return value
+
+
+def get_entry(key):
+    entry = cache.get(key)
+    return entry if isinstance(entry, CacheEntry) else None
+
+
+def recompute_locked(key, default, timeout):
+    lock_key = f"{key}:lock"
+    if not cache.add(lock_key, 1, RECOMPUTE_LOCK_TIMEOUT):
+        return None, False
+    try:
+        return recompute(key, default, timeout), True
+    finally:
+        cache.delete(lock_key)
+
+
+def get_or_recompute(key, default, timeout=CATALOG_CACHE_TIMEOUT):
+    entry = get_entry(key)
+    if entry is not None:
+        value, expires_at, duration = entry
+        jitter = duration * EARLY_RECOMPUTE_BETA * math.log(1 - random.random())
+        if time.time() - jitter < expires_at:
+            return value
+        fresh, recomputed = recompute_locked(key, default, timeout)
+        return fresh if recomputed else value
+
+    value, recomputed = recompute_locked(key, default, timeout)
+    if recomputed:
+        return value
+
+    deadline = time.monotonic() + RECOMPUTE_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(RECOMPUTE_POLL_INTERVAL)
+        entry = get_entry(key)
+        if entry is not None:
+            return entry.value
+    return recompute(key, default, timeout)
+
+
+def expire_cached(key):
+    entry = get_entry(key)
+    if entry is not None:
+        cache.set(key, entry._replace(expires_at=0), STALE_TIMEOUT)
+
+
+class TwoTierCache:
+    def __init__(
+        self,
+        max_size=LOCAL_CACHE_MAX_SIZE,
+        check_interval=LOCAL_CACHE_CHECK_INTERVAL,
+        max_ttl=LOCAL_CACHE_MAX_TTL,
+    ):
+        self.max_size = max_size
+        self.check_interval = check_interval
+        self.max_ttl = max_ttl
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.items = OrderedDict()
+            self.version = None
+            self.checked_at = 0.0
+
+    def sync_version(self):
+        now = time.monotonic()
+        if self.version is not None and now - self.checked_at < self.check_interval:
+            return self.version
+
+        version = get_catalog_version()
+        with self.lock:
+            if version != self.version:
+                self.items.clear()
+                self.version = version
+            self.checked_at = now
+        return version
+
+    def get_or_set(self, key, default, timeout=CATALOG_CACHE_TIMEOUT):
+        version = self.sync_version()
+        now = time.monotonic()
+        with self.lock:
+            if key in self.items:
+                expires_at, value = self.items[key]
+                if now < expires_at:
+                    self.items.move_to_end(key)
+                    return value
+                del self.items[key]
+
+        value = get_or_recompute(key, default, timeout)
+
+        ttl = min(timeout or self.max_ttl, self.max_ttl)
+        with self.lock:
+            if self.version == version:
+                self.items[key] = (time.monotonic() + ttl, value)
+                self.items.move_to_end(key)
+                while len(self.items) > self.max_size:
+                    self.items.popitem(last=False)
+        return value
+
+
+local_cache = TwoTierCache()
@@ -0,0 +1,290 @@
+import json
+import re
+from django.core.cache import cache
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from newsletters.tasks import send_catalog_digest_task
+from store.cache import bump_catalog_version
+from store.models import (
+    HASHED_PRODUCT_FIELDS,
+    Brand,
+    Category,
+    Product,
+    product_content_hash,
+)
+from store.tasks import invalidate_product_slug_filter
+
+DIGEST_PRODUCT_LIMIT = 12
+IMPORT_MODELS = {
+    "store.brand": Brand,
+    "store.category": Category,
+    "store.product": Product,
+}
+UPDATE_FIELDS = {
+    Brand: ["name", "slug"],
+    Category: ["name", "slug", "image"],
+    Product: [
+        "name",
+        "slug",
+        "brand",
+        "category",
+        "description",
+        "price",
+        "discount",
+        "color",
+        "image",
+        "content_hash",
+        "updated_at",
+    ],
+}
+WHITESPACE = re.compile(r"[\s,]*")
+
+
+def iter_json_records(stream, read_size=1 << 16):
+    decoder = json.JSONDecoder()
+    buffer = stream.read(read_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Ожидался JSON-массив записей")
+    position = 1
+    eof = False
+
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+        if buffer.startswith("]", position):
+            return
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = stream.read(read_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        position = end
+        yield record
+
+
+def iter_jsonl_records(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+class CatalogImporter:
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.pending = {model: [] for model in UPDATE_FIELDS}
+        self.counts = {model: 0 for model in UPDATE_FIELDS}
+        self.new_product_slugs = []
+        self.new_product_total = 0
+        self.explicit_pk_models = set()
+
+    def build(self, record):
+        try:
+            model = IMPORT_MODELS[record["model"].lower()]
+        except KeyError:
+            raise ValueError(f"Неподдерживаемая модель: {record.get('model')}")
+
+        obj = model(pk=record.get("pk"))
+        for name, value in record["fields"].items():
+            field = model._meta.get_field(name)
+            if field.generated or name == "search_vector":
+                continue
+            if field.is_relation:
+                setattr(obj, field.attname, value)
+            else:
+                setattr(obj, field.attname, field.to_python(value))
+        if model is Product:
+            obj.content_hash = product_content_hash(obj)
+        return model, obj
+
+    def add(self, record):
+        model, obj = self.build(record)
+        self.pending[model].append(obj)
+        if len(self.pending[model]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for model in UPDATE_FIELDS:
+            objs = self.pending[model]
+            if objs:
+                self.pending[model] = []
+                self.upsert(model, objs)
+
+    def upsert(self, model, objs):
+        with transaction.atomic():
+            if model is Product:
+                self.remember_new_products(objs)
+
+            with_pk = [obj for obj in objs if obj.pk is not None]
+            without_pk = [obj for obj in objs if obj.pk is None]
+            if with_pk:
+                model.objects.bulk_create(
+                    with_pk,
+                    update_conflicts=True,
+                    unique_fields=["id"],
+                    update_fields=UPDATE_FIELDS[model],
+                )
+                self.explicit_pk_models.add(model)
+            if without_pk:
+                model.objects.bulk_create(
+                    without_pk,
+                    update_conflicts=True,
+                    unique_fields=["slug"],
+                    update_fields=[
+                        field for field in UPDATE_FIELDS[model] if field != "slug"
+                    ],
+                )
+
+        if model is Product:
+            cache.delete_many([f"product_detail_{obj.slug}" for obj in objs])
+        self.counts[model] += len(objs)
+
+    def remember_new_products(self, objs):
+        existing_ids = set(
+            Product.objects.filter(
+                pk__in=[obj.pk for obj in objs if obj.pk]
+            ).values_list("pk", flat=True)
+        )
+        existing_slugs = set(
+            Product.objects.filter(
+                slug__in=[obj.slug for obj in objs if not obj.pk]
+            ).values_list("slug", flat=True)
+        )
+        new_slugs = [
+            obj.slug
+            for obj in objs
+            if obj.pk not in existing_ids and obj.slug not in existing_slugs
+        ]
+        self.new_product_total += len(new_slugs)
+        self.new_product_slugs.extend(
+            new_slugs[: DIGEST_PRODUCT_LIMIT - len(self.new_product_slugs)]
+        )
+
+    def finish(self, send_digest=True):
+        self.flush()
+        if self.explicit_pk_models:
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(
+                    no_style(), list(self.explicit_pk_models)
+                ):
+                    cursor.execute(sql)
+
+        cache.delete_many(["all_categories", "all_brands"])
+        bump_catalog_version()
+        invalidate_product_slug_filter()
+
+        if send_digest and self.new_product_total:
+            product_ids = list(
+                Product.objects.filter(slug__in=self.new_product_slugs).values_list(
+                    "id", flat=True
+                )
+            )
+            transaction.on_commit(
+                lambda: send_catalog_digest_task.delay(
+                    product_ids, self.new_product_total
+                )
+            )
+        return self.counts
+
+
+class CatalogFeedSync:
+    def __init__(self, batch_size=1000, delete_missing=False, dry_run=False):
+        self.importer = CatalogImporter(batch_size=batch_size)
+        self.batch_size = batch_size
+        self.delete_missing = delete_missing
+        self.dry_run = dry_run
+        self.pending = []
+        self.seen_slugs = set()
+        self.changes = {"inserted": [], "updated": [], "deleted": []}
+        self.unchanged = 0
+
+    def add(self, record):
+        model, obj = self.importer.build(record)
+        if model is not Product:
+            raise ValueError(f"Фид должен содержать только товары: {record['model']}")
+        self.pending.append(obj)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        objs, self.pending = self.pending, []
+        if not objs:
+            return
+
+        existing = {
+            slug: (pk, content_hash)
+            for pk, slug, content_hash in Product.objects.filter(
+                slug__in=[obj.slug for obj in objs]
+            ).values_list("id", "slug", "content_hash")
+        }
+        rehashed = self.rehash_missing(
+            [slug for slug, (_, content_hash) in existing.items() if not content_hash]
+        )
+        for product in rehashed:
+            existing[product.slug] = (product.pk, product.content_hash)
+
+        changed = []
+        for obj in objs:
+            self.seen_slugs.add(obj.slug)
+            if obj.slug not in existing:
+                obj.pk = None
+                self.changes["inserted"].append(obj.slug)
+                changed.append(obj)
+                continue
+
+            pk, current_hash = existing[obj.slug]
+            if current_hash == obj.content_hash:
+                self.unchanged += 1
+                continue
+
+            obj.pk = pk
+            self.changes["updated"].append(obj.slug)
+            changed.append(obj)
+
+        if self.dry_run:
+            return
+        if rehashed:
+            Product.objects.bulk_update(rehashed, ["content_hash"])
+        if changed:
+            self.importer.upsert(Product, changed)
+
+    def rehash_missing(self, slugs):
+        if not slugs:
+            return []
+        products = list(
+            Product.objects.filter(slug__in=slugs).only(
+                "id", "slug", "content_hash", *HASHED_PRODUCT_FIELDS
+            )
+        )
+        for product in products:
+            product.content_hash = product_content_hash(product)
+        return products
+
+    def delete_missing_products(self):
+        missing = [
+            (product_id, slug)
+            for product_id, slug in Product.objects.values_list("id", "slug").iterator(
+                chunk_size=self.batch_size
+            )
+            if slug not in self.seen_slugs
+        ]
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            self.changes["deleted"].extend(slug for _, slug in batch)
+            if not self.dry_run:
+                with transaction.atomic():
+                    Product.objects.filter(
+                        id__in=[product_id for product_id, _ in batch]
+                    ).delete()
+
+    def finish(self, send_digest=True):
+        self.flush()
+        if self.delete_missing:
+            self.delete_missing_products()
+        if not self.dry_run and any(self.changes.values()):
+            self.importer.finish(send_digest=send_digest)
+        return self.changes
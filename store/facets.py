@@ -0,0 +1,91 @@
+from collections import Counter
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    IntegerField,
+    Q,
+    Value,
+    When,
+)
+
+PRICE_BUCKETS = (
+    (None, 500),
+    (500, 1000),
+    (1000, 2000),
+    (2000, None),
+)
+
+
+def price_bucket_expression(field="discounted_price"):
+    whens = []
+    for index, (low, high) in enumerate(PRICE_BUCKETS):
+        lookup = {}
+        if low is not None:
+            lookup[f"{field}__gte"] = low
+        if high is not None:
+            lookup[f"{field}__lt"] = high
+        whens.append(When(Q(**lookup), then=Value(index)))
+    return Case(*whens, output_field=IntegerField())
+
+
+def price_range_expression(min_price=None, max_price=None, field="discounted_price"):
+    lookup = {}
+    if min_price:
+        lookup[f"{field}__gte"] = min_price
+    if max_price:
+        lookup[f"{field}__lte"] = max_price
+    if not lookup:
+        return Value(True, output_field=BooleanField())
+    return Case(
+        When(Q(**lookup), then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField(),
+    )
+
+
+def get_price_buckets(counts):
+    return [
+        {"index": index, "min": low, "max": high, "count": counts.get(index, 0)}
+        for index, (low, high) in enumerate(PRICE_BUCKETS)
+    ]
+
+
+def compute_facets(
+    products, category_ids=(), brand_ids=(), colors=(), min_price=None, max_price=None
+):
+    selected = {
+        "category": {int(pk) for pk in category_ids},
+        "brand": {int(pk) for pk in brand_ids},
+        "color": set(colors),
+    }
+    counters = {name: Counter() for name in ("category", "brand", "color", "price")}
+
+    rows = (
+        products.order_by()
+        .annotate(
+            price_bucket=price_bucket_expression(),
+            in_price_range=price_range_expression(min_price, max_price),
+        )
+        .values("category_id", "brand_id", "color", "price_bucket", "in_price_range")
+        .annotate(total=Count("id"))
+    )
+
+    for row in rows:
+        values = {
+            "category": row["category_id"],
+            "brand": row["brand_id"],
+            "color": row["color"],
+            "price": row["price_bucket"],
+        }
+        matches = {
+            name: not selected[name] or values[name] in selected[name]
+            for name in selected
+        }
+        matches["price"] = bool(row["in_price_range"])
+
+        for name, value in values.items():
+            if all(match for other, match in matches.items() if other != name):
+                counters[name][value] += row["total"]
+
+    return {name: dict(counter) for name, counter in counters.items()}
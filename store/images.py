@@ -0,0 +1,64 @@
+from io import BytesIO
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+DERIVATIVE_WIDTHS = (240, 480, 960)
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+}
+DERIVATIVES_DIR = "derivatives"
+
+
+def derivative_name(name, width, extension):
+    return f"{DERIVATIVES_DIR}/{name}.{width}w.{extension}"
+
+
+def derivative_names(name):
+    return [
+        derivative_name(name, width, extension)
+        for width in DERIVATIVE_WIDTHS
+        for extension in DERIVATIVE_FORMATS
+    ]
+
+
+def save_derivative(image, name):
+    extension = name.rsplit(".", 1)[1]
+    image_format, options = DERIVATIVE_FORMATS[extension]
+    if image_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, image_format, **options)
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def generate_derivatives(name):
+    with default_storage.open(name) as source:
+        original = ImageOps.exif_transpose(Image.open(source))
+        original.load()
+    if original.mode not in ("RGB", "RGBA"):
+        original = original.convert("RGBA" if "A" in original.getbands() else "RGB")
+
+    widths = [width for width in DERIVATIVE_WIDTHS if width < original.width]
+    for width in widths:
+        height = max(1, round(original.height * width / original.width))
+        resized = original.resize((width, height), Image.Resampling.LANCZOS)
+        for extension in DERIVATIVE_FORMATS:
+            save_derivative(resized, derivative_name(name, width, extension))
+
+    return {"name": name, "widths": widths, "width": original.width}
+
+
+def delete_derivatives(name):
+    for derivative in derivative_names(name):
+        if default_storage.exists(derivative):
+            default_storage.delete(derivative)
+
+
+def derivatives_for(field_file, derivatives):
+    if not field_file or derivatives.get("name") != field_file.name:
+        return []
+    return derivatives.get("widths", [])
@@ -0,0 +1,287 @@
+import math
+import random
+from decimal import Decimal
+from itertools import islice
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from carts.models import CartItem
+from favorites.models import Favorite
+from newsletters.models import Subscriber
+from orders.models import Order, OrderItem
+from payments.models import Payment
+from reviews.models import Review
+from store.cache import bump_catalog_version
+from store.management.commands.reconcile_ratings import average_rating
+from store.models import Brand, Category, Product
+from store.tasks import invalidate_product_slug_filter
+
+BASE_COUNTS = {
+    "brands": 20,
+    "categories": 10,
+    "products": 1000,
+    "users": 1000,
+    "subscribers": 500,
+    "orders": 10000,
+}
+DISCOUNTS = (0, 0, 0, 5, 10, 15, 20, 30)
+PRODUCT_KINDS = ("Ноутбук", "Смартфон", "Планшет", "Монитор", "Наушники", "Часы")
+ORDER_STATUSES = [status for status, _ in Order.STATUS_CHOICES]
+PAYMENT_METHODS = [method for method, _ in Payment.PAYMENT_METHOD_CHOICES]
+COLORS = [color for color, _ in Product.COLOR_CHOICES]
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = "Генерирует синтетический набор данных магазина заданного масштаба"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1.0)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.prefix = f"synthetic-{options['seed']}"
+        if Brand.objects.filter(slug__startswith=f"{self.prefix}-brand-").exists():
+            raise CommandError(
+                f"Данные для seed {options['seed']} уже созданы, "
+                "укажите другой --seed"
+            )
+        self.batch_size = options["batch_size"]
+        scale = options["scale"]
+        counts = {
+            name: max(1, round(base * math.sqrt(scale)))
+            for name, base in BASE_COUNTS.items()
+            if name in ("brands", "categories")
+        }
+        counts.update(
+            {
+                name: max(1, round(base * scale))
+                for name, base in BASE_COUNTS.items()
+                if name not in counts
+            }
+        )
+
+        brand_ids = self.create_brands(counts["brands"])
+        category_ids = self.create_categories(counts["categories"])
+        user_ids = self.create_users(counts["users"])
+        self.create_subscribers(counts["subscribers"])
+        product_ids = self.create_products(
+            counts["products"], brand_ids, category_ids, user_ids
+        )
+        self.create_cart_items(user_ids, product_ids)
+        self.create_favorites(user_ids, product_ids)
+        self.create_orders(counts["orders"], user_ids, product_ids)
+
+        cache.delete_many(["all_categories", "all_brands"])
+        bump_catalog_version()
+        invalidate_product_slug_filter()
+
+    def create_in_chunks(self, model, objects):
+        total = 0
+        for chunk in chunked(objects, self.batch_size):
+            with transaction.atomic():
+                created = model.objects.bulk_create(chunk)
+            total += len(created)
+            yield created
+        self.stdout.write(f"{model._meta.verbose_name_plural}: {total}")
+
+    def bulk_create(self, model, objects):
+        return sum(len(created) for created in self.create_in_chunks(model, objects))
+
+    def bulk_create_ids(self, model, objects):
+        return [
+            obj.id
+            for created in self.create_in_chunks(model, objects)
+            for obj in created
+        ]
+
+    def create_brands(self, count):
+        brands = (
+            Brand(name=f"Бренд {n}", slug=f"{self.prefix}-brand-{n}")
+            for n in range(1, count + 1)
+        )
+        return self.bulk_create_ids(Brand, brands)
+
+    def create_categories(self, count):
+        categories = (
+            Category(name=f"Категория {n}", slug=f"{self.prefix}-category-{n}")
+            for n in range(1, count + 1)
+        )
+        return self.bulk_create_ids(Category, categories)
+
+    def create_users(self, count):
+        password = make_password("password")
+        users = (
+            get_user_model()(
+                username=f"{self.prefix}-user-{n}",
+                email=f"{self.prefix}-user-{n}@example.com",
+                password=password,
+            )
+            for n in range(1, count + 1)
+        )
+        return self.bulk_create_ids(get_user_model(), users)
+
+    def create_subscribers(self, count):
+        subscribers = (
+            Subscriber(email=f"{self.prefix}-subscriber-{n}@example.com")
+            for n in range(1, count + 1)
+        )
+        self.bulk_create(Subscriber, subscribers)
+
+    def create_products(self, count, brand_ids, category_ids, user_ids):
+        product_ids = []
+        review_total = 0
+        for numbers in chunked(range(1, count + 1), self.batch_size):
+            products = []
+            planned_reviews = []
+            for n in numbers:
+                review_count = min(len(user_ids), self.rng.randint(0, 4))
+                product_reviews = [
+                    (user_id, self.rng.choice((3, 4, 4, 5, 5)))
+                    for user_id in self.rng.sample(user_ids, review_count)
+                ]
+                rating_sum = sum(rating for _, rating in product_reviews)
+                planned_reviews.append(product_reviews)
+                products.append(
+                    Product(
+                        name=f"{self.rng.choice(PRODUCT_KINDS)} {n}",
+                        slug=f"{self.prefix}-product-{n}",
+                        brand_id=self.rng.choice(brand_ids),
+                        category_id=self.rng.choice(category_ids),
+                        description=f"Синтетический товар №{n} для нагрузочных тестов.",
+                        price=Decimal(self.rng.randint(5000, 500000)) / 100,
+                        discount=self.rng.choice(DISCOUNTS),
+                        color=self.rng.choice(COLORS),
+                        rating=average_rating(rating_sum, review_count),
+                        rating_sum=rating_sum,
+                        review_count=review_count,
+                    )
+                )
+
+            with transaction.atomic():
+                Product.objects.bulk_create(products)
+                reviews = Review.objects.bulk_create(
+                    [
+                        Review(product_id=product.id, user_id=user_id, rating=rating)
+                        for product, product_reviews in zip(products, planned_reviews)
+                        for user_id, rating in product_reviews
+                    ]
+                )
+
+            review_total += len(reviews)
+            product_ids.extend(product.id for product in products)
+
+        self.stdout.write(f"{Product._meta.verbose_name_plural}: {len(product_ids)}")
+        self.stdout.write(f"{Review._meta.verbose_name_plural}: {review_total}")
+        return product_ids
+
+    def create_cart_items(self, user_ids, product_ids):
+        cart_items = (
+            CartItem(
+                user_id=user_id,
+                product_id=product_id,
+                quantity=self.rng.randint(1, 3),
+            )
+            for user_id in user_ids
+            for product_id in self.rng.sample(
+                product_ids, min(len(product_ids), self.rng.randint(0, 3))
+            )
+        )
+        self.bulk_create(CartItem, cart_items)
+
+    def create_favorites(self, user_ids, product_ids):
+        favorites = (
+            Favorite(user_id=user_id, product_id=product_id)
+            for user_id in user_ids
+            for product_id in self.rng.sample(
+                product_ids, min(len(product_ids), self.rng.randint(0, 5))
+            )
+        )
+        self.bulk_create(Favorite, favorites)
+
+    def chunk_prices(self, order_lines):
+        ids = {product_id for _, lines in order_lines for product_id, _ in lines}
+        products = Product.objects.filter(id__in=ids).only("id", "price", "discount")
+        return {product.id: product.final_price() for product in products}
+
+    def create_orders(self, count, user_ids, product_ids):
+        now = timezone.now()
+        totals = {"orders": 0, "items": 0, "payments": 0}
+        for numbers in chunked(range(1, count + 1), self.batch_size):
+            orders = []
+            order_lines = []
+            for n in numbers:
+                status = self.rng.choice(ORDER_STATUSES)
+                payment_method = self.rng.choice(PAYMENT_METHODS)
+                orders.append(
+                    Order(
+                        user_id=self.rng.choice(user_ids),
+                        full_name=f"Покупатель {n}",
+                        email=f"{self.prefix}-order-{n}@example.com",
+                        phone=f"+37529{n % 10000000:07d}",
+                        address=f"ул. Синтетическая, {n}, Минск",
+                        status=status,
+                        paid=status in ("shipped", "completed"),
+                    )
+                )
+                order_lines.append(
+                    (
+                        payment_method,
+                        [
+                            (product_id, self.rng.randint(1, 3))
+                            for product_id in self.rng.sample(
+                                product_ids,
+                                min(len(product_ids), self.rng.randint(1, 4)),
+                            )
+                        ],
+                    )
+                )
+
+            prices = self.chunk_prices(order_lines)
+            with transaction.atomic():
+                Order.objects.bulk_create(orders)
+                items = [
+                    OrderItem(
+                        order_id=order.id,
+                        product_id=product_id,
+                        price=prices[product_id],
+                        quantity=quantity,
+                    )
+                    for order, (_, lines) in zip(orders, order_lines)
+                    for product_id, quantity in lines
+                ]
+                OrderItem.objects.bulk_create(items)
+                payments = [
+                    Payment(
+                        order_id=order.id,
+                        amount=sum(
+                            prices[product_id] * quantity
+                            for product_id, quantity in lines
+                        ),
+                        payment_method=payment_method,
+                        status="completed",
+                        paid_at=now,
+                    )
+                    for order, (payment_method, lines) in zip(orders, order_lines)
+                    if order.paid
+                ]
+                Payment.objects.bulk_create(payments)
+
+            totals["orders"] += len(orders)
+            totals["items"] += len(items)
+            totals["payments"] += len(payments)
+
+        self.stdout.write(f"{Order._meta.verbose_name_plural}: {totals['orders']}")
+        self.stdout.write(f"{OrderItem._meta.verbose_name_plural}: {totals['items']}")
+        self.stdout.write(f"{Payment._meta.verbose_name_plural}: {totals['payments']}")
+        self.stdout.write(self.style.SUCCESS("Синтетические данные созданы"))
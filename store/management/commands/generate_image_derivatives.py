@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import django
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from store.cache import bump_catalog_version
+from store.images import generate_derivatives
+from store.models import Category, Product
+
+BACKFILL_MODELS = {"store.category": Category, "store.product": Product}
+JOBS_PER_WORKER = 4
+
+
+def process_image(job):
+    model_label, pk, name = job
+    try:
+        return model_label, pk, generate_derivatives(name), None
+    except OSError as e:
+        return model_label, pk, None, f"{name}: {e}"
+
+
+def process_in_pool(executor, jobs, limit):
+    pending = set()
+    for job in jobs:
+        pending.add(executor.submit(process_image, job))
+        if len(pending) >= limit:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+class Command(BaseCommand):
+    help = "Создаёт уменьшенные копии и WebP-версии уже загруженных изображений"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--force", action="store_true")
+
+    def iter_jobs(self, force):
+        for model_label, model in BACKFILL_MODELS.items():
+            images = (
+                model.objects.exclude(image="")
+                .exclude(image__isnull=True)
+                .only("id", "image", "image_derivatives")
+                .order_by("id")
+            )
+            for obj in images.iterator(chunk_size=2000):
+                if force or obj.image_derivatives.get("name") != obj.image.name:
+                    yield model_label, obj.pk, obj.image.name
+
+    def handle(self, *args, **options):
+        workers = max(1, options["workers"])
+        self.batch_size = options["batch_size"]
+        self.pending = {model_label: [] for model_label in BACKFILL_MODELS}
+        jobs = self.iter_jobs(options["force"])
+
+        if workers == 1:
+            processed, failed = self.save_results(map(process_image, jobs))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=django.setup
+            ) as executor:
+                processed, failed = self.save_results(
+                    process_in_pool(executor, jobs, workers * JOBS_PER_WORKER)
+                )
+
+        if processed:
+            cache.delete("all_categories")
+            bump_catalog_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Обработано изображений: {processed}, с ошибками: {failed}"
+            )
+        )
+
+    def save_results(self, results):
+        processed = 0
+        failed = 0
+        for model_label, pk, derivatives, error in results:
+            if error:
+                failed += 1
+                self.stderr.write(error)
+                continue
+            processed += 1
+            pending = self.pending[model_label]
+            pending.append(
+                BACKFILL_MODELS[model_label](pk=pk, image_derivatives=derivatives)
+            )
+            if len(pending) >= self.batch_size:
+                self.flush(model_label)
+
+        for model_label in BACKFILL_MODELS:
+            self.flush(model_label)
+        return processed, failed
+
+    def flush(self, model_label):
+        objs, self.pending[model_label] = self.pending[model_label], []
+        if objs:
+            BACKFILL_MODELS[model_label].objects.bulk_update(
+                objs, ["image_derivatives"]
+            )
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from store.catalog_import import CatalogImporter, iter_json_records, iter_jsonl_records
+
+
+class Command(BaseCommand):
+    help = "Потоково загружает бренды, категории и товары из JSON/JSONL-выгрузок"
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--no-digest", action="store_true")
+
+    def handle(self, *args, **options):
+        importer = CatalogImporter(batch_size=options["batch_size"])
+
+        for path in options["paths"]:
+            try:
+                with open(path, encoding="utf-8") as stream:
+                    if path.endswith(".jsonl"):
+                        records = iter_jsonl_records(stream)
+                    else:
+                        records = iter_json_records(stream)
+                    for record in records:
+                        importer.add(record)
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Не удалось загрузить {path}: {exc}")
+
+        counts = importer.finish(send_digest=not options["no_digest"])
+
+        for model, count in counts.items():
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Новых товаров: {importer.new_product_total}")
+        )
@@ -0,0 +1,81 @@
+from decimal import Decimal, ROUND_HALF_UP
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+from reviews.models import Review
+from store.cache import bump_catalog_version
+from store.models import Product
+
+
+def average_rating(rating_sum, review_count):
+    if not review_count:
+        return 0.0
+    average = Decimal(rating_sum) / Decimal(review_count)
+    return float(average.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP))
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает рейтинг и количество отзывов товаров по таблице отзывов"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        checked = 0
+        fixed = 0
+
+        while True:
+            products = list(
+                Product.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .only("id", "slug", "rating", "rating_sum", "review_count")[:batch_size]
+            )
+            if not products:
+                break
+            last_id = products[-1].id
+
+            totals = {
+                row["product_id"]: row
+                for row in Review.objects.filter(
+                    product_id__in=[product.id for product in products]
+                )
+                .values("product_id")
+                .annotate(rating_sum=Sum("rating"), review_count=Count("id"))
+            }
+
+            drifted = []
+            for product in products:
+                row = totals.get(product.id, {})
+                rating_sum = row.get("rating_sum", 0)
+                review_count = row.get("review_count", 0)
+                rating = average_rating(rating_sum, review_count)
+
+                if (product.rating_sum, product.review_count, product.rating) != (
+                    rating_sum,
+                    review_count,
+                    rating,
+                ):
+                    product.rating_sum = rating_sum
+                    product.review_count = review_count
+                    product.rating = rating
+                    drifted.append(product)
+
+            if drifted:
+                Product.objects.bulk_update(
+                    drifted, ["rating", "rating_sum", "review_count"]
+                )
+                cache.delete_many(
+                    [f"product_detail_{product.slug}" for product in drifted]
+                )
+
+            checked += len(products)
+            fixed += len(drifted)
+
+        if fixed:
+            bump_catalog_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Проверено товаров: {checked}, исправлено: {fixed}")
+        )
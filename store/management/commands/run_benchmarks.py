@@ -0,0 +1,117 @@
+import argparse
+import json
+import logging
+import platform
+import random
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.utils import timezone
+from orders.models import Order
+from store.benchmarks import (
+    SCENARIOS,
+    BenchmarkContext,
+    StubPayPalPayment,
+    clear_caches,
+    run_scenario,
+)
+from store.models import Product
+
+
+def current_commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("значение должно быть не меньше 1")
+    return number
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("значение не может быть отрицательным")
+    return number
+
+
+class Command(BaseCommand):
+    help = "Замеряет задержки и пропускную способность ключевых страниц магазина"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=positive_int, default=200)
+        parser.add_argument("--warmup", type=non_negative_int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", default="benchmark_results.json")
+        parser.add_argument(
+            "--scenario", action="append", choices=sorted(SCENARIOS), dest="scenarios"
+        )
+
+    def handle(self, *args, **options):
+        scenarios = options["scenarios"] or list(SCENARIOS)
+        results = {
+            "commit": current_commit(),
+            "started_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "iterations": options["iterations"],
+            "warmup": options["warmup"],
+            "seed": options["seed"],
+            "dataset": {
+                "products": Product.objects.count(),
+                "orders": Order.objects.count(),
+            },
+            "scenarios": {},
+        }
+
+        request_logger = logging.getLogger("techshop.requests")
+        log_level = request_logger.level
+        request_logger.setLevel(logging.WARNING)
+        try:
+            with (
+                override_settings(
+                    ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+                ),
+                patch("payments.views.paypalrestsdk.Payment", StubPayPalPayment),
+            ):
+                context = BenchmarkContext(Client(), random.Random(options["seed"]))
+                try:
+                    for name in scenarios:
+                        context.reset()
+                        clear_caches()
+                        results["scenarios"][name] = run_scenario(
+                            context, name, options["iterations"], options["warmup"]
+                        )
+                        self.stdout.write(
+                            f"{name}: p50={results['scenarios'][name]['p50_ms']} мс, "
+                            f"p95={results['scenarios'][name]['p95_ms']} мс, "
+                            f"p99={results['scenarios'][name]['p99_ms']} мс"
+                        )
+                finally:
+                    context.close()
+                    clear_caches()
+        finally:
+            request_logger.setLevel(log_level)
+
+        Path(options["output"]).write_text(
+            json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Результаты сохранены в {options['output']}")
+        )
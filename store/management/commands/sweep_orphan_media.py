@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from store.media_cleanup import (
+    ORPHAN_GRACE_PERIOD,
+    ORPHAN_SWEEP_CHUNK_SIZE,
+    sweep_orphan_files,
+)
+
+
+class Command(BaseCommand):
+    help = "Удаляет из MEDIA_ROOT изображения, на которые не ссылается ни одна запись"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=ORPHAN_SWEEP_CHUNK_SIZE)
+        parser.add_argument("--grace-period", type=int, default=ORPHAN_GRACE_PERIOD)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        orphans = sweep_orphan_files(
+            chunk_size=options["chunk_size"],
+            grace_period=options["grace_period"],
+            dry_run=options["dry_run"],
+        )
+        for name in orphans:
+            self.stdout.write(name)
+        action = "Найдено" if options["dry_run"] else "Удалено"
+        self.stdout.write(self.style.SUCCESS(f"{action} файлов: {len(orphans)}"))
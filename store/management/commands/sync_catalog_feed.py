@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+from store.catalog_import import CatalogFeedSync, iter_json_records, iter_jsonl_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Сверяет фид товаров поставщика с каталогом по хешу содержимого "
+        "и применяет только изменения"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--delete-missing",
+            action="store_true",
+            help="Удалить товары, которых нет в фиде (вместе с их позициями заказов)",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument("--no-digest", action="store_true")
+
+    def handle(self, *args, **options):
+        sync = CatalogFeedSync(
+            batch_size=options["batch_size"],
+            delete_missing=options["delete_missing"],
+            dry_run=options["dry_run"],
+        )
+        path = options["path"]
+
+        try:
+            with open(path, encoding="utf-8") as stream:
+                if path.endswith(".jsonl"):
+                    records = iter_jsonl_records(stream)
+                else:
+                    records = iter_json_records(stream)
+                for record in records:
+                    sync.add(record)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Не удалось прочитать фид {path}: {exc}")
+
+        changes = sync.finish(send_digest=not options["no_digest"])
+
+        if options["verbosity"] > 1:
+            for kind, slugs in changes.items():
+                for slug in slugs:
+                    self.stdout.write(f"{kind}: {slug}")
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Добавлено: {len(changes['inserted'])}, "
+                f"обновлено: {len(changes['updated'])}, "
+                f"удалено: {len(changes['deleted'])}, "
+                f"без изменений: {sync.unchanged}"
+            )
+        )
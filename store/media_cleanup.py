@@ -0,0 +1,119 @@
+import logging
+import os
+import re
+import time
+from itertools import islice
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from store.images import DERIVATIVES_DIR, delete_derivatives
+from store.models import Category, PendingFileDeletion, Product
+
+logger = logging.getLogger(__name__)
+
+FILE_CLEANUP_BATCH_SIZE = 500
+ORPHAN_SWEEP_DIRS = ("products", "category")
+ORPHAN_SWEEP_CHUNK_SIZE = 1000
+ORPHAN_GRACE_PERIOD = 60 * 60
+MEDIA_MODELS = (Product, Category)
+DERIVATIVE_SUFFIX = re.compile(r"\.\d+w\.\w+$")
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def queue_file_deletion(name):
+    if name:
+        PendingFileDeletion.objects.create(name=name)
+
+
+def referenced_names(names):
+    referenced = set()
+    for model in MEDIA_MODELS:
+        referenced.update(
+            model.objects.filter(image__in=names).values_list("image", flat=True)
+        )
+    return referenced
+
+
+def delete_media_file(name):
+    try:
+        delete_derivatives(name)
+        if default_storage.exists(name):
+            default_storage.delete(name)
+    except OSError:
+        logger.exception("Ошибка при удалении файла %s", name)
+
+
+def delete_pending_files(batch_size=FILE_CLEANUP_BATCH_SIZE):
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                PendingFileDeletion.objects.select_for_update(skip_locked=True)
+                .order_by("id")
+                .values_list("id", "name")[:batch_size]
+            )
+            if not batch:
+                return deleted
+
+            names = {name for _, name in batch}
+            for name in names - referenced_names(names):
+                delete_media_file(name)
+                deleted += 1
+            PendingFileDeletion.objects.filter(id__in=[pk for pk, _ in batch]).delete()
+
+
+def iter_media_files(directory):
+    root = os.path.join(settings.MEDIA_ROOT, directory)
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            name = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, "/")
+            yield name, path
+
+
+def is_stale(path, cutoff):
+    try:
+        return os.stat(path).st_mtime < cutoff
+    except FileNotFoundError:
+        return False
+
+
+def has_source(derivative):
+    source = DERIVATIVE_SUFFIX.sub("", derivative[len(DERIVATIVES_DIR) + 1 :])
+    return default_storage.exists(source)
+
+
+def sweep_orphan_files(
+    chunk_size=ORPHAN_SWEEP_CHUNK_SIZE,
+    grace_period=ORPHAN_GRACE_PERIOD,
+    dry_run=False,
+):
+    cutoff = time.time() - grace_period
+    orphans = []
+
+    for directory in ORPHAN_SWEEP_DIRS:
+        for chunk in chunked(iter_media_files(directory), chunk_size):
+            referenced = referenced_names([name for name, _ in chunk])
+            for name, path in chunk:
+                if name not in referenced and is_stale(path, cutoff):
+                    orphans.append(name)
+                    if not dry_run:
+                        delete_media_file(name)
+
+    for directory in ORPHAN_SWEEP_DIRS:
+        derivatives = iter_media_files(f"{DERIVATIVES_DIR}/{directory}")
+        for name, path in derivatives:
+            if is_stale(path, cutoff) and not has_source(name):
+                orphans.append(name)
+                if not dry_run:
+                    try:
+                        default_storage.delete(name)
+                    except OSError:
+                        logger.exception("Ошибка при удалении файла %s", name)
+
+    return orphans
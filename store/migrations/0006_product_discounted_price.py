@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-18 20:39
+
+import django.db.models.expressions
+import django.db.models.functions.math
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0005_product_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="discounted_price",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=django.db.models.functions.math.Round(
+                    django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("price"),
+                            "*",
+                            django.db.models.expressions.CombinedExpression(
+                                models.Value(100), "-", models.F("discount")
+                            ),
+                        ),
+                        "/",
+                        models.Value(100),
+                    ),
+                    2,
+                ),
+                output_field=models.DecimalField(decimal_places=2, max_digits=10),
+                verbose_name="Цена со скидкой",
+            ),
+        ),
+    ]
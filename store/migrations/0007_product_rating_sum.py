@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-18 20:44
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def fill_rating_sum(apps, schema_editor):
+    Product = apps.get_model("store", "Product")
+    Review = apps.get_model("reviews", "Review")
+
+    rating_sums = (
+        Review.objects.filter(product=OuterRef("pk"))
+        .values("product")
+        .annotate(total=Sum("rating"))
+        .values("total")
+    )
+    Product.objects.update(rating_sum=Coalesce(Subquery(rating_sums), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0006_product_discounted_price"),
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, verbose_name="Сумма оценок"),
+        ),
+        migrations.AlterField(
+            model_name="product",
+            name="review_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Количество отзывов"
+            ),
+        ),
+        migrations.RunPython(fill_rating_sum, migrations.RunPython.noop),
+    ]
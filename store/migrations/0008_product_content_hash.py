@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 21:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0007_product_rating_sum"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                verbose_name="Хеш содержимого",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0008_product_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["created_at", "id"], name="store_product_created_idx"
+            ),
+        ),
+    ]
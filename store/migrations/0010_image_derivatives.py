@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-18 21:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0009_product_created_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="image_derivatives",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Копии изображения",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="image_derivatives",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Копии изображения",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-18 21:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0010_image_derivatives"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingFileDeletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, verbose_name="Файл")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Добавлено"),
+                ),
+            ],
+            options={
+                "verbose_name": "Файл на удаление",
+                "verbose_name_plural": "Файлы на удаление",
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+from store.models import HASHED_PRODUCT_FIELDS, product_content_hash
+
+
+def refresh_content_hash(apps, schema_editor):
+    Product = apps.get_model("store", "Product")
+    batch = []
+    products = Product.objects.only("id", "content_hash", *HASHED_PRODUCT_FIELDS)
+    for product in products.iterator(chunk_size=2000):
+        content_hash = product_content_hash(product)
+        if product.content_hash != content_hash:
+            product.content_hash = content_hash
+            batch.append(product)
+        if len(batch) >= 2000:
+            Product.objects.bulk_update(batch, ["content_hash"])
+            batch = []
+    if batch:
+        Product.objects.bulk_update(batch, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0011_pending_file_deletion"),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_content_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def reset_image_derivatives(apps, schema_editor):
+    for model_name in ("Category", "Product"):
+        model = apps.get_model("store", model_name)
+        model.objects.exclude(image_derivatives={}).update(image_derivatives={})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0012_refresh_product_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(reset_image_derivatives, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,39 @@
+import hashlib
+import json
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Round
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from decimal import Decimal, ROUND_HALF_UP
 
+HASHED_PRODUCT_FIELDS = (
+    "name",
+    "brand_id",
+    "category_id",
+    "description",
+    "price",
+    "discount",
+    "color",
+    "image",
+)
+HASHED_PRODUCT_FIELD_NAMES = {
+    name.removesuffix("_id") for name in HASHED_PRODUCT_FIELDS
+}
+
+
+def product_content_hash(product):
+    values = []
+    for name in HASHED_PRODUCT_FIELDS:
+        value = getattr(product, name)
+        if name == "price" and value is not None:
+            value = Decimal(value).quantize(Decimal("0.01"))
+        elif name == "image":
+            value = value.name if value else ""
+        values.append("" if value is None else str(value))
+    payload = json.dumps(values, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
 
 class Category(models.Model):
     name = models.CharField(max_length=50, verbose_name="Название")
@@ -8,6 +41,9 @@ class Category(models.Model):
     image = models.ImageField(
         upload_to="category/", blank=True, null=True, verbose_name="Изображение"
     )
+    image_derivatives = models.JSONField(
+        default=dict, blank=True, editable=False, verbose_name="Копии изображения"
+    )
 
     class Meta:
         verbose_name = "Категория"
@@ -29,6 +65,13 @@ class Brand(models.Model):
         return self.name
 
 
+class ProductQuerySet(models.QuerySet):
+    def for_cards(self):
+        return self.select_related("category", "brand").defer(
+            "description", "search_vector"
+        )
+
+
 class Product(models.Model):
     COLOR_CHOICES = [
         ("black", "Черный"),
@@ -49,9 +92,17 @@ class Product(models.Model):
     description = models.TextField(blank=True, verbose_name="Описание")
     price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Цена")
     discount = models.PositiveIntegerField(default=0, verbose_name="Скидка в %")
+    discounted_price = models.GeneratedField(
+        expression=Round(F("price") * (Value(100) - F("discount")) / Value(100), 2),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        db_index=True,
+        verbose_name="Цена со скидкой",
+    )
     color = models.CharField(max_length=20, choices=COLOR_CHOICES, verbose_name="Цвет")
     rating = models.FloatField(default=0.0, verbose_name="Рейтинг")
-    review_count = models.PositiveSmallIntegerField(
+    rating_sum = models.PositiveIntegerField(default=0, verbose_name="Сумма оценок")
+    review_count = models.PositiveIntegerField(
         default=0, verbose_name="Количество отзывов"
     )
     category = models.ForeignKey(
@@ -63,12 +114,36 @@ class Product(models.Model):
     image = models.ImageField(
         upload_to="products/", blank=True, null=True, verbose_name="Изображение"
     )
+    image_derivatives = models.JSONField(
+        default=dict, blank=True, editable=False, verbose_name="Копии изображения"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Создано")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Обновлено")
+    search_vector = SearchVectorField(
+        null=True, editable=False, verbose_name="Поисковый вектор"
+    )
+    content_hash = models.CharField(
+        max_length=64, blank=True, editable=False, verbose_name="Хеш содержимого"
+    )
+
+    objects = ProductQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Продукт"
         verbose_name_plural = "Продукты"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="store_product_search_gin"),
+            models.Index(fields=["created_at", "id"], name="store_product_created_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.content_hash = product_content_hash(self)
+        elif HASHED_PRODUCT_FIELD_NAMES.intersection(update_fields):
+            self.content_hash = product_content_hash(self)
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
 
     def final_price(self):
         if self.price is None or self.discount is None:
@@ -78,3 +153,15 @@ class Product(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class PendingFileDeletion(models.Model):
+    name = models.CharField(max_length=255, verbose_name="Файл")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Добавлено")
+
+    class Meta:
+        verbose_name = "Файл на удаление"
+        verbose_name_plural = "Файлы на удаление"
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,29 @@
+import re
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, Q
+
+SEARCH_CONFIG = "russian"
+
+
+def build_prefix_query(query):
+    terms = re.findall(r"\w+", query)
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_products(products, query):
+    if connection.vendor != "postgresql":
+        return products.filter(
+            Q(name__icontains=query) | Q(description__icontains=query)
+        )
+
+    raw_query = build_prefix_query(query)
+    if not raw_query:
+        return products.none()
+
+    search_query = SearchQuery(raw_query, config=SEARCH_CONFIG, search_type="raw")
+    return (
+        products.filter(search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-rank", "-created_at")
+    )
@@ -1,9 +1,17 @@
-import os
-from django.db.models import Avg, Count
-from django.db.models.signals import post_save, post_delete
+from django.db.models import DecimalField, F, FloatField, Value
+from django.db.models.functions import Cast, Coalesce, NullIf, Round
+from django.db.models.signals import post_init, post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.conf import settings
-from store.models import Product, Category
+from django.db import transaction
+from store.models import Brand, Product, Category
+from store.cache import bump_catalog_version, expire_cached
+from store.media_cleanup import queue_file_deletion
+from store.tasks import (
+    add_product_slug_to_filter,
+    generate_image_derivatives_task,
+    schedule_file_cleanup,
+)
 from reviews.models import Review
 from newsletters.tasks import send_new_product_email_task
 from django.core.cache import cache
@@ -16,11 +24,40 @@ def trigger_product_email(sender, instance, created, **kwargs):
 
 
 def delete_file(file_field):
-    if file_field and file_field.name != "" and os.path.isfile(file_field.path):
-        try:
-            os.remove(file_field.path)
-        except Exception as e:
-            print(f"Ошибка при удалении файла: {e}")
+    if file_field and file_field.name != "":
+        queue_file_deletion(file_field.name)
+        transaction.on_commit(schedule_file_cleanup)
+
+
+def image_name(instance):
+    value = instance.__dict__.get("image")
+    return getattr(value, "name", value)
+
+
+@receiver(post_init, sender=Product)
+@receiver(post_init, sender=Category)
+def remember_loaded_image(sender, instance, **kwargs):
+    instance._loaded_image = image_name(instance)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Category)
+def schedule_image_derivatives(sender, instance, created, **kwargs):
+    name = image_name(instance)
+    previous = instance._loaded_image
+    instance._loaded_image = name
+    if not created and name == previous:
+        return
+
+    if previous and previous != name:
+        queue_file_deletion(previous)
+        transaction.on_commit(schedule_file_cleanup)
+    if name:
+        transaction.on_commit(
+            lambda: generate_image_derivatives_task.delay(
+                sender._meta.label, instance.pk
+            )
+        )
 
 
 @receiver(post_delete, sender=Product)
@@ -33,18 +70,89 @@ def delete_category_image(sender, instance, **kwargs):
     delete_file(instance.image)
 
 
-@receiver([post_save, post_delete], sender=Review)
-def update_product_rating(sender, instance, **kwargs):
-    product = instance.product
-    reviews = product.reviews.all()
-    agg = reviews.aggregate(avg=Avg("rating"), count=Count("id"))
+def apply_review_rating(review, rating_delta, count_delta):
+    rating_sum = F("rating_sum") + rating_delta
+    review_count = F("review_count") + count_delta
+    average = Cast(
+        rating_sum * Value(1.0) / NullIf(review_count, 0),
+        DecimalField(max_digits=12, decimal_places=6),
+    )
 
-    product.rating = round(agg["avg"] or 0, 1)
-    product.review_count = agg["count"]
-    product.save()
+    updated = Product.objects.filter(pk=review.product_id).update(
+        rating_sum=rating_sum,
+        review_count=review_count,
+        rating=Coalesce(Round(average, 1), 0, output_field=FloatField()),
+    )
+    if updated:
+        slug = (
+            Product.objects.filter(pk=review.product_id)
+            .values_list("slug", flat=True)
+            .first()
+        )
+        expire_cached(f"product_detail_{slug}")
 
 
-@receiver([post_save, post_delete], sender=Product)
+@receiver(pre_save, sender=Review)
+def remember_previous_rating(sender, instance, **kwargs):
+    instance._previous_rating = None
+    if not instance._state.adding:
+        instance._previous_rating = (
+            Review.objects.filter(pk=instance.pk)
+            .values_list("rating", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Review)
+def update_product_rating(sender, instance, created, **kwargs):
+    if created:
+        apply_review_rating(instance, instance.rating, 1)
+    elif instance._previous_rating not in (None, instance.rating):
+        apply_review_rating(instance, instance.rating - instance._previous_rating, 0)
+
+
+@receiver(post_delete, sender=Review)
+def remove_product_rating(sender, instance, **kwargs):
+    apply_review_rating(instance, -instance.rating, -1)
+
+
+@receiver(post_init, sender=Product)
+def remember_loaded_slug(sender, instance, **kwargs):
+    instance._loaded_slug = instance.__dict__.get("slug")
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_slug_filter(sender, instance, created, **kwargs):
+    if created or instance.slug != instance._loaded_slug:
+        slug = instance.slug
+        transaction.on_commit(lambda: add_product_slug_to_filter(slug))
+    instance._loaded_slug = instance.slug
+
+
+@receiver(post_save, sender=Product)
+def expire_product_cache(sender, instance, **kwargs):
+    expire_cached(f"product_detail_{instance.slug}")
+    expire_cached(f"related_products_{instance.category_id}")
+
+
+@receiver(post_delete, sender=Product)
 def clear_product_cache(sender, instance, **kwargs):
-    cache_key = f"product_detail_{instance.slug}"
-    cache.delete(cache_key)
+    cache.delete(f"product_detail_{instance.slug}")
+    expire_cached(f"related_products_{instance.category_id}")
+
+
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=Brand)
+def invalidate_catalog_cache(sender, instance, **kwargs):
+    bump_catalog_version()
+
+
+@receiver([post_save, post_delete], sender=Brand)
+def invalidate_brand_cache(sender, instance, **kwargs):
+    expire_cached("all_brands")
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_cache(sender, instance, **kwargs):
+    expire_cached("all_categories")
+    bump_catalog_version()
@@ -0,0 +1,202 @@
+import hashlib
+import math
+import time
+import uuid
+from datetime import timedelta
+from django.core.cache import cache, caches
+from django.utils import timezone
+from django_redis import get_redis_connection
+from store.models import Product
+
+SLUG_FILTER_META_KEY = "product_slug_filter_meta"
+SLUG_FILTER_BITS_KEY = "product_slug_filter_bits"
+SLUG_FILTER_GENERATION_KEY = "product_slug_filter_generation"
+SLUG_FILTER_ERROR_RATE = 0.01
+SLUG_FILTER_MIN_CAPACITY = 1000
+SLUG_FILTER_RECENT_WINDOW = 60 * 5
+SLUG_FILTER_RETIRED_TIMEOUT = 60
+
+
+def filter_dimensions(capacity, error_rate=SLUG_FILTER_ERROR_RATE):
+    capacity = max(capacity, 1)
+    size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+    hash_count = max(1, round(size / capacity * math.log(2)))
+    return size, hash_count
+
+
+def slug_positions(value, size, hash_count):
+    digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+    first = int.from_bytes(digest[:8], "little")
+    second = int.from_bytes(digest[8:], "little") | 1
+    return [(first + i * second) % size for i in range(hash_count)]
+
+
+def bit_is_set(data, position):
+    index = position >> 3
+    return index < len(data) and bool(data[index] & (0x80 >> (position & 7)))
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=SLUG_FILTER_ERROR_RATE):
+        self.size, self.hash_count = filter_dimensions(capacity, error_rate)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, value):
+        return slug_positions(value, self.size, self.hash_count)
+
+    def add(self, value):
+        for position in self.positions(value):
+            self.bits[position >> 3] |= 0x80 >> (position & 7)
+
+    def __contains__(self, value):
+        return all(
+            bit_is_set(self.bits, position) for position in self.positions(value)
+        )
+
+
+class CacheBitmap:
+    def __init__(self, key):
+        self.key = key
+
+    def get_bits(self, positions):
+        data = cache.get(self.key) or b""
+        return [bit_is_set(data, position) for position in positions]
+
+    def set_bits(self, positions):
+        data = bytearray(cache.get(self.key) or b"")
+        for position in positions:
+            index = position >> 3
+            if index >= len(data):
+                data.extend(bytes(index + 1 - len(data)))
+            data[index] |= 0x80 >> (position & 7)
+        cache.set(self.key, bytes(data), None)
+
+    def store(self, data):
+        cache.set(self.key, bytes(data), None)
+
+    def retire(self):
+        cache.touch(self.key, SLUG_FILTER_RETIRED_TIMEOUT)
+
+
+class RedisBitmap:
+    def __init__(self, key):
+        self.client = get_redis_connection("default")
+        self.key = cache.make_key(key)
+
+    def get_bits(self, positions):
+        pipeline = self.client.pipeline(transaction=False)
+        for position in positions:
+            pipeline.getbit(self.key, position)
+        return pipeline.execute()
+
+    def set_bits(self, positions):
+        pipeline = self.client.pipeline(transaction=False)
+        for position in positions:
+            pipeline.setbit(self.key, position, 1)
+        pipeline.execute()
+
+    def store(self, data):
+        self.client.set(self.key, bytes(data))
+
+    def retire(self):
+        self.client.expire(self.key, SLUG_FILTER_RETIRED_TIMEOUT)
+
+
+def get_bitmap(token):
+    key = f"{SLUG_FILTER_BITS_KEY}:{token}"
+    if type(caches["default"]).__module__.startswith("django_redis"):
+        return RedisBitmap(key)
+    return CacheBitmap(key)
+
+
+class SharedSlugFilter:
+    def __init__(self, token, size, hash_count):
+        self.bitmap = get_bitmap(token)
+        self.size = size
+        self.hash_count = hash_count
+
+    def add(self, *slugs):
+        self.bitmap.set_bits(
+            [
+                position
+                for slug in slugs
+                for position in slug_positions(slug, self.size, self.hash_count)
+            ]
+        )
+
+    def __contains__(self, slug):
+        return all(
+            self.bitmap.get_bits(slug_positions(slug, self.size, self.hash_count))
+        )
+
+
+def build_product_slug_filter():
+    slug_filter = BloomFilter(max(Product.objects.count(), SLUG_FILTER_MIN_CAPACITY))
+    for slug in Product.objects.values_list("slug", flat=True).iterator(
+        chunk_size=5000
+    ):
+        slug_filter.add(slug)
+    return slug_filter
+
+
+def get_slug_filter_generation():
+    generation = cache.get(SLUG_FILTER_GENERATION_KEY)
+    if generation is None:
+        cache.add(SLUG_FILTER_GENERATION_KEY, time.time_ns(), None)
+        generation = cache.get(SLUG_FILTER_GENERATION_KEY)
+    return generation
+
+
+def bump_slug_filter_generation():
+    try:
+        cache.incr(SLUG_FILTER_GENERATION_KEY)
+    except ValueError:
+        cache.set(SLUG_FILTER_GENERATION_KEY, time.time_ns(), None)
+
+
+def get_product_slug_filter():
+    meta = cache.get(SLUG_FILTER_META_KEY)
+    if meta is None:
+        return None
+    return SharedSlugFilter(*meta)
+
+
+def add_product_slugs(slugs):
+    slug_filter = get_product_slug_filter()
+    if slug_filter is None:
+        return False
+    slug_filter.add(*slugs)
+    return True
+
+
+def retire_slug_filter(meta):
+    if meta is not None:
+        get_bitmap(meta[0]).retire()
+
+
+def drop_product_slug_filter():
+    bump_slug_filter_generation()
+    meta = cache.get(SLUG_FILTER_META_KEY)
+    cache.delete(SLUG_FILTER_META_KEY)
+    retire_slug_filter(meta)
+
+
+def rebuild_product_slug_filter():
+    generation = get_slug_filter_generation()
+    started_at = timezone.now()
+    slug_filter = build_product_slug_filter()
+    if cache.get(SLUG_FILTER_GENERATION_KEY) != generation:
+        return False
+
+    token = uuid.uuid4().hex
+    get_bitmap(token).store(slug_filter.bits)
+    previous = cache.get(SLUG_FILTER_META_KEY)
+    meta = (token, slug_filter.size, slug_filter.hash_count)
+    cache.set(SLUG_FILTER_META_KEY, meta, None)
+    retire_slug_filter(previous)
+
+    recent = Product.objects.filter(
+        updated_at__gte=started_at - timedelta(seconds=SLUG_FILTER_RECENT_WINDOW)
+    ).values_list("slug", flat=True)
+    SharedSlugFilter(*meta).add(*recent)
+    return True
@@ -1,6 +1,4 @@
 document.addEventListener('DOMContentLoaded', () => {
-  window.ProductInteractions.updateCartCount();
-
   document.querySelectorAll('.remove-from-cart-btn').forEach(button => {
     button.addEventListener('click', e => {
       e.preventDefault();
@@ -1,14 +1,16 @@
 document.addEventListener('DOMContentLoaded', () => {
-  function fetchFilteredProducts(newPage = null) {
+  function fetchFilteredProducts(pageParams = null) {
     const form = document.getElementById('filter-form');
     if (!form) return;
 
     const params = new URLSearchParams(new FormData(form));
 
-    if (newPage !== null) {
-      params.set('page', newPage);
-    } else {
-      params.delete('page');
+    params.delete('page');
+    params.delete('cursor');
+    if (pageParams !== null) {
+      for (const [key, value] of pageParams) {
+        params.set(key, value);
+      }
     }
 
     fetch(`/products/ajax/?${params.toString()}`, {
@@ -27,6 +29,10 @@ document.addEventListener('DOMContentLoaded', () => {
           pagination.innerHTML = data.pagination_html;
         }
 
+        if (data.facets) {
+          updateFacetCounts(data.facets);
+        }
+
         // Важно: повторная инициализация кнопок
         window.ProductInteractions.initCartButtons();
         window.ProductInteractions.initWishlistButtons();
@@ -41,6 +47,18 @@ document.addEventListener('DOMContentLoaded', () => {
       });
   }
 
+  function updateFacetCounts(facets) {
+    document.querySelectorAll('[data-facet]').forEach((el) => {
+      const counts = facets[el.dataset.facet] || {};
+      const count = counts[el.dataset.value] || 0;
+      el.textContent = `(${count})`;
+      const input = el.closest('.input-checkbox')?.querySelector('input');
+      if (input) {
+        input.disabled = !count && !input.checked;
+      }
+    });
+  }
+
   const filterForm = document.getElementById('filter-form');
   if (filterForm) {
     filterForm.addEventListener('input', () => fetchFilteredProducts());
@@ -54,6 +72,15 @@ document.addEventListener('DOMContentLoaded', () => {
     });
   }
 
+  document.querySelectorAll('.price-bucket').forEach((link) => {
+    link.addEventListener('click', (e) => {
+      e.preventDefault();
+      document.getElementById('price-min').value = link.dataset.min;
+      document.getElementById('price-max').value = link.dataset.max;
+      fetchFilteredProducts();
+    });
+  });
+
   // пагинация
   document.addEventListener('click', (e) => {
     const target = e.target.closest('.store-pagination a');
@@ -61,7 +88,9 @@ document.addEventListener('DOMContentLoaded', () => {
 
     e.preventDefault();
     const url = new URL(target.href);
-    const page = url.searchParams.get('page');
-    fetchFilteredProducts(page);
+    const pageParams = ['page', 'cursor']
+      .filter((key) => url.searchParams.has(key))
+      .map((key) => [key, url.searchParams.get(key)]);
+    fetchFilteredProducts(pageParams);
   });
 });
@@ -8,8 +8,6 @@ window.ProductInteractions = {
 
     this.initCartButtons();
     this.initWishlistButtons();
-    this.updateCartCount();
-    this.updateFavoriteCount();
   },
 
   initCartButtons() {
@@ -100,22 +98,28 @@ window.ProductInteractions = {
       });
   },
 
-  updateCartCount() {
-    fetch('/cart/count/')
+  updateCounters() {
+    fetch('/auth/counters/')
       .then((res) => res.json())
       .then((data) => {
-        const el = document.getElementById('cart-qty');
-        if (el) el.textContent = data.count;
+        const counters = {
+          'cart-qty': data.cart,
+          'favorite-count': data.favorites,
+          'order-count': data.orders,
+        };
+        Object.entries(counters).forEach(([id, value]) => {
+          const el = document.getElementById(id);
+          if (el) el.textContent = value;
+        });
       });
   },
 
+  updateCartCount() {
+    this.updateCounters();
+  },
+
   updateFavoriteCount() {
-    fetch('/favorite/count/')
-      .then((res) => res.json())
-      .then((data) => {
-        const el = document.getElementById('favorite-count');
-        if (el) el.textContent = data.count;
-      });
+    this.updateCounters();
   },
 
   showToast(message, type = 'info') {
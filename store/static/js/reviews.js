@@ -0,0 +1,21 @@
+document.addEventListener('DOMContentLoaded', function () {
+  const list = document.getElementById('review-list');
+
+  if (list) {
+    list.addEventListener('click', function (e) {
+      const button = e.target.closest('.reviews-more-btn');
+      if (!button) return;
+
+      button.disabled = true;
+      fetch(button.dataset.url)
+        .then((res) => res.text())
+        .then((html) => {
+          button.closest('.reviews-more').remove();
+          list.insertAdjacentHTML('beforeend', html);
+        })
+        .catch(() => {
+          button.disabled = false;
+        });
+    });
+  }
+});
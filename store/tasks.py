@@ -0,0 +1,97 @@
+import logging
+from celery import shared_task
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from store.cache import bump_catalog_version, expire_cached
+from store.images import generate_derivatives
+from store.media_cleanup import delete_pending_files, sweep_orphan_files
+from store.models import Product
+from store.slug_filter import (
+    add_product_slugs,
+    drop_product_slug_filter,
+    rebuild_product_slug_filter,
+)
+
+logger = logging.getLogger(__name__)
+
+FILE_CLEANUP_SCHEDULED_KEY = "file_cleanup_scheduled"
+FILE_CLEANUP_SCHEDULE_TIMEOUT = 60
+SLUG_FILTER_REBUILD_SCHEDULED_KEY = "product_slug_filter_rebuild_scheduled"
+SLUG_FILTER_REBUILD_SCHEDULE_TIMEOUT = 60
+
+
+def save_image_derivatives(model, pk, derivatives):
+    updated = model.objects.filter(pk=pk, image=derivatives["name"]).update(
+        image_derivatives=derivatives
+    )
+    if not updated:
+        return False
+
+    if model is Product:
+        product = Product.objects.only("slug", "category_id").get(pk=pk)
+        expire_cached(f"product_detail_{product.slug}")
+        expire_cached(f"related_products_{product.category_id}")
+    else:
+        expire_cached("all_categories")
+    bump_catalog_version()
+    return True
+
+
+@shared_task
+def generate_image_derivatives_task(model_label, pk):
+    model = apps.get_model(model_label)
+    obj = model.objects.filter(pk=pk).only("image").first()
+    if obj is None or not obj.image:
+        return None
+
+    try:
+        derivatives = generate_derivatives(obj.image.name)
+    except OSError:
+        logger.exception("Ошибка при обработке изображения %s", obj.image.name)
+        return None
+
+    save_image_derivatives(model, pk, derivatives)
+    return derivatives["widths"]
+
+
+def schedule_file_cleanup():
+    if cache.add(FILE_CLEANUP_SCHEDULED_KEY, 1, FILE_CLEANUP_SCHEDULE_TIMEOUT):
+        delete_pending_files_task.delay()
+
+
+@shared_task
+def delete_pending_files_task():
+    cache.delete(FILE_CLEANUP_SCHEDULED_KEY)
+    return delete_pending_files()
+
+
+@shared_task
+def sweep_orphan_media_task():
+    return len(sweep_orphan_files())
+
+
+def schedule_slug_filter_rebuild():
+    if cache.add(
+        SLUG_FILTER_REBUILD_SCHEDULED_KEY, 1, SLUG_FILTER_REBUILD_SCHEDULE_TIMEOUT
+    ):
+        rebuild_product_slug_filter_task.delay()
+
+
+@shared_task
+def rebuild_product_slug_filter_task():
+    cache.delete(SLUG_FILTER_REBUILD_SCHEDULED_KEY)
+    return rebuild_product_slug_filter()
+
+
+def add_product_slug_to_filter(slug):
+    if not add_product_slugs([slug]):
+        schedule_slug_filter_rebuild()
+
+
+def invalidate_product_slug_filter():
+    def rebuild():
+        drop_product_slug_filter()
+        schedule_slug_filter_rebuild()
+
+    transaction.on_commit(rebuild)
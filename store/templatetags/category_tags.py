@@ -1,5 +1,5 @@
 from django import template
-from django.core.cache import cache
+from store.cache import REFERENCE_CACHE_TIMEOUT, local_cache
 from store.models import Category
 
 
@@ -8,9 +8,8 @@ register = template.Library()
 
 @register.simple_tag
 def get_all_categories():
-    categories = cache.get("all_categories")
-    if categories is None:
-        categories = list(Category.objects.all())
-        cache.set("all_categories", categories, 60 * 60)
-
-    return categories
+    return local_cache.get_or_set(
+        "all_categories",
+        lambda: list(Category.objects.all()),
+        REFERENCE_CACHE_TIMEOUT,
+    )
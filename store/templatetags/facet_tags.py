@@ -0,0 +1,11 @@
+from django import template
+
+register = template.Library()
+
+
+@register.filter
+def facet_count(counts, key):
+    try:
+        return counts.get(key, 0)
+    except AttributeError:
+        return 0
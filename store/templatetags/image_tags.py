@@ -0,0 +1,41 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from store.images import derivative_name, derivatives_for
+
+
+register = template.Library()
+
+
+def build_srcset(name, widths, extension):
+    return ", ".join(
+        f"{default_storage.url(derivative_name(name, width, extension))} {width}w"
+        for width in widths
+    )
+
+
+@register.simple_tag
+def responsive_image(obj, sizes="100vw", alt="", **attrs):
+    image = obj.image
+    widths = derivatives_for(image, obj.image_derivatives)
+    if not widths:
+        src = image.url if image else ""
+        return format_html('<img src="{}" alt="{}"{} />', src, alt, flatatt(attrs))
+
+    jpeg_srcset = build_srcset(image.name, widths, "jpg")
+    original_width = obj.image_derivatives.get("width")
+    if original_width:
+        jpeg_srcset = f"{jpeg_srcset}, {image.url} {original_width}w"
+
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}" />'
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" loading="lazy"{} /></picture>',
+        build_srcset(image.name, widths, "webp"),
+        sizes,
+        image.url,
+        jpeg_srcset,
+        sizes,
+        alt,
+        flatatt(attrs),
+    )
@@ -0,0 +1,68 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from reviews.admin import REVIEW_INLINE_LIMIT
+from reviews.models import Review
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+    create_user,
+)
+
+
+@pytest.mark.django_db
+def test_product_changelist_query_count_does_not_grow(admin_client):
+    brand = create_brand()
+    category = create_category()
+    url = reverse("admin:store_product_changelist")
+    create_product(brand=brand, category=category, name="Product0", slug="product0")
+    admin_client.get(url)
+
+    with CaptureQueriesContext(connection) as single_product:
+        admin_client.get(url)
+    for i in range(1, 10):
+        create_product(
+            brand=brand, category=category, name=f"Product{i}", slug=f"product{i}"
+        )
+    with CaptureQueriesContext(connection) as many_products:
+        response = admin_client.get(url)
+
+    assert response.status_code == 200
+    assert len(many_products) == len(single_product)
+
+
+@pytest.mark.django_db
+def test_product_change_view_limits_review_inline(admin_client):
+    product = create_product(brand=create_brand(), category=create_category())
+    for i in range(REVIEW_INLINE_LIMIT + 5):
+        user = create_user(username=f"user{i}", email=f"user{i}@example.com")
+        Review.objects.create(product=product, user=user, rating=5)
+
+    response = admin_client.get(
+        reverse("admin:store_product_change", args=[product.id])
+    )
+
+    formset = response.context["inline_admin_formsets"][0].formset
+    assert response.status_code == 200
+    assert len(formset.forms) == REVIEW_INLINE_LIMIT
+    assert f"?product__id__exact={product.id}" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_review_changelist_filters_by_product_link(admin_client):
+    brand = create_brand()
+    category = create_category()
+    product = create_product(brand=brand, category=category)
+    other = create_product(brand=brand, category=category, name="Other", slug="other")
+    user = create_user()
+    Review.objects.create(product=product, user=user, rating=4)
+    Review.objects.create(product=other, user=user, rating=2)
+
+    response = admin_client.get(
+        reverse("admin:reviews_review_changelist"), {"product__id__exact": product.id}
+    )
+
+    assert response.status_code == 200
+    assert list(response.context["cl"].result_list) == [product.reviews.get()]
@@ -0,0 +1,86 @@
+import json
+import random
+from decimal import Decimal
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from accounts.models import CustomUser
+from carts.models import CartItem
+from orders.models import Order
+from store.benchmarks import (
+    BENCHMARK_USERNAME,
+    SCENARIOS,
+    BenchmarkContext,
+    percentile,
+)
+from store.models import Product
+from techshop.tests.create_objects_for_tests import create_brand, create_category
+
+
+def test_percentile_interpolates_between_samples():
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.5
+    assert percentile(samples, 99) == pytest.approx(99.01)
+    assert percentile([3.0], 95) == 3.0
+
+
+@pytest.mark.django_db
+def test_run_benchmarks_requires_dataset(tmp_path):
+    with pytest.raises(CommandError):
+        call_command("run_benchmarks", output=str(tmp_path / "results.json"))
+
+
+@pytest.mark.parametrize("option", ["--iterations=0", "--warmup=-1"])
+def test_run_benchmarks_rejects_invalid_counts(option):
+    with pytest.raises(CommandError):
+        call_command("run_benchmarks", option)
+
+
+@pytest.mark.django_db
+def test_benchmark_context_rejects_empty_catalog(client):
+    with pytest.raises(CommandError):
+        BenchmarkContext(client, random.Random(0))
+
+
+@pytest.mark.django_db
+def test_benchmark_context_samples_sparse_product_ids(client):
+    brand = create_brand()
+    category = create_category()
+    for product_id in (1, 10**6):
+        Product.objects.create(
+            id=product_id,
+            name=f"Product {product_id}",
+            slug=f"product-{product_id}",
+            brand=brand,
+            category=category,
+            price=Decimal("100.00"),
+        )
+
+    context = BenchmarkContext(client, random.Random(0))
+
+    assert sorted(product_id for product_id, _ in context.products) == [1, 10**6]
+
+
+@pytest.mark.django_db
+def test_run_benchmarks_writes_results_and_cleans_up(tmp_path, mailoutbox):
+    call_command("generate_data", scale=0.01, seed=3)
+    users = CustomUser.objects.count()
+    cart_items = CartItem.objects.count()
+    orders = Order.objects.count()
+    output = tmp_path / "results.json"
+
+    call_command("run_benchmarks", iterations=3, warmup=1, output=str(output))
+
+    results = json.loads(output.read_text(encoding="utf-8"))
+    assert set(results["scenarios"]) == set(SCENARIOS)
+    for scenario in results["scenarios"].values():
+        assert scenario["iterations"] == 3
+        assert scenario["errors"] == 0
+        assert scenario["p50_ms"] <= scenario["p95_ms"] <= scenario["p99_ms"]
+    assert results["dataset"]["orders"] == orders
+    assert CustomUser.objects.count() == users
+    assert CartItem.objects.count() == cart_items
+    assert Order.objects.count() == orders
+    assert not CustomUser.objects.filter(username=BENCHMARK_USERNAME).exists()
+    assert not mailoutbox
@@ -0,0 +1,155 @@
+import threading
+import time
+import pytest
+from django.core.cache import cache
+from store.cache import (
+    CATALOG_VERSION_KEY,
+    TwoTierCache,
+    expire_cached,
+    get_catalog_version,
+    get_or_recompute,
+)
+from store.models import Category
+from store.templatetags.category_tags import get_all_categories
+
+
+@pytest.mark.django_db
+def test_two_tier_cache_serves_repeat_reads_from_memory(mocker):
+    tier = TwoTierCache()
+    loader = mocker.Mock(return_value=["value"])
+
+    assert tier.get_or_set("key", loader) == ["value"]
+    shared_get = mocker.spy(cache, "get")
+    assert tier.get_or_set("key", loader) == ["value"]
+
+    loader.assert_called_once()
+    shared_get.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_two_tier_cache_reads_shared_tier_before_loading(mocker):
+    get_or_recompute("key", lambda: "shared")
+    loader = mocker.Mock()
+
+    assert TwoTierCache().get_or_set("key", loader) == "shared"
+    loader.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_two_tier_cache_evicts_least_recently_used():
+    tier = TwoTierCache(max_size=2)
+    tier.get_or_set("a", lambda: 1)
+    tier.get_or_set("b", lambda: 2)
+    tier.get_or_set("a", lambda: 1)
+    tier.get_or_set("c", lambda: 3)
+
+    assert list(tier.items) == ["a", "c"]
+
+
+@pytest.mark.django_db
+def test_two_tier_cache_expires_memory_entries(mocker):
+    monotonic = mocker.patch("store.cache.time.monotonic", return_value=100.0)
+    tier = TwoTierCache(check_interval=1000, max_ttl=30)
+    tier.get_or_set("short", lambda: "old", timeout=5)
+    tier.get_or_set("long", lambda: "old", timeout=600)
+    cache.delete_many(["short", "long"])
+
+    monotonic.return_value = 106.0
+    assert tier.get_or_set("short", lambda: "new", timeout=5) == "new"
+    assert tier.get_or_set("long", lambda: "new", timeout=600) == "old"
+
+    monotonic.return_value = 131.0
+    assert tier.get_or_set("long", lambda: "new", timeout=600) == "new"
+
+
+@pytest.mark.django_db
+def test_two_tier_cache_drops_memory_when_another_worker_bumps_version():
+    tier = TwoTierCache(check_interval=0)
+    tier.get_or_set("key", lambda: "old")
+    get_catalog_version()
+    cache.incr(CATALOG_VERSION_KEY)
+    expire_cached("key")
+    get_or_recompute("key", lambda: "new")
+
+    assert tier.get_or_set("key", lambda: "loaded") == "new"
+
+
+@pytest.mark.django_db
+def test_get_all_categories_refreshes_after_category_change(
+    django_assert_num_queries,
+):
+    Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    assert [category.slug for category in get_all_categories()] == ["noutbuki"]
+
+    with django_assert_num_queries(0):
+        get_all_categories()
+
+    Category.objects.create(name="Смартфоны", slug="smartfony")
+    assert {category.slug for category in get_all_categories()} == {
+        "noutbuki",
+        "smartfony",
+    }
+
+
+def test_get_or_recompute_runs_loader_once_for_concurrent_misses():
+    calls = []
+    barrier = threading.Barrier(8)
+    results = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return "value"
+
+    def worker():
+        barrier.wait()
+        results.append(get_or_recompute("hot", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * 8
+
+
+def test_get_or_recompute_serves_stale_value_while_another_worker_recomputes(
+    mocker,
+):
+    get_or_recompute("key", lambda: "stale")
+    expire_cached("key")
+    cache.add("key:lock", 1)
+    loader = mocker.Mock()
+
+    assert get_or_recompute("key", loader) == "stale"
+    loader.assert_not_called()
+
+
+def test_get_or_recompute_refreshes_expired_value():
+    get_or_recompute("key", lambda: "stale")
+    expire_cached("key")
+
+    assert get_or_recompute("key", lambda: "fresh") == "fresh"
+    assert get_or_recompute("key", lambda: "other") == "fresh"
+    assert cache.get("key:lock") is None
+
+
+def test_get_or_recompute_recomputes_when_lock_holder_never_finishes(mocker):
+    mocker.patch("store.cache.RECOMPUTE_WAIT", 0.1)
+    cache.add("key:lock", 1)
+
+    assert get_or_recompute("key", lambda: "value") == "value"
+
+
+@pytest.mark.django_db
+def test_values_cached_before_entry_format_are_treated_as_misses():
+    category = Category.objects.create(name="Legacy", slug="legacy")
+    cache.set("all_categories", [category, category, category, category])
+    cache.set("product_detail_legacy", category)
+
+    expire_cached("product_detail_legacy")
+
+    assert get_all_categories() == [category]
+    assert cache.get("product_detail_legacy") == category
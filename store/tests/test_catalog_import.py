@@ -0,0 +1,219 @@
+import io
+import json
+import pytest
+from decimal import Decimal
+from unittest.mock import patch
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from store.cache import get_catalog_version
+from store.catalog_import import (
+    iter_json_records,
+    iter_jsonl_records,
+    product_content_hash,
+)
+from store.models import Brand, Category, Product
+
+FIXTURES = [
+    str(settings.BASE_DIR / name)
+    for name in ("brand_data.json", "category_data.json", "product_data.json")
+]
+
+
+def load_fixture_products():
+    with open(FIXTURES[2], encoding="utf-8") as stream:
+        return json.load(stream)
+
+
+def write_feed(path, records):
+    path.write_text(
+        "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+def test_iter_json_records_streams_array_in_small_reads():
+    records = [
+        {"model": "store.brand", "pk": i, "fields": {"name": "Б, [x]"}}
+        for i in range(5)
+    ]
+    stream = io.StringIO(json.dumps(records, ensure_ascii=False, indent=2))
+
+    assert list(iter_json_records(stream, read_size=7)) == records
+
+
+def test_iter_json_records_rejects_non_array():
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.StringIO('{"model": "store.brand"}')))
+
+
+def test_iter_jsonl_records_skips_blank_lines():
+    stream = io.StringIO('{"pk": 1}\n\n{"pk": 2}\n')
+
+    assert list(iter_jsonl_records(stream)) == [{"pk": 1}, {"pk": 2}]
+
+
+@pytest.mark.django_db
+def test_import_catalog_loads_fixtures_without_per_product_signals(
+    django_capture_on_commit_callbacks,
+):
+    with patch("store.signals.send_new_product_email_task.delay") as product_email:
+        with patch("store.catalog_import.send_catalog_digest_task.delay") as digest:
+            with django_capture_on_commit_callbacks(execute=True):
+                call_command("import_catalog", *FIXTURES, batch_size=3)
+
+    assert Brand.objects.count() == 8
+    assert Category.objects.count() == 4
+    assert Product.objects.count() == 8
+    assert Product.objects.get(pk=1).brand_id == 7
+    product_email.assert_not_called()
+    digest.assert_called_once()
+    assert len(digest.call_args.args[0]) == 8
+    assert digest.call_args.args[1] == 8
+
+
+@pytest.mark.django_db
+def test_import_catalog_upserts_existing_products(
+    tmp_path, django_capture_on_commit_callbacks
+):
+    call_command("import_catalog", *FIXTURES, no_digest=True)
+    product = Product.objects.get(pk=1)
+    product.rating = 4.5
+    product.save()
+    cache.set(f"product_detail_{product.slug}", "stale")
+    version = get_catalog_version()
+    dump = tmp_path / "products.jsonl"
+    dump.write_text(
+        json.dumps(
+            {
+                "model": "store.product",
+                "pk": 1,
+                "fields": {
+                    "name": "Обновленный ноутбук",
+                    "slug": product.slug,
+                    "brand": product.brand_id,
+                    "category": product.category_id,
+                    "price": "1000.00",
+                    "discount": 10,
+                    "color": "silver",
+                },
+            },
+            ensure_ascii=False,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    with patch("store.catalog_import.send_catalog_digest_task.delay") as digest:
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command("import_catalog", str(dump))
+
+    product.refresh_from_db()
+    assert Product.objects.count() == 8
+    assert product.name == "Обновленный ноутбук"
+    assert product.discounted_price == Decimal("900.00")
+    assert product.rating == 4.5
+    assert cache.get(f"product_detail_{product.slug}") is None
+    assert get_catalog_version() != version
+    digest.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_import_catalog_reports_broken_file(tmp_path):
+    dump = tmp_path / "broken.json"
+    dump.write_text('[{"model": "store.brand", "pk": 1', encoding="utf-8")
+
+    with pytest.raises(CommandError):
+        call_command("import_catalog", str(dump))
+
+
+@pytest.mark.django_db
+def test_sync_catalog_feed_applies_only_changes(tmp_path):
+    call_command("import_catalog", *FIXTURES, no_digest=True)
+    records = load_fixture_products()
+    changed, removed = records[0], records[1]
+    unchanged = Product.objects.get(slug=records[2]["fields"]["slug"])
+    for record in records:
+        cache.set(f"product_detail_{record['fields']['slug']}", "cached")
+    changed["fields"]["price"] = "1000.00"
+    new_product = {
+        "model": "store.product",
+        "fields": dict(changed["fields"], name="Новинка", slug="novinka"),
+    }
+    feed = write_feed(
+        tmp_path / "feed.jsonl",
+        [r for r in records if r is not removed] + [new_product],
+    )
+
+    with patch("store.catalog_import.send_catalog_digest_task.delay"):
+        with override_settings(MEDIA_ROOT=tmp_path):
+            call_command("sync_catalog_feed", feed, delete_missing=True, batch_size=3)
+
+    assert Product.objects.get(slug="novinka").name == "Новинка"
+    assert Product.objects.get(pk=changed["pk"]).price == Decimal("1000.00")
+    assert not Product.objects.filter(pk=removed["pk"]).exists()
+    assert Product.objects.get(pk=unchanged.pk).updated_at == unchanged.updated_at
+    assert cache.get(f"product_detail_{unchanged.slug}") == "cached"
+    assert cache.get(f"product_detail_{changed['fields']['slug']}") is None
+
+
+@pytest.mark.django_db
+def test_sync_catalog_feed_dry_run_reports_without_writing(tmp_path, capsys):
+    call_command("import_catalog", *FIXTURES, no_digest=True)
+    records = load_fixture_products()
+    records[0]["fields"]["discount"] = 25
+    feed = write_feed(tmp_path / "feed.jsonl", records[1:] + records[:1])
+
+    call_command("sync_catalog_feed", feed, dry_run=True, delete_missing=True)
+
+    assert "Добавлено: 0, обновлено: 1, удалено: 0, без изменений: 7" in (
+        capsys.readouterr().out
+    )
+    assert Product.objects.get(pk=records[0]["pk"]).discount == 0
+
+
+@pytest.mark.django_db
+def test_sync_catalog_feed_fills_missing_hash_without_rewriting(tmp_path):
+    call_command("import_catalog", *FIXTURES, no_digest=True)
+    Product.objects.update(content_hash="")
+    product = Product.objects.get(pk=1)
+
+    call_command(
+        "sync_catalog_feed",
+        write_feed(tmp_path / "feed.jsonl", load_fixture_products()),
+    )
+
+    refreshed = Product.objects.get(pk=1)
+    assert refreshed.content_hash == product_content_hash(refreshed)
+    assert refreshed.updated_at == product.updated_at
+
+
+@pytest.mark.django_db
+def test_sync_catalog_feed_restores_values_edited_outside_import(tmp_path):
+    call_command("import_catalog", *FIXTURES, no_digest=True)
+    records = load_fixture_products()
+    product = Product.objects.get(pk=records[0]["pk"])
+    product.price = Decimal("1.00")
+    product.save()
+
+    with override_settings(MEDIA_ROOT=tmp_path):
+        call_command("sync_catalog_feed", write_feed(tmp_path / "feed.jsonl", records))
+
+    refreshed = Product.objects.get(pk=product.pk)
+    assert refreshed.price == Decimal(records[0]["fields"]["price"])
+    assert refreshed.content_hash == product_content_hash(refreshed)
+
+
+@pytest.mark.django_db
+def test_product_save_keeps_content_hash_current():
+    call_command("import_catalog", *FIXTURES, no_digest=True)
+    product = Product.objects.get(pk=1)
+
+    product.discount = 40
+    product.save(update_fields=["discount"])
+
+    refreshed = Product.objects.get(pk=1)
+    assert refreshed.content_hash == product_content_hash(refreshed)
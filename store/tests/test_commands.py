@@ -0,0 +1,109 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from accounts.models import CustomUser
+from newsletters.models import Subscriber
+from orders.models import Order
+from payments.models import Payment
+from reviews.models import Review
+from store.models import Brand, Category, Product
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+    create_user,
+)
+
+
+@pytest.mark.django_db
+def test_reconcile_ratings_fixes_drift():
+    brand = create_brand()
+    category = create_category()
+    product = create_product(brand=brand, category=category)
+    empty_product = create_product(
+        brand=brand, category=category, name="Empty", slug="empty"
+    )
+    for i, rating in enumerate((5, 4, 4)):
+        user = create_user(username=f"user{i}", email=f"user{i}@example.com")
+        Review.objects.create(product=product, user=user, rating=rating)
+
+    Product.objects.filter(pk=product.pk).update(
+        rating=1.0, rating_sum=1, review_count=1
+    )
+    Product.objects.filter(pk=empty_product.pk).update(rating=3.0, review_count=2)
+
+    call_command("reconcile_ratings", batch_size=1)
+
+    product.refresh_from_db()
+    empty_product.refresh_from_db()
+    assert product.rating_sum == 13
+    assert product.review_count == 3
+    assert product.rating == 4.3
+    assert empty_product.review_count == 0
+    assert empty_product.rating == 0.0
+
+
+def _generated_snapshot():
+    return {
+        "products": list(
+            Product.objects.order_by("slug").values_list(
+                "slug", "name", "price", "discount", "color", "rating"
+            )
+        ),
+        "reviews": list(
+            Review.objects.order_by("product__slug", "user__username").values_list(
+                "product__slug", "user__username", "rating"
+            )
+        ),
+        "orders": list(
+            Order.objects.order_by("email").values_list(
+                "email", "status", "paid", "user__username"
+            )
+        ),
+    }
+
+
+@pytest.mark.django_db
+def test_generate_data_creates_consistent_dataset(mailoutbox):
+    call_command("generate_data", scale=0.01, seed=7, batch_size=4)
+
+    assert Product.objects.count() == 10
+    assert CustomUser.objects.count() == 10
+    assert Order.objects.count() == 100
+    assert Subscriber.objects.count() == 5
+    assert not Order.objects.filter(items__isnull=True).exists()
+    assert Payment.objects.count() == Order.objects.filter(paid=True).count()
+    assert not mailoutbox
+
+    for payment in Payment.objects.select_related("order"):
+        assert payment.amount == payment.order.get_total_cost()
+
+    for product in Product.objects.all():
+        ratings = list(product.reviews.values_list("rating", flat=True))
+        assert product.review_count == len(ratings)
+        assert product.rating_sum == sum(ratings)
+
+
+@pytest.mark.django_db
+def test_generate_data_is_reproducible_for_seed():
+    call_command("generate_data", scale=0.01, seed=7, batch_size=4)
+    first_run = _generated_snapshot()
+    for model in (Order, Review, Product, Brand, Category, CustomUser, Subscriber):
+        model.objects.all().delete()
+
+    call_command("generate_data", scale=0.01, seed=7, batch_size=50)
+
+    assert _generated_snapshot() == first_run
+
+
+@pytest.mark.django_db
+def test_generate_data_runs_again_with_another_seed():
+    call_command("generate_data", scale=0.01, seed=7)
+    products = Product.objects.count()
+
+    with pytest.raises(CommandError):
+        call_command("generate_data", scale=0.01, seed=7)
+    assert Product.objects.count() == products
+
+    call_command("generate_data", scale=0.01, seed=8)
+    assert Product.objects.count() == products * 2
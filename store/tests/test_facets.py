@@ -0,0 +1,90 @@
+import pytest
+from decimal import Decimal
+from django.urls import reverse
+from store.facets import compute_facets, get_price_buckets
+from store.models import Category, Brand, Product
+
+
+@pytest.fixture
+def catalog():
+    apple = Brand.objects.create(name="Apple", slug="apple")
+    samsung = Brand.objects.create(name="Samsung", slug="samsung")
+    laptops = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    phones = Category.objects.create(name="Телефоны", slug="telefony")
+
+    for name, brand, category, price, color in (
+        ("MacBook Pro", apple, laptops, "2500.00", "silver"),
+        ("MacBook Air", apple, laptops, "1500.00", "gold"),
+        ("iPhone", apple, phones, "900.00", "black"),
+        ("Galaxy Book", samsung, laptops, "1200.00", "black"),
+        ("Galaxy A06", samsung, phones, "200.00", "black"),
+    ):
+        Product.objects.create(
+            name=name,
+            slug=name.lower().replace(" ", "-"),
+            brand=brand,
+            category=category,
+            price=Decimal(price),
+            color=color,
+        )
+
+    return {"apple": apple, "samsung": samsung, "laptops": laptops, "phones": phones}
+
+
+@pytest.mark.django_db
+def test_compute_facets_without_filters(catalog, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        facets = compute_facets(Product.objects.all())
+
+    assert facets["category"] == {catalog["laptops"].id: 3, catalog["phones"].id: 2}
+    assert facets["brand"] == {catalog["apple"].id: 3, catalog["samsung"].id: 2}
+    assert facets["color"] == {"silver": 1, "gold": 1, "black": 3}
+    assert facets["price"] == {0: 1, 1: 1, 2: 2, 3: 1}
+
+
+@pytest.mark.django_db
+def test_compute_facets_excludes_own_selection(catalog):
+    facets = compute_facets(
+        Product.objects.all(),
+        category_ids=[str(catalog["laptops"].id)],
+        brand_ids=[str(catalog["samsung"].id)],
+    )
+
+    assert facets["category"] == {catalog["laptops"].id: 1, catalog["phones"].id: 1}
+    assert facets["brand"] == {catalog["apple"].id: 2, catalog["samsung"].id: 1}
+    assert facets["color"] == {"black": 1}
+    assert facets["price"] == {2: 1}
+
+
+@pytest.mark.django_db
+def test_compute_facets_price_buckets_ignore_price_filter(catalog):
+    facets = compute_facets(
+        Product.objects.all(),
+        brand_ids=[str(catalog["apple"].id)],
+        min_price="1000",
+        max_price="2000",
+    )
+
+    assert facets["price"] == {1: 1, 2: 1, 3: 1}
+    assert facets["category"] == {catalog["laptops"].id: 1}
+    assert facets["brand"] == {catalog["apple"].id: 1, catalog["samsung"].id: 1}
+    assert facets["color"] == {"gold": 1}
+
+
+def test_get_price_buckets():
+    buckets = get_price_buckets({1: 4})
+
+    assert buckets[0] == {"index": 0, "min": None, "max": 500, "count": 0}
+    assert buckets[1]["count"] == 4
+    assert buckets[-1]["max"] is None
+
+
+@pytest.mark.django_db
+def test_catalog_renders_brands_without_matches_disabled(client, catalog):
+    sony = Brand.objects.create(name="Sony", slug="sony")
+
+    response = client.get(reverse("store:products"))
+
+    html = " ".join(response.content.decode().split())
+    assert f'id="brand-{sony.id}" name="brand" value="{sony.id}" disabled' in html
+    assert f'value="{catalog["apple"].id}" disabled' not in html
@@ -0,0 +1,169 @@
+import pytest
+from io import BytesIO
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.template import Context, Template
+from PIL import Image
+from store.images import (
+    delete_derivatives,
+    derivative_name,
+    derivative_names,
+    generate_derivatives,
+)
+from store.models import Category, Product
+from store.tasks import delete_pending_files_task, generate_image_derivatives_task
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+)
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def upload_image(name, size=(1200, 800), mode="RGB"):
+    buffer = BytesIO()
+    Image.new(mode, size, "red").save(buffer, "PNG")
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def test_generate_derivatives_writes_smaller_widths_only(media_root):
+    name = upload_image("products/photo.png", size=(600, 400), mode="RGBA")
+
+    derivatives = generate_derivatives(name)
+
+    assert derivatives == {"name": name, "widths": [240, 480], "width": 600}
+    with default_storage.open(derivative_name(name, 480, "webp")) as derivative:
+        assert Image.open(derivative).size == (480, 320)
+    with default_storage.open(derivative_name(name, 240, "jpg")) as derivative:
+        assert Image.open(derivative).format == "JPEG"
+    assert not default_storage.exists(derivative_name(name, 960, "webp"))
+
+    delete_derivatives(name)
+
+    assert not any(default_storage.exists(n) for n in derivative_names(name))
+    assert default_storage.exists(name)
+
+
+def test_derivatives_of_same_stem_do_not_collide(media_root):
+    png = upload_image("products/photo.png", size=(600, 400))
+    jpg = upload_image("products/photo.jpg", size=(600, 400))
+    generate_derivatives(png)
+    generate_derivatives(jpg)
+
+    delete_derivatives(png)
+
+    assert derivative_name(png, 240, "webp") != derivative_name(jpg, 240, "webp")
+    assert all(default_storage.exists(n) for n in derivative_names(jpg)[:4])
+
+
+@pytest.mark.django_db
+def test_task_saves_derivatives_and_tag_renders_srcset(media_root):
+    product = create_product(brand=create_brand(), category=create_category())
+    name = upload_image("products/photo.png")
+    Product.objects.filter(pk=product.pk).update(image=name)
+
+    assert generate_image_derivatives_task("store.Product", product.pk) == [
+        240,
+        480,
+        960,
+    ]
+
+    product.refresh_from_db()
+    html = Template("{% load image_tags %}{% responsive_image product %}").render(
+        Context({"product": product})
+    )
+    assert 'type="image/webp"' in html
+    assert "/media/derivatives/products/photo.png.480w.webp 480w" in html
+    assert "/media/products/photo.png 1200w" in html
+
+
+@pytest.mark.django_db
+def test_task_logs_unreadable_image(media_root, caplog):
+    product = create_product(brand=create_brand(), category=create_category())
+    Product.objects.filter(pk=product.pk).update(image="products/missing.png")
+
+    assert generate_image_derivatives_task("store.Product", product.pk) is None
+
+    assert "products/missing.png" in caplog.text
+    assert caplog.records[-1].exc_info is not None
+
+
+@pytest.mark.django_db
+def test_tag_ignores_derivatives_of_replaced_image(media_root):
+    product = create_product(brand=create_brand(), category=create_category())
+    product.image = "products/new.png"
+    product.image_derivatives = {"name": "products/old.png", "widths": [240]}
+
+    html = Template("{% load image_tags %}{% responsive_image product %}").render(
+        Context({"product": product})
+    )
+
+    assert html == '<img src="/media/products/new.png" alt="" />'
+
+
+@pytest.mark.django_db
+def test_image_upload_schedules_derivatives_and_delete_cleans_them_up(
+    media_root, django_capture_on_commit_callbacks, mocker
+):
+    mocker.patch.object(
+        generate_image_derivatives_task,
+        "delay",
+        side_effect=generate_image_derivatives_task,
+    )
+    mocker.patch.object(
+        delete_pending_files_task, "delay", side_effect=delete_pending_files_task
+    )
+    brand = create_brand()
+    category = create_category()
+    buffer = BytesIO()
+    Image.new("RGB", (800, 600), "blue").save(buffer, "JPEG")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product = create_product(brand=brand, category=category)
+        product.image.save("upload.jpg", ContentFile(buffer.getvalue()))
+
+    product.refresh_from_db()
+    assert product.image_derivatives["widths"] == [240, 480]
+    derivative = derivative_name(product.image.name, 480, "webp")
+    assert default_storage.exists(derivative)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.delete()
+
+    assert not default_storage.exists(derivative)
+    assert not default_storage.exists(product.image.name)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_image_derivatives_command_backfills_existing_media(
+    media_root, workers
+):
+    brand = create_brand()
+    category = create_category()
+    for i in range(3):
+        product = create_product(
+            brand=brand, category=category, name=f"P{i}", slug=f"p{i}"
+        )
+        Product.objects.filter(pk=product.pk).update(
+            image=upload_image(f"products/p{i}.png")
+        )
+    Category.objects.filter(pk=category.pk).update(
+        image=upload_image("category/c.png", size=(300, 300))
+    )
+    create_product(brand=brand, category=category, name="Broken", slug="broken")
+    Product.objects.filter(slug="broken").update(image="products/missing.png")
+
+    call_command("generate_image_derivatives", workers=workers, batch_size=2)
+
+    for product in Product.objects.exclude(slug="broken"):
+        assert product.image_derivatives["widths"] == [240, 480, 960]
+        assert default_storage.exists(derivative_name(product.image.name, 960, "webp"))
+    assert Category.objects.get().image_derivatives["widths"] == [240]
+    assert Product.objects.get(slug="broken").image_derivatives == {}
@@ -0,0 +1,157 @@
+import os
+import time
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import transaction
+from store.images import derivative_name
+from store.media_cleanup import delete_pending_files
+from store.models import PendingFileDeletion, Product
+from store.tasks import delete_pending_files_task
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+)
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def save_file(name, age=0):
+    name = default_storage.save(name, ContentFile(b"image"))
+    if age:
+        past = time.time() - age
+        os.utime(default_storage.path(name), (past, past))
+    return name
+
+
+@pytest.fixture(autouse=True)
+def cleanup_task(mocker):
+    return mocker.patch.object(delete_pending_files_task, "delay")
+
+
+@pytest.fixture
+def catalog(db):
+    return create_brand(), create_category()
+
+
+def product_with_image(catalog, name, slug="testproduct"):
+    brand, category = catalog
+    product = create_product(brand=brand, category=category, slug=slug)
+    Product.objects.filter(pk=product.pk).update(image=name)
+    product.refresh_from_db()
+    return product
+
+
+@pytest.mark.django_db
+def test_delete_removes_file_and_derivatives_after_commit(
+    media_root, catalog, django_capture_on_commit_callbacks
+):
+    name = save_file("products/photo.png")
+    derivative = save_file(derivative_name(name, 240, "webp"))
+    product = product_with_image(catalog, name)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.delete()
+    assert default_storage.exists(name)
+
+    assert delete_pending_files() == 1
+    assert not default_storage.exists(name)
+    assert not default_storage.exists(derivative)
+    assert not PendingFileDeletion.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_delete_keeps_file(media_root, catalog):
+    name = save_file("products/photo.png")
+    product = product_with_image(catalog, name)
+    product_id = product.pk
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            product.delete()
+            raise RuntimeError
+
+    assert default_storage.exists(name)
+    assert Product.objects.filter(pk=product_id).exists()
+    assert not PendingFileDeletion.objects.exists()
+
+
+@pytest.mark.django_db
+def test_file_shared_with_another_product_is_kept(
+    media_root, catalog, django_capture_on_commit_callbacks
+):
+    name = save_file("products/shared.png")
+    product = product_with_image(catalog, name)
+    product_with_image(catalog, name, slug="other")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.delete()
+    delete_pending_files()
+
+    assert default_storage.exists(name)
+    assert not PendingFileDeletion.objects.exists()
+
+
+@pytest.mark.django_db
+def test_bulk_delete_enqueues_cleanup_once(
+    media_root, catalog, django_capture_on_commit_callbacks, cleanup_task
+):
+    for n in range(3):
+        product_with_image(catalog, save_file(f"products/{n}.png"), slug=f"product-{n}")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Product.objects.all().delete()
+
+    cleanup_task.assert_called_once_with()
+    assert PendingFileDeletion.objects.count() == 3
+
+    assert delete_pending_files_task() == 3
+    assert not PendingFileDeletion.objects.exists()
+    assert not os.listdir(media_root / "products")
+
+
+@pytest.mark.django_db
+def test_sweep_orphan_media_removes_only_old_unreferenced_files(media_root, catalog):
+    referenced = save_file("products/referenced.png", age=7200)
+    product_with_image(catalog, referenced)
+    orphan = save_file("products/orphan.png", age=7200)
+    fresh = save_file("category/fresh.png")
+    orphan_derivative = save_file(
+        derivative_name("products/gone.png", 240, "webp"), age=7200
+    )
+    kept_derivative = save_file(derivative_name(referenced, 240, "webp"), age=7200)
+
+    call_command("sweep_orphan_media", "--dry-run")
+    assert default_storage.exists(orphan)
+    assert default_storage.exists(orphan_derivative)
+
+    call_command("sweep_orphan_media")
+
+    assert not default_storage.exists(orphan)
+    assert not default_storage.exists(orphan_derivative)
+    assert default_storage.exists(referenced)
+    assert default_storage.exists(kept_derivative)
+    assert default_storage.exists(fresh)
+
+
+@pytest.mark.django_db
+def test_failed_deletion_is_logged(
+    media_root, catalog, django_capture_on_commit_callbacks, mocker, caplog
+):
+    name = save_file("products/photo.png")
+    product = product_with_image(catalog, name)
+    mocker.patch.object(default_storage, "delete", side_effect=PermissionError)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.delete()
+    delete_pending_files()
+
+    assert name in caplog.text
+    assert caplog.records[-1].exc_info is not None
+    assert not PendingFileDeletion.objects.exists()
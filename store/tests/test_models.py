@@ -87,6 +87,45 @@ def test_product_final_price_no_discount():
     assert product.final_price() == Decimal("2000.00")
 
 
+@pytest.mark.django_db
+def test_product_discounted_price_matches_final_price():
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    product = Product.objects.create(
+        name="MacBook Pro",
+        slug="macbook-pro",
+        brand=brand,
+        category=category,
+        price=Decimal("1999.99"),
+        discount=15,
+        color="silver",
+    )
+    product.refresh_from_db()
+
+    assert product.discounted_price == product.final_price()
+
+
+@pytest.mark.django_db
+def test_product_discounted_price_follows_queryset_update():
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    product = Product.objects.create(
+        name="MacBook Pro",
+        slug="macbook-pro",
+        brand=brand,
+        category=category,
+        price=Decimal("2000.00"),
+        color="silver",
+    )
+
+    Product.objects.filter(brand=brand).update(discount=25)
+    product.refresh_from_db()
+
+    assert product.discounted_price == Decimal("1500.00")
+
+
 @pytest.mark.django_db
 def test_product_color_choices():
     brand = Brand.objects.create(name="Apple", slug="apple")
@@ -0,0 +1,38 @@
+import pytest
+from decimal import Decimal
+from store.models import Category, Brand, Product
+from store.search import build_prefix_query, search_products
+
+
+def test_build_prefix_query():
+    assert build_prefix_query("Ноутбук  Lenovo") == "Ноутбук:* & Lenovo:*"
+    assert build_prefix_query("it's | 16GB!") == "it:* & s:* & 16GB:*"
+    assert build_prefix_query("&|!") == ""
+
+
+@pytest.mark.django_db
+def test_search_products_matches_name_and_description():
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    macbook = Product.objects.create(
+        name="MacBook Pro",
+        slug="macbook-pro",
+        brand=brand,
+        category=category,
+        description="Мощный ноутбук для профессионалов",
+        price=Decimal("2000.00"),
+        color="silver",
+    )
+    Product.objects.create(
+        name="iPhone",
+        slug="iphone",
+        brand=brand,
+        category=category,
+        description="Смартфон",
+        price=Decimal("1000.00"),
+        color="black",
+    )
+
+    assert list(search_products(Product.objects.all(), "macbook")) == [macbook]
+    assert list(search_products(Product.objects.all(), "ноутбук")) == [macbook]
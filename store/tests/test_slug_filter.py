@@ -0,0 +1,165 @@
+import pytest
+from django.urls import reverse
+from store.slug_filter import (
+    BloomFilter,
+    SharedSlugFilter,
+    build_product_slug_filter,
+    drop_product_slug_filter,
+    get_product_slug_filter,
+    get_slug_filter_generation,
+    rebuild_product_slug_filter,
+)
+from store.tasks import rebuild_product_slug_filter_task
+from techshop.tests.create_objects_for_tests import (
+    create_brand,
+    create_category,
+    create_product,
+)
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    slug_filter = BloomFilter(1000)
+    slugs = [f"product-{i}" for i in range(1000)]
+    for slug in slugs:
+        slug_filter.add(slug)
+
+    assert all(slug in slug_filter for slug in slugs)
+    false_positives = sum(f"missing-{i}" in slug_filter for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.django_db
+def test_unknown_slug_returns_404_without_queries(client, django_assert_num_queries):
+    create_product(brand=create_brand(), category=create_category())
+    rebuild_product_slug_filter()
+    client.get(reverse("store:detail_product", args=["testproduct"]))
+
+    with django_assert_num_queries(0):
+        response = client.get(reverse("store:detail_product", args=["no-such-slug"]))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_false_positive_slug_is_negatively_cached(
+    client, mocker, django_assert_num_queries
+):
+    create_product(brand=create_brand(), category=create_category())
+    mocker.patch.object(SharedSlugFilter, "__contains__", return_value=True)
+    url = reverse("store:detail_product", args=["no-such-slug"])
+
+    assert client.get(url).status_code == 404
+    with django_assert_num_queries(0):
+        response = client.get(url)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_missing_filter_falls_back_to_database_and_schedules_rebuild(client, mocker):
+    create_product(brand=create_brand(), category=create_category())
+    delay = mocker.patch.object(rebuild_product_slug_filter_task, "delay")
+    build = mocker.patch(
+        "store.slug_filter.build_product_slug_filter",
+        wraps=build_product_slug_filter,
+    )
+
+    found = client.get(reverse("store:detail_product", args=["testproduct"]))
+    missing = client.get(reverse("store:detail_product", args=["no-such-slug"]))
+
+    assert found.status_code == 200
+    assert missing.status_code == 404
+    assert get_product_slug_filter() is None
+    delay.assert_called_once_with()
+    build.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_new_product_is_added_to_existing_filter_after_commit(
+    client, mocker, django_capture_on_commit_callbacks
+):
+    brand = create_brand()
+    category = create_category()
+    rebuild_product_slug_filter()
+    assert "testproduct" not in get_product_slug_filter()
+    build = mocker.patch("store.slug_filter.build_product_slug_filter")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_product(brand=brand, category=category)
+
+    assert "testproduct" in get_product_slug_filter()
+    build.assert_not_called()
+    response = client.get(reverse("store:detail_product", args=["testproduct"]))
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_renamed_product_is_added_to_slug_filter(django_capture_on_commit_callbacks):
+    product = create_product(brand=create_brand(), category=create_category())
+    rebuild_product_slug_filter()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.slug = "renamed"
+        product.save()
+
+    assert "renamed" in get_product_slug_filter()
+
+
+@pytest.mark.django_db
+def test_new_product_without_filter_triggers_rebuild(
+    django_capture_on_commit_callbacks, mocker
+):
+    mocker.patch.object(
+        rebuild_product_slug_filter_task,
+        "delay",
+        side_effect=rebuild_product_slug_filter_task,
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        create_product(brand=create_brand(), category=create_category())
+
+    assert "testproduct" in get_product_slug_filter()
+
+
+@pytest.mark.django_db
+def test_rebuild_is_discarded_when_filter_changed_during_scan(mocker):
+    create_product(brand=create_brand(), category=create_category())
+
+    def scan():
+        slug_filter = build_product_slug_filter()
+        drop_product_slug_filter()
+        return slug_filter
+
+    mocker.patch("store.slug_filter.build_product_slug_filter", side_effect=scan)
+
+    assert rebuild_product_slug_filter() is False
+    assert get_product_slug_filter() is None
+
+
+@pytest.mark.django_db
+def test_product_saved_during_scan_is_added_after_rebuild(mocker):
+    brand = create_brand()
+    category = create_category()
+
+    def scan():
+        slug_filter = build_product_slug_filter()
+        create_product(brand=brand, category=category)
+        return slug_filter
+
+    mocker.patch("store.slug_filter.build_product_slug_filter", side_effect=scan)
+
+    assert rebuild_product_slug_filter() is True
+    assert "testproduct" in get_product_slug_filter()
+
+
+@pytest.mark.django_db
+def test_adding_slug_keeps_filter_generation(django_capture_on_commit_callbacks):
+    brand = create_brand()
+    category = create_category()
+    rebuild_product_slug_filter()
+    generation = get_slug_filter_generation()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_product(brand=brand, category=category)
+
+    assert get_slug_filter_generation() == generation
+    assert "testproduct" in get_product_slug_filter()
@@ -0,0 +1,104 @@
+import pytest
+from decimal import Decimal
+from django.test import RequestFactory
+from store.models import Category, Brand, Product
+from store.utils import (
+    EstimatedCountPaginator,
+    decode_cursor,
+    encode_cursor,
+    paginate_keyset,
+    paginate_products,
+)
+
+
+def create_products(count):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    for i in range(count):
+        Product.objects.create(
+            name=f"Product {i}",
+            slug=f"product-{i}",
+            brand=brand,
+            category=category,
+            price=Decimal("1000.00"),
+            color="silver",
+        )
+
+    return list(Product.objects.order_by("-created_at", "-id"))
+
+
+def get_page(cursor=None, per_page=3, **kwargs):
+    params = {"cursor": cursor} if cursor else {}
+    request = RequestFactory().get("/products/", params)
+    return paginate_keyset(request, Product.objects.all(), per_page=per_page, **kwargs)
+
+
+@pytest.mark.django_db
+def test_cursor_round_trip():
+    product = create_products(1)[0]
+
+    direction, created_at, pk = decode_cursor(encode_cursor(product, "next"))
+
+    assert direction == "next"
+    assert created_at == product.created_at
+    assert pk == product.pk
+
+
+@pytest.mark.parametrize("token", ["", "garbage", "W10", "WyJ4IiwgIjEiLCAxXQ"])
+def test_decode_cursor_invalid_token(token):
+    assert decode_cursor(token) is None
+
+
+@pytest.mark.django_db
+def test_paginate_keyset_walks_forward_and_back():
+    products = create_products(7)
+
+    first = get_page()
+    second = get_page(first.next_cursor)
+    third = get_page(second.next_cursor)
+
+    assert list(first) == products[:3]
+    assert list(second) == products[3:6]
+    assert list(third) == products[6:]
+    assert not first.has_previous() and first.has_next()
+    assert second.has_previous() and second.has_next()
+    assert third.has_previous() and not third.has_next()
+
+    back = get_page(third.previous_cursor)
+    assert list(back) == products[3:6]
+    assert back.has_previous() and back.has_next()
+
+    back = get_page(back.previous_cursor)
+    assert list(back) == products[:3]
+    assert not back.has_previous() and back.has_next()
+
+
+@pytest.mark.django_db
+def test_paginate_keyset_invalid_cursor_returns_first_page():
+    products = create_products(4)
+
+    page = get_page("not-a-cursor")
+
+    assert list(page) == products[:3]
+
+
+@pytest.mark.django_db
+def test_paginate_keyset_estimated_count():
+    create_products(4)
+
+    assert get_page().count is None
+    assert get_page(estimate=True).count == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [{"sort": "price_asc"}, {"q": "Product"}])
+def test_paginate_products_offset_path_uses_estimated_count(params):
+    create_products(4)
+    request = RequestFactory().get("/products/", params)
+
+    products = Product.objects.order_by("id")
+    page = paginate_products(request, products, params.get("q", ""), 3)
+
+    assert isinstance(page.paginator, EstimatedCountPaginator)
+    assert page.paginator.count == 4
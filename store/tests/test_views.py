@@ -1,7 +1,12 @@
 import pytest
 from decimal import Decimal
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from store.models import Category, Brand, Product
+from accounts.models import CustomUser
+from favorites.models import Favorite
+from reviews.models import Review
 
 
 @pytest.mark.django_db
@@ -136,7 +141,7 @@ def test_detail_product_view(client):
     assert "product" in response.context
     assert response.context["product"] == product
     assert "related_products" in response.context
-    assert "reviews" in response.context
+    assert "reviews_page" in response.context
     assert "form" in response.context
 
 
@@ -258,3 +263,305 @@ def test_product_filter_ajax_view_error_handling(client):
 
     assert response.status_code == 500
     assert "error" in response.json()
+
+
+@pytest.mark.django_db
+def test_products_all_view_loads_favorites_once(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    user = CustomUser.objects.create_user(username="user", password="pass12345")
+
+    for i in range(8):
+        product = Product.objects.create(
+            name=f"Product {i}",
+            slug=f"product-{i}",
+            brand=brand,
+            category=category,
+            price=Decimal("1000.00"),
+            color="silver",
+        )
+        if i % 2:
+            Favorite.objects.create(user=user, product=product)
+
+    client.force_login(user)
+    client.get(reverse("favorites:count"))
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("store:products"))
+
+    favorite_queries = [
+        query for query in ctx.captured_queries if "favorites_favorite" in query["sql"]
+    ]
+    assert response.status_code == 200
+    assert len(favorite_queries) == 1
+    assert response.content.decode().count("fa fa-heart text-danger") == 4
+
+
+@pytest.mark.django_db
+def test_products_all_view_cursor_pagination(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    for i in range(14):
+        Product.objects.create(
+            name=f"Product {i}",
+            slug=f"product-{i}",
+            brand=brand,
+            category=category,
+            price=Decimal("1000.00"),
+            color="silver",
+        )
+
+    url = reverse("store:products")
+    first_page = client.get(url).context["page_obj"]
+    response = client.get(url, {"cursor": first_page.next_cursor})
+
+    assert response.status_code == 200
+    assert len(first_page) == 12
+    assert len(response.context["products"]) == 2
+    assert not set(response.context["products"]) & set(first_page)
+
+
+@pytest.mark.django_db
+def test_product_filter_ajax_view_returns_facets(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    for name, color in (("MacBook Pro", "silver"), ("MacBook Air", "gold")):
+        Product.objects.create(
+            name=name,
+            slug=name.lower().replace(" ", "-"),
+            brand=brand,
+            category=category,
+            price=Decimal("1500.00"),
+            color=color,
+        )
+
+    url = reverse("store:product_filter_ajax")
+    response = client.get(url, {"color": "gold"})
+
+    facets = response.json()["facets"]
+    assert response.status_code == 200
+    assert facets["color"] == {"silver": 1, "gold": 1}
+    assert facets["brand"] == {str(brand.id): 1}
+    assert "MacBook Air" in response.json()["products_html"]
+    assert "MacBook Pro" not in response.json()["products_html"]
+
+
+@pytest.mark.django_db
+def test_product_filter_ajax_view_filters_and_sorts_by_discounted_price(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+
+    for name, price, discount in (
+        ("MacBook Pro", "2000.00", 50),
+        ("MacBook Air", "1500.00", 0),
+        ("iMac", "2000.00", 10),
+    ):
+        Product.objects.create(
+            name=name,
+            slug=name.lower().replace(" ", "-"),
+            brand=brand,
+            category=category,
+            price=Decimal(price),
+            discount=discount,
+            color="silver",
+        )
+
+    url = reverse("store:product_filter_ajax")
+    response = client.get(
+        url, {"min_price": "1000", "max_price": "1700", "sort": "price_desc"}
+    )
+
+    html = response.json()["products_html"]
+    assert response.status_code == 200
+    assert "iMac" not in html
+    assert html.index("MacBook Air") < html.index("MacBook Pro")
+
+
+@pytest.mark.django_db
+def test_products_all_view_serves_anonymous_grid_from_cache(
+    client, django_assert_num_queries
+):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    Product.objects.create(
+        name="MacBook Pro",
+        slug="macbook-pro",
+        brand=brand,
+        category=category,
+        price=Decimal("2000.00"),
+        color="silver",
+    )
+
+    url = reverse("store:products")
+    client.get(url, {"category": category.id})
+
+    with django_assert_num_queries(0):
+        response = client.get(url, {"category": category.id})
+
+    assert response.status_code == 200
+    assert "MacBook Pro" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_product_save_invalidates_cached_grid(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    product = Product.objects.create(
+        name="MacBook Pro",
+        slug="macbook-pro",
+        brand=brand,
+        category=category,
+        price=Decimal("2000.00"),
+        color="silver",
+    )
+
+    url = reverse("store:product_filter_ajax")
+    client.get(url)
+
+    product.name = "MacBook Air"
+    product.save()
+    response = client.get(url)
+
+    assert "MacBook Air" in response.json()["products_html"]
+
+
+def _create_laptops(brand, category, start, stop):
+    for i in range(start, stop):
+        Product.objects.create(
+            name=f"Laptop {i}",
+            slug=f"laptop-{i}",
+            brand=brand,
+            category=category,
+            price=Decimal("1000.00"),
+            color="silver",
+        )
+
+
+def _count_queries(client, url, params=None):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url, params or {})
+    assert response.status_code == 200
+    return ctx.captured_queries
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name", ["store:index", "store:products", "store:product_filter_ajax"]
+)
+def test_listing_query_count_does_not_grow_with_page_size(client, url_name):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    user = CustomUser.objects.create_user(username="user", password="pass12345")
+    client.force_login(user)
+    url = reverse(url_name)
+
+    _create_laptops(brand, category, 0, 1)
+    client.get(url)
+    small_page = _count_queries(client, url)
+
+    _create_laptops(brand, category, 1, 12)
+    full_page = _count_queries(client, url)
+
+    assert len(full_page) == len(small_page)
+
+
+@pytest.mark.django_db
+def test_products_all_view_loads_cards_without_heavy_columns(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    user = CustomUser.objects.create_user(username="user", password="pass12345")
+    client.force_login(user)
+    _create_laptops(brand, category, 0, 3)
+
+    queries = _count_queries(client, reverse("store:products"))
+
+    product_queries = [
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith('SELECT "store_product"."id"')
+    ]
+    assert len(product_queries) == 1
+    assert '"store_category"' in product_queries[0]
+    assert '"store_brand"' in product_queries[0]
+    assert '"store_product"."description"' not in product_queries[0]
+
+
+def create_reviewed_product(review_count):
+    brand = Brand.objects.create(name=f"Brand {review_count}", slug=f"b{review_count}")
+    category = Category.objects.create(
+        name=f"Category {review_count}", slug=f"c{review_count}"
+    )
+    product = Product.objects.create(
+        name=f"Product {review_count}",
+        slug=f"product-{review_count}",
+        brand=brand,
+        category=category,
+        price=Decimal("1000.00"),
+        color="silver",
+    )
+    users = CustomUser.objects.bulk_create(
+        [
+            CustomUser(username=f"reviewer-{review_count}-{i}")
+            for i in range(review_count)
+        ]
+    )
+    Review.objects.bulk_create(
+        [Review(product=product, user=user, rating=5) for user in users]
+    )
+    return product
+
+
+@pytest.mark.django_db
+def test_detail_product_query_count_does_not_grow_with_reviews(client):
+    counts = []
+    products = {count: create_reviewed_product(count) for count in (5, 60)}
+    for review_count, product in products.items():
+        url = reverse("store:detail_product", args=[product.slug])
+        client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        assert response.status_code == 200
+        assert len(response.context["reviews_page"]) == min(review_count, 10)
+        counts.append(len(ctx.captured_queries))
+
+    assert counts[0] == counts[1]
+
+
+@pytest.mark.django_db
+def test_detail_product_serves_related_products_from_cache(client):
+    brand = Brand.objects.create(name="Apple", slug="apple")
+    category = Category.objects.create(name="Ноутбуки", slug="noutbuki")
+    products = [
+        Product.objects.create(
+            name=f"Product {i}",
+            slug=f"product-{i}",
+            brand=brand,
+            category=category,
+            price=Decimal("1000.00"),
+            color="silver",
+        )
+        for i in range(6)
+    ]
+    url = reverse("store:detail_product", args=[products[0].slug])
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+
+    related = response.context["related_products"]
+    assert len(related) == 4
+    assert products[0] not in related
+    assert not [q for q in ctx.captured_queries if "store_product" in q["sql"]]
+
+    Product.objects.create(
+        name="Newest",
+        slug="newest",
+        brand=brand,
+        category=category,
+        price=Decimal("1000.00"),
+        color="silver",
+    )
+    response = client.get(url)
+
+    assert response.context["related_products"][0].slug == "newest"
@@ -1,8 +1,21 @@
+import base64
+import json
+from datetime import datetime
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import connection
+from django.db.models import Q
+from django.utils.functional import cached_property
 
-def paginatore_objects(request, objects, per_page=3):
+ESTIMATED_COUNT_THRESHOLD = 10000
+PRODUCT_SORT_ORDERINGS = {
+    "price_asc": ("discounted_price", "id"),
+    "price_desc": ("-discounted_price", "-id"),
+}
+
+
+def paginatore_objects(request, objects, per_page=3, paginator_class=Paginator):
     page_number = request.GET.get("page")
-    paginator = Paginator(objects, per_page)
+    paginator = paginator_class(objects, per_page)
 
     try:
         page_obj = paginator.page(page_number)
@@ -11,4 +24,112 @@ def paginatore_objects(request, objects, per_page=3):
     except EmptyPage:
         page_obj = paginator.page(paginator.num_pages)
 
-    return page_obj
\ No newline at end of file
+    return page_obj
+
+
+def estimate_count(queryset):
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    plan = json.loads(queryset.explain(format="json"))
+    if isinstance(plan, list):
+        plan = plan[0]
+    return int(plan["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        if connection.vendor != "postgresql":
+            return super().count
+        estimate = estimate_count(self.object_list)
+        if estimate < ESTIMATED_COUNT_THRESHOLD:
+            return self.object_list.count()
+        return estimate
+
+
+def encode_cursor(obj, direction):
+    payload = json.dumps([direction, obj.created_at.isoformat(), obj.pk])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        direction, created_at, pk = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, TypeError):
+        return None
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(self, object_list, has_next, has_previous, count=None):
+        self.object_list = object_list
+        self._has_next = has_next and bool(object_list)
+        self._has_previous = has_previous and bool(object_list)
+        self.count = count
+        self.next_cursor = (
+            encode_cursor(object_list[-1], "next") if self._has_next else None
+        )
+        self.previous_cursor = (
+            encode_cursor(object_list[0], "prev") if self._has_previous else None
+        )
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+
+def paginate_keyset(request, objects, per_page=12, estimate=False):
+    objects = objects.order_by("-created_at", "-id")
+    count = estimate_count(objects) if estimate else None
+    cursor = decode_cursor(request.GET.get("cursor", ""))
+
+    if cursor is None:
+        rows = list(objects[: per_page + 1])
+        return KeysetPage(rows[:per_page], len(rows) > per_page, False, count)
+
+    direction, created_at, pk = cursor
+    if direction == "next":
+        rows = list(
+            objects.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )[: per_page + 1]
+        )
+        return KeysetPage(rows[:per_page], len(rows) > per_page, True, count)
+
+    rows = list(
+        objects.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        ).order_by("created_at", "id")[: per_page + 1]
+    )
+    object_list = rows[:per_page][::-1]
+    return KeysetPage(object_list, True, len(rows) > per_page, count)
+
+
+def paginate_products(request, products, query="", per_page=12):
+    sort = request.GET.get("sort", "")
+    if sort in PRODUCT_SORT_ORDERINGS:
+        products = products.order_by(*PRODUCT_SORT_ORDERINGS[sort])
+        return paginatore_objects(
+            request, products, per_page, paginator_class=EstimatedCountPaginator
+        )
+
+    if query:
+        return paginatore_objects(
+            request, products, per_page, paginator_class=EstimatedCountPaginator
+        )
+
+    return paginate_keyset(request, products, per_page=per_page)
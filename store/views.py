@@ -1,112 +1,191 @@
 from django.shortcuts import render, redirect
-from django.db.models import Q
 from django.template.loader import render_to_string
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
+from django.utils.safestring import mark_safe
 from reviews.models import Review
 from store.models import Brand, Product
-from store.utils import paginatore_objects
+from store.utils import paginate_products
+from store.cache import (
+    REFERENCE_CACHE_TIMEOUT,
+    catalog_cache_key,
+    get_catalog_version,
+    get_or_recompute,
+    local_cache,
+)
+from store.search import search_products
+from store.slug_filter import get_product_slug_filter
+from store.tasks import schedule_slug_filter_rebuild
+from store.facets import compute_facets, get_price_buckets
+from favorites.utils import get_favorite_product_ids
 from reviews.forms import ReviewForm
-from django.core.cache import cache
+from reviews.views import paginate_reviews
 
 
 def index(request):
-    products = Product.objects.all().order_by("-created_at")[:5]
-    context = {"new_products": products}
+    products = Product.objects.for_cards().order_by("-created_at")[:5]
+    context = {
+        "new_products": products,
+        "catalog_version": get_catalog_version(),
+    }
     return render(request, "store/index.html", context)
 
 
-def products_all(request):
-    products = Product.objects.all().order_by("-created_at")
-    brands = Brand.objects.all()
+def catalog_context(request):
+    products = Product.objects.for_cards().order_by("-created_at")
+    brands = local_cache.get_or_set(
+        "all_brands", lambda: list(Brand.objects.all()), REFERENCE_CACHE_TIMEOUT
+    )
 
     selected_category_ids = request.GET.getlist("category")
-    if selected_category_ids:
-        products = products.filter(category_id__in=selected_category_ids)
-
     query = request.GET.get("q", "")
     if query:
-        products = products.filter(
-            Q(name__icontains=query) | Q(description__icontains=query)
-        )
+        products = search_products(products, query)
 
-    page_obj = paginatore_objects(request, products, per_page=12)
+    facets = compute_facets(products, category_ids=selected_category_ids)
 
-    context = {
+    if selected_category_ids:
+        products = products.filter(category_id__in=selected_category_ids)
+
+    page_obj = paginate_products(request, products, query)
+
+    return {
         "products": page_obj.object_list,
         "page_obj": page_obj,
         "brands": brands,
+        "colors": Product.COLOR_CHOICES,
+        "facets": facets,
+        "price_buckets": get_price_buckets(facets["price"]),
         "selected_category_ids": selected_category_ids,
+        "selected_sort": request.GET.get("sort", ""),
         "query": query,
     }
+
+
+def products_all(request):
+    if request.user.is_authenticated:
+        return render(request, "store/store.html", catalog_context(request))
+
+    catalog_html = get_or_recompute(
+        catalog_cache_key("products_all", request.GET),
+        lambda: render_to_string(
+            "store/components/_catalog.html", catalog_context(request), request=request
+        ),
+    )
+    context = {"catalog_html": mark_safe(catalog_html)}
     return render(request, "store/store.html", context)
 
 
-def product_filter_ajax(request):
-    try:
-        products = Product.objects.all().order_by("-created_at")
+def product_filter_payload(request):
+    products = Product.objects.for_cards().order_by("-created_at")
 
-        category_ids = request.GET.getlist("category")
-        brands_ids = request.GET.getlist("brand")
-        price_min = request.GET.get("min_price")
-        price_max = request.GET.get("max_price")
-        query = request.GET.get("q", "").strip()
+    category_ids = request.GET.getlist("category")
+    brands_ids = request.GET.getlist("brand")
+    colors = request.GET.getlist("color")
+    price_min = request.GET.get("min_price")
+    price_max = request.GET.get("max_price")
+    query = request.GET.get("q", "").strip()
 
-        if category_ids:
-            products = products.filter(category_id__in=category_ids)
+    if query:
+        products = search_products(products, query)
 
-        if brands_ids:
-            products = products.filter(brand_id__in=brands_ids)
+    facets = compute_facets(
+        products,
+        category_ids=category_ids,
+        brand_ids=brands_ids,
+        colors=colors,
+        min_price=price_min,
+        max_price=price_max,
+    )
 
-        if price_min:
-            products = products.filter(price__gte=price_min)
+    if price_min:
+        products = products.filter(discounted_price__gte=price_min)
 
-        if price_max:
-            products = products.filter(price__lte=price_max)
+    if price_max:
+        products = products.filter(discounted_price__lte=price_max)
 
-        if query:
-            products = products.filter(
-                Q(name__icontains=query) | Q(description__icontains=query)
-            )
+    if category_ids:
+        products = products.filter(category_id__in=category_ids)
 
-        page_obj = paginatore_objects(request, products, per_page=12)
+    if brands_ids:
+        products = products.filter(brand_id__in=brands_ids)
 
-        context = {
-            "products": page_obj.object_list,
-            "page_obj": page_obj,
-            "request": request,
-            "query": query,
-        }
+    if colors:
+        products = products.filter(color__in=colors)
 
-        html_products = render_to_string("store/components/_product_list.html", context)
-        html_pagination = render_to_string("store/components/_pagination.html", context)
+    page_obj = paginate_products(request, products, query)
+
+    context = {
+        "products": page_obj.object_list,
+        "page_obj": page_obj,
+        "request": request,
+        "query": query,
+    }
+
+    html_products = render_to_string("store/components/_product_list.html", context)
+    html_pagination = render_to_string("store/components/_pagination.html", context)
+
+    return {
+        "products_html": html_products,
+        "pagination_html": html_pagination,
+        "facets": facets,
+    }
 
-        return JsonResponse(
-            {
-                "products_html": html_products,
-                "pagination_html": html_pagination,
-            }
-        )
+
+def product_filter_ajax(request):
+    try:
+        if request.user.is_authenticated:
+            payload = product_filter_payload(request)
+        else:
+            payload = get_or_recompute(
+                catalog_cache_key("product_filter_ajax", request.GET),
+                lambda: product_filter_payload(request),
+            )
+
+        return JsonResponse(payload)
 
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
 
+def get_related_products(product, limit=4):
+    candidates = local_cache.get_or_set(
+        f"related_products_{product.category_id}",
+        lambda: list(
+            Product.objects.for_cards()
+            .filter(category_id=product.category_id)
+            .order_by("-created_at", "-id")[: limit + 1]
+        ),
+    )
+    return [related for related in candidates if related.id != product.id][:limit]
+
+
 def detail_product(request, product_slug):
-    cache_key = f"product_detail_{product_slug}"
-    product = cache.get(cache_key)
+    slug_filter = get_product_slug_filter()
+    if slug_filter is None:
+        schedule_slug_filter_rebuild()
+    elif product_slug not in slug_filter:
+        raise Http404("Товар не найден")
+
+    product = local_cache.get_or_set(
+        f"product_detail_{product_slug}",
+        lambda: Product.objects.select_related("category", "brand")
+        .filter(slug=product_slug)
+        .first()
+        or False,
+    )
     if not product:
-        product = Product.objects.get(slug=product_slug)
-        cache.set(cache_key, product, 60 * 10)
-    related_products = Product.objects.filter(category__name=product.category).exclude(
-        name=product.name
-    )[:4]
+        raise Http404("Товар не найден")
+
+    related_products = get_related_products(product)
     form = ReviewForm(user=request.user, product=product)
-    reviews = Review.objects.filter(product=product).order_by("-created_at")
+    reviews_page = paginate_reviews(request, Review.objects.filter(product=product))
+    is_favorite = product.id in get_favorite_product_ids(request.user)
 
     context = {
         "product": product,
+        "is_favorite": is_favorite,
         "related_products": related_products,
-        "reviews": reviews,
+        "reviews_page": reviews_page,
         "form": form,
     }
 
@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+SENDFILE_BACKENDS = ("nginx", "apache")
+
+
+@register(Tags.security, deploy=True)
+def check_media_sendfile_backend(app_configs, **kwargs):
+    if settings.DEBUG or settings.MEDIA_SENDFILE_BACKEND in SENDFILE_BACKENDS:
+        return []
+    return [
+        Error(
+            "MEDIA_SENDFILE_BACKEND должен быть nginx или apache, "
+            "когда DEBUG выключен",
+            hint="Без него медиафайлы отдаются через процессы Django.",
+            id="techshop.E001",
+        )
+    ]
@@ -0,0 +1,169 @@
+import json
+import logging
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.template.backends.django import Template
+
+logger = logging.getLogger("techshop.requests")
+
+INSTRUMENTED_CACHE_METHODS = (
+    "get",
+    "get_many",
+    "set",
+    "set_many",
+    "add",
+    "delete",
+    "delete_many",
+    "incr",
+    "touch",
+    "has_key",
+)
+
+_current_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.cache_calls = 0
+        self.cache_time = 0.0
+        self.template_time = 0.0
+        self.total_time = 0.0
+        self.template_depth = 0
+
+    def as_dict(self):
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db_time * 1000, 2),
+            "cache_calls": self.cache_calls,
+            "cache_ms": round(self.cache_time * 1000, 2),
+            "template_ms": round(self.template_time * 1000, 2),
+            "total_ms": round(self.total_time * 1000, 2),
+        }
+
+    def server_timing(self):
+        return ", ".join(
+            [
+                f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+                f'cache;dur={self.cache_time * 1000:.2f};desc="{self.cache_calls} calls"',
+                f"tpl;dur={self.template_time * 1000:.2f}",
+                f"total;dur={self.total_time * 1000:.2f}",
+            ]
+        )
+
+
+def get_current_metrics():
+    return _current_metrics.get()
+
+
+def _query_wrapper(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def _wrap_cache_method(method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return method(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.cache_calls += 1
+            metrics.cache_time += time.perf_counter() - started
+
+    return wrapper
+
+
+def _instrument_caches():
+    for cache in caches.all(initialized_only=False):
+        if getattr(cache, "_request_metrics_installed", False):
+            continue
+        for name in INSTRUMENTED_CACHE_METHODS:
+            setattr(cache, name, _wrap_cache_method(getattr(cache, name)))
+        cache._request_metrics_installed = True
+
+
+def _instrument_templates():
+    if getattr(Template.render, "_request_metrics_installed", False):
+        return
+    render = Template.render
+
+    @wraps(render)
+    def timed_render(self, *args, **kwargs):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return render(self, *args, **kwargs)
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            metrics.template_depth -= 1
+            if not metrics.template_depth:
+                metrics.template_time += time.perf_counter() - started
+
+    timed_render._request_metrics_installed = True
+    Template.render = timed_render
+
+
+def exposes_server_timing(request):
+    if settings.DEBUG or settings.SERVER_TIMING_HEADER:
+        return True
+    user = getattr(request, "user", None)
+    return user is not None and user.is_staff
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        _instrument_templates()
+
+    def __call__(self, request):
+        _instrument_caches()
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_query_wrapper))
+                response = self.get_response(request)
+        finally:
+            metrics.total_time = time.perf_counter() - started
+            _current_metrics.reset(token)
+
+        if exposes_server_timing(request):
+            response["Server-Timing"] = metrics.server_timing()
+        response.request_metrics = metrics
+        resolver_match = getattr(request, "resolver_match", None)
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request_metrics",
+                    "method": request.method,
+                    "path": request.path,
+                    "view": resolver_match.view_name if resolver_match else None,
+                    "status": response.status_code,
+                    **metrics.as_dict(),
+                },
+                ensure_ascii=False,
+            )
+        )
+        return response
@@ -0,0 +1,80 @@
+import mimetypes
+import os
+import posixpath
+from urllib.parse import quote
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils.module_loading import import_string
+from django.views.decorators.http import require_safe
+
+SENDFILE_HEADERS = {
+    "nginx": "X-Accel-Redirect",
+    "apache": "X-Sendfile",
+}
+
+
+def media_file_response(request, path, max_age=None, public=False):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat = os.stat(full_path)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404("Файл не найден")
+    if not os.path.isfile(full_path):
+        raise Http404("Файл не найден")
+
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = int(stat.st_mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    if response is None:
+        backend = settings.MEDIA_SENDFILE_BACKEND
+        content_type, encoding = mimetypes.guess_type(full_path)
+        content_type = content_type or "application/octet-stream"
+        if backend == "nginx":
+            response = HttpResponse(content_type=content_type)
+            response[SENDFILE_HEADERS[backend]] = (
+                settings.MEDIA_ACCEL_PREFIX.rstrip("/") + "/" + quote(path)
+            )
+        elif backend == "apache":
+            response = HttpResponse(content_type=content_type)
+            response[SENDFILE_HEADERS[backend]] = full_path
+        elif settings.DEBUG:
+            response = FileResponse(open(full_path, "rb"))
+        else:
+            raise ImproperlyConfigured(
+                "MEDIA_SENDFILE_BACKEND должен быть nginx или apache, "
+                "когда DEBUG выключен"
+            )
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    if max_age is None:
+        max_age = settings.MEDIA_CACHE_MAX_AGE
+    if public:
+        patch_cache_control(response, public=True, max_age=max_age)
+    else:
+        patch_cache_control(response, private=True, max_age=max_age)
+    return response
+
+
+def staff_media_access(request, path):
+    return request.user.is_staff
+
+
+def is_public_media(path):
+    return posixpath.normpath(path).startswith(tuple(settings.MEDIA_PUBLIC_PREFIXES))
+
+
+@require_safe
+def serve_media(request, path):
+    if is_public_media(path):
+        return media_file_response(request, path, public=True)
+    if not import_string(settings.MEDIA_ACCESS_CHECK)(request, path):
+        raise Http404("Файл не найден")
+    return media_file_response(request, path)
@@ -1,5 +1,6 @@
 from pathlib import Path
 import environ
+from celery.schedules import crontab
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -22,6 +23,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "store.apps.StoreConfig",
     "accounts.apps.AccountsConfig",
     "favorites.apps.FavoritesConfig",
@@ -33,6 +35,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "techshop.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -54,7 +57,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
-                "orders.context_processors.user_orders_count",
+                "accounts.context_processors.user_counters",
             ],
         },
     },
@@ -101,6 +104,11 @@ STATICFILES_DIRS = [BASE_DIR / "store/static"]
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+MEDIA_SENDFILE_BACKEND = env("MEDIA_SENDFILE_BACKEND", default="")
+MEDIA_ACCEL_PREFIX = env("MEDIA_ACCEL_PREFIX", default="/protected-media/")
+MEDIA_CACHE_MAX_AGE = env.int("MEDIA_CACHE_MAX_AGE", default=60 * 60 * 24)
+MEDIA_PUBLIC_PREFIXES = ("products/", "category/", "derivatives/")
+MEDIA_ACCESS_CHECK = "techshop.media.staff_media_access"
 
 AUTH_USER_MODEL = "accounts.CustomUser"
 
@@ -124,6 +132,16 @@ CELERY_BROKER_URL = env("CELERY_BROKER_URL")
 CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
+CELERY_BEAT_SCHEDULE = {
+    "delete-pending-files": {
+        "task": "store.tasks.delete_pending_files_task",
+        "schedule": 60.0,
+    },
+    "sweep-orphan-media": {
+        "task": "store.tasks.sweep_orphan_media_task",
+        "schedule": crontab(hour=4, minute=0),
+    },
+}
 
 PAYPAL_CLIENT_ID = env("PAYPAL_CLIENT_ID")
 PAYPAL_CLIENT_SECRET = env("PAYPAL_CLIENT_SECRET")
@@ -140,3 +158,20 @@ CACHES = {
         },
     }
 }
+
+SERVER_TIMING_HEADER = env.bool("SERVER_TIMING_HEADER", default=False)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "techshop.requests": {
+            "handlers": ["console"],
+            "level": env("REQUEST_METRICS_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
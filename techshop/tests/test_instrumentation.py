@@ -0,0 +1,146 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from django.urls import reverse
+from carts.models import CartItem
+from favorites.models import Favorite
+from orders.models import Order, OrderItem
+from store.models import Product
+from techshop.tests.create_objects_for_tests import (
+    create_user,
+    create_brand,
+    create_category,
+    create_product,
+)
+from techshop.tests.view_budgets import assert_within_budget
+
+
+@pytest.fixture
+def shopper(client):
+    user = create_user()
+    brand = create_brand()
+    category = create_category()
+    order = Order.objects.create(
+        user=user,
+        full_name="Иван Иванов",
+        email="ivan@example.com",
+        phone="+375291234567",
+        address="ул. Тестовая, 1, Минск",
+    )
+    for i in range(12):
+        product = create_product(
+            brand=brand, category=category, name=f"Product{i}", slug=f"product{i}"
+        )
+        Favorite.objects.create(user=user, product=product)
+        CartItem.objects.create(user=user, product=product, quantity=2)
+        OrderItem.objects.create(
+            order=order, product=product, price=product.price, quantity=2
+        )
+    Product.objects.update(image="products/test.jpg")
+    client.force_login(user)
+    return order
+
+
+@pytest.mark.django_db
+def test_response_exposes_server_timing(client, settings):
+    settings.SERVER_TIMING_HEADER = True
+    response = client.get(reverse("store:index"))
+
+    assert response.status_code == 200
+    timing = response["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert f'desc="{response.request_metrics.queries} queries"' in timing
+    assert "cache;dur=" in timing
+    assert "tpl;dur=" in timing
+    assert "total;dur=" in timing
+
+
+@pytest.mark.django_db
+def test_server_timing_is_hidden_from_visitors(client, settings):
+    settings.DEBUG = False
+    settings.SERVER_TIMING_HEADER = False
+    response = client.get(reverse("store:index"))
+
+    assert "Server-Timing" not in response
+    assert response.request_metrics.queries > 0
+
+    user = create_user()
+    user.is_staff = True
+    user.save()
+    client.force_login(user)
+    assert "Server-Timing" in client.get(reverse("store:index"))
+
+
+@pytest.mark.django_db
+def test_request_metrics_are_logged_as_json(client):
+    with patch("techshop.instrumentation.logger") as logger:
+        response = client.get(reverse("store:products"))
+
+    record = json.loads(logger.info.call_args.args[0])
+    assert record["event"] == "request_metrics"
+    assert record["view"] == "store:products"
+    assert record["status"] == 200
+    assert record["queries"] == response.request_metrics.queries
+    assert record["cache_calls"] == response.request_metrics.cache_calls
+    assert record["template_ms"] > 0
+
+
+@pytest.mark.django_db
+def test_assert_within_budget_fails_when_view_exceeds_budget(client):
+    response = client.get(reverse("store:index"))
+
+    with pytest.raises(pytest.fail.Exception, match="store:index"):
+        assert_within_budget(response, budget=response.request_metrics.queries - 1)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, with_order",
+    [
+        ("store:index", False),
+        ("store:products", False),
+        ("store:product_filter_ajax", False),
+        ("cart:cart", False),
+        ("cart:cart_count", False),
+        ("favorites:list", False),
+        ("favorites:count", False),
+        ("accounts:counters", False),
+        ("orders:order_create", False),
+        ("orders:user_orders", False),
+        ("orders:user_order_detail", True),
+    ],
+)
+def test_views_stay_within_query_budget(client, shopper, url_name, with_order):
+    url = reverse(url_name, args=[shopper.id] if with_order else [])
+    client.get(url)
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert_within_budget(response)
+
+
+@pytest.mark.django_db
+def test_detail_product_stays_within_query_budget(client, shopper):
+    url = reverse("store:detail_product", args=["product0"])
+    client.get(url)
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert_within_budget(response)
+
+
+@pytest.mark.django_db
+def test_start_payment_stays_within_query_budget(client, shopper):
+    paypal_payment = MagicMock(id="PAY-1")
+    paypal_payment.create.return_value = True
+    paypal_payment.links = [MagicMock(method="REDIRECT", href="https://paypal.test")]
+
+    with patch("payments.views.paypalrestsdk.Payment", return_value=paypal_payment):
+        response = client.get(
+            reverse("payments:start_payment", kwargs={"order_id": shopper.id})
+        )
+
+    assert response.status_code == 302
+    assert_within_budget(response)
@@ -0,0 +1,171 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.management.base import SystemCheckError
+from django.urls import reverse
+from django.utils.http import http_date
+from techshop.tests.create_objects_for_tests import create_user
+
+
+@pytest.fixture
+def media_file(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    (tmp_path / "media" / "products").mkdir(parents=True)
+    path = tmp_path / "media" / "products" / "photo 1.png"
+    path.write_bytes(b"png-bytes")
+    return path
+
+
+@pytest.mark.django_db
+def test_serve_media_streams_file_in_python_fallback(client, settings, media_file):
+    settings.DEBUG = True
+    settings.MEDIA_SENDFILE_BACKEND = ""
+
+    response = client.get(reverse("media", args=["products/photo 1.png"]))
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert b"".join(response.streaming_content) == b"png-bytes"
+    assert response["Content-Type"] == "image/png"
+    assert response["ETag"].startswith('"')
+    assert response["Last-Modified"] == http_date(int(media_file.stat().st_mtime))
+    assert "max-age=86400" in response["Cache-Control"]
+    assert "public" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_serve_media_answers_conditional_requests_with_304(
+    client, settings, media_file
+):
+    settings.MEDIA_SENDFILE_BACKEND = "nginx"
+    url = reverse("media", args=["products/photo 1.png"])
+    etag = client.get(url)["ETag"]
+
+    by_etag = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    by_date = client.get(
+        url, HTTP_IF_MODIFIED_SINCE=http_date(int(media_file.stat().st_mtime))
+    )
+
+    assert by_etag.status_code == 304
+    assert by_date.status_code == 304
+    assert by_etag["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_serve_media_hands_transfer_to_nginx(client, settings, media_file):
+    settings.MEDIA_SENDFILE_BACKEND = "nginx"
+
+    response = client.get(reverse("media", args=["products/photo 1.png"]))
+
+    assert response.status_code == 200
+    assert not response.streaming
+    assert response.content == b""
+    assert response["X-Accel-Redirect"] == "/protected-media/products/photo%201.png"
+    assert response["Content-Type"] == "image/png"
+
+
+@pytest.mark.django_db
+def test_serve_media_hands_transfer_to_apache(client, settings, media_file):
+    settings.MEDIA_SENDFILE_BACKEND = "apache"
+
+    response = client.get(reverse("media", args=["products/photo 1.png"]))
+
+    assert response["X-Sendfile"] == str(media_file)
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", ["products/missing.png", "products", "../secret.txt"])
+def test_serve_media_returns_404_for_missing_or_outside_files(client, media_file, path):
+    (media_file.parents[2] / "secret.txt").write_text("secret")
+
+    response = client.get(f"/media/{path}")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_serve_media_rejects_unsafe_methods(client, media_file):
+    response = client.post(reverse("media", args=["products/photo 1.png"]))
+
+    assert response.status_code == 405
+
+
+@pytest.mark.django_db
+def test_serve_media_refuses_python_fallback_without_debug(
+    client, settings, media_file
+):
+    settings.DEBUG = False
+    settings.MEDIA_SENDFILE_BACKEND = ""
+
+    with pytest.raises(ImproperlyConfigured):
+        client.get(reverse("media", args=["products/photo 1.png"]))
+
+
+@pytest.mark.django_db
+def test_serve_media_sends_unknown_types_as_octet_stream(client, settings, media_file):
+    settings.MEDIA_SENDFILE_BACKEND = "nginx"
+    (media_file.parent / "archive.unknownext").write_bytes(b"data")
+
+    response = client.get(reverse("media", args=["products/archive.unknownext"]))
+
+    assert response["Content-Type"] == "application/octet-stream"
+
+
+def test_deploy_check_requires_sendfile_backend_without_debug(settings):
+    settings.DEBUG = False
+    settings.MEDIA_SENDFILE_BACKEND = ""
+
+    with pytest.raises(SystemCheckError, match="techshop.E001"):
+        call_command("check", deploy=True, tags=["security"])
+
+    settings.MEDIA_SENDFILE_BACKEND = "nginx"
+    call_command("check", deploy=True, tags=["security"])
+
+
+@pytest.fixture
+def private_file(settings, media_file):
+    settings.MEDIA_SENDFILE_BACKEND = "nginx"
+    (media_file.parents[1] / "invoices").mkdir()
+    path = media_file.parents[1] / "invoices" / "invoice.pdf"
+    path.write_bytes(b"pdf")
+    return path
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "path", ["invoices/invoice.pdf", "products/../invoices/invoice.pdf"]
+)
+def test_serve_media_hides_private_files_from_anonymous_users(
+    client, private_file, path
+):
+    response = client.get(f"/media/{path}")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_serve_media_marks_private_files_as_private(client, private_file):
+    user = create_user()
+    user.is_staff = True
+    user.save()
+    client.force_login(user)
+
+    response = client.get(reverse("media", args=["invoices/invoice.pdf"]))
+
+    assert response.status_code == 200
+    assert "private" in response["Cache-Control"]
+    assert "public" not in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_serve_media_uses_configured_access_check(client, settings, private_file):
+    settings.MEDIA_ACCESS_CHECK = "techshop.tests.test_media.allow_all"
+
+    response = client.get(reverse("media", args=["invoices/invoice.pdf"]))
+
+    assert response.status_code == 200
+
+
+def allow_all(request, path):
+    return True
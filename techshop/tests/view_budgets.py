@@ -0,0 +1,31 @@
+import pytest
+
+VIEW_QUERY_BUDGETS = {
+    "store:index": 6,
+    "store:products": 8,
+    "store:product_filter_ajax": 6,
+    "store:detail_product": 10,
+    "cart:cart": 6,
+    "cart:cart_count": 2,
+    "favorite:list": 6,
+    "favorite:count": 2,
+    "auth:counters": 2,
+    "orders:order_create": 6,
+    "orders:user_orders": 5,
+    "orders:user_order_detail": 6,
+    "payments:start_payment": 8,
+    "reviews:review_list": 2,
+}
+
+
+def assert_within_budget(response, budget=None):
+    view_name = response.resolver_match.view_name
+    if budget is None:
+        budget = VIEW_QUERY_BUDGETS[view_name]
+    metrics = response.request_metrics
+    if metrics.queries > budget:
+        pytest.fail(
+            f"{view_name} выполнил {metrics.queries} SQL-запросов "
+            f"при бюджете {budget}: {metrics.as_dict()}"
+        )
+    return metrics